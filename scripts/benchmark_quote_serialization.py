@@ -0,0 +1,127 @@
+"""
+관리자 견적 목록(/quote/admin) 응답 직렬화 벤치마크입니다.
+
+QuoteService._build_quotes_page가 만드는 것과 같은 모양의 dict 목록을 만들어 아래 방식을 비교합니다.
+
+- pydantic: response_model 경로. list[GetQuotesResponse]로 검증한 뒤 JSON 호환 값으로 덤프하고 json.dumps로 렌더링
+- pydantic_dump_json: 같은 검증 뒤 Pydantic(pydantic-core)의 dump_json으로 바로 직렬화
+- orjson: 앱의 ORJSONResponse.render로 dict를 한 번에 직렬화 (현재 /quote/admin 경로)
+
+    PYTHONPATH=src poetry run python scripts/benchmark_quote_serialization.py --quotes 1000 --cargo 3
+"""
+
+import argparse
+import timeit
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Callable, Dict, List
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.core.responses import ORJSONResponse
+from app.model._enum import OrderStatusEnum
+from app.schema.quote.response import GetQuotesResponse
+
+QUOTE_LIST_ADAPTER = TypeAdapter(List[GetQuotesResponse])
+
+
+def build_items(quote_count: int, cargo_count: int) -> List[Dict]:
+    """DB 프로젝션 행과 같은 타입(Decimal, datetime, Enum)으로 목록 항목을 만듭니다."""
+    created_at = datetime(2024, 10, 22, 10, 0)
+    items = []
+    for index in range(quote_count):
+        location = {
+            "state": "TX",
+            "county": "Dallas County",
+            "city": "Addison",
+            "zip_code": "75001",
+            "address": "4550 Belt Line Rd",
+            "request_datetime": created_at + timedelta(days=1),
+        }
+        items.append(
+            {
+                "id": f"Q{index:08d}",
+                "user_id": index % 100 + 1,
+                "cargo_transportation_id": 1,
+                "is_priority": index % 2 == 0,
+                "total_weight": Decimal("1200.500"),
+                "base_price": Decimal("405.125"),
+                "extra_price": Decimal("75.000"),
+                "total_price": Decimal("480.125"),
+                "order_status": OrderStatusEnum.SUBMIT,
+                "order_primary": None,
+                "order_additional_request": "Call before delivery",
+                "created_at": created_at - timedelta(minutes=index),
+                "from_location": {"id": index * 2 + 1, **location},
+                "to_location": {"id": index * 2 + 2, **location},
+                "cargo": [
+                    {
+                        "id": index * cargo_count + cargo_index + 1,
+                        "width": 40,
+                        "length": 48,
+                        "height": 40,
+                        "weight": 400,
+                        "quantity": 1,
+                        "package_description": "Pallet",
+                        "cargo_stackable": False,
+                        "cargo_temperature": "room",
+                        "is_hazardous": False,
+                        "hazardous_detail": "",
+                    }
+                    for cargo_index in range(cargo_count)
+                ],
+            }
+        )
+    return items
+
+
+def serialize_pydantic(items: List[Dict]) -> bytes:
+    quotes = QUOTE_LIST_ADAPTER.validate_python(items)
+    content = QUOTE_LIST_ADAPTER.dump_python(quotes, mode="json")
+    return JSONResponse(content).body
+
+
+def serialize_pydantic_dump_json(items: List[Dict]) -> bytes:
+    return QUOTE_LIST_ADAPTER.dump_json(QUOTE_LIST_ADAPTER.validate_python(items))
+
+
+def serialize_orjson(items: List[Dict]) -> bytes:
+    return ORJSONResponse(items).body
+
+
+SERIALIZERS: Dict[str, Callable[[List[Dict]], bytes]] = {
+    "pydantic": serialize_pydantic,
+    "pydantic_dump_json": serialize_pydantic_dump_json,
+    "orjson": serialize_orjson,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="관리자 견적 목록 직렬화 벤치마크")
+    parser.add_argument("--quotes", type=int, default=1000, help="목록 견적 수")
+    parser.add_argument("--cargo", type=int, default=3, help="견적당 화물 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수")
+    parser.add_argument("--number", type=int, default=20, help="측정 1회당 실행 횟수")
+    args = parser.parse_args()
+
+    items = build_items(args.quotes, args.cargo)
+    print(f"quotes={args.quotes} cargo={args.cargo} repeat={args.repeat} number={args.number}")
+
+    baseline = None
+    for name, serializer in SERIALIZERS.items():
+        size = len(serializer(items))
+        best = min(
+            timeit.repeat(
+                lambda: serializer(items), repeat=args.repeat, number=args.number
+            )
+        ) / args.number
+        baseline = baseline or best
+        print(
+            f"{name:<20} {best * 1000:9.3f} ms/response  {size / 1024:9.1f} KiB"
+            f"  x{baseline / best:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
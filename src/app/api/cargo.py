@@ -1,12 +1,32 @@
-from fastapi import APIRouter, status, Depends
+from fastapi import APIRouter, status, Depends, Request, Response
 from typing import List
-from ..schema.cargo import CargoTransportationResponse, CargoAccessorialResponse, CargoPackageResponse
+from ..schema.cargo import (
+    CargoTransportationResponse,
+    CargoAccessorialResponse,
+    CargoPackageResponse,
+    CreateCargoAccessorialRequest,
+)
 from ..service import CargoService
+from ..service.cargo_snapshot import CachedJSONBody
+from ..core.etag import ETAG_HEADER, IF_NONE_MATCH_HEADER, is_not_modified
 from ..core.uow import get_uow
 from ..db.unit_of_work import UnitOfWork
+from ..core.auth import TokenData, required_authorization
 
 router = APIRouter(prefix="/cargo", tags=["cargo"])
 
+# 기준 정보는 관리자 변경 시에만 바뀌므로 잠시 캐시하고, 이후에는 ETag로 재검증합니다.
+CARGO_CACHE_CONTROL = "public, max-age=60"
+
+
+def _cached_json_response(request: Request, cached: CachedJSONBody) -> Response:
+    headers = {ETAG_HEADER: cached.etag, "Cache-Control": CARGO_CACHE_CONTROL}
+    if is_not_modified(request.headers.get(IF_NONE_MATCH_HEADER), cached.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=cached.body, media_type="application/json", headers=headers
+    )
+
 
 @router.get(
     "/transportation",
@@ -14,10 +34,13 @@ router = APIRouter(prefix="/cargo", tags=["cargo"])
     status_code=status.HTTP_200_OK,
 )
 async def get_cargo_transportation(
+    request: Request,
     uow: UnitOfWork = Depends(get_uow),
 ):
     cargo_service = CargoService(uow)
-    return await cargo_service.get_cargo_transportation()
+    return _cached_json_response(
+        request, await cargo_service.get_cargo_transportation()
+    )
 
 
 @router.get(
@@ -26,10 +49,27 @@ async def get_cargo_transportation(
     status_code=status.HTTP_200_OK,
 )
 async def get_cargo_accessorial(
+    request: Request,
+    uow: UnitOfWork = Depends(get_uow),
+):
+    cargo_service = CargoService(uow)
+    return _cached_json_response(
+        request, await cargo_service.get_cargo_accessorial()
+    )
+
+
+@router.post(
+    "/accessorial",
+    response_model=CargoAccessorialResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def create_cargo_accessorial(
+    request: CreateCargoAccessorialRequest,
     uow: UnitOfWork = Depends(get_uow),
+    token_data: TokenData = Depends(required_authorization),
 ):
     cargo_service = CargoService(uow)
-    return await cargo_service.get_cargo_accessorial()
+    return await cargo_service.create_cargo_accessorial(token_data.role_id, request)
 
 
 @router.get(
@@ -38,7 +78,10 @@ async def get_cargo_accessorial(
     status_code=status.HTTP_200_OK,
 )
 async def get_cargo_package(
+    request: Request,
     uow: UnitOfWork = Depends(get_uow),
 ):
     cargo_service = CargoService(uow)
-    return await cargo_service.get_cargo_package()
+    return _cached_json_response(
+        request, await cargo_service.get_cargo_package()
+    )
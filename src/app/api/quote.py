@@ -1,19 +1,37 @@
-from fastapi import APIRouter, Query, status, Path, Depends, Request
+from fastapi import APIRouter, Query, status, Path, Depends, Request, Response
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 
-from ..core.exceptions import BadRequestException, NotFoundException
-from ..core.uow import get_uow
-from ..db.unit_of_work import UnitOfWork
+from ..core.etag import ETAG_HEADER, IF_NONE_MATCH_HEADER, is_not_modified
+from ..core.exceptions import NotFoundException
+from ..core.responses import ORJSONResponse
+from ..core.pagination import DEFAULT_PAGE_LIMIT, MAX_PAGE_LIMIT, NEXT_CURSOR_HEADER
+from ..core.uow import get_uow, get_read_only_uow
+from ..db.unit_of_work import UnitOfWork, ReadOnlyUnitOfWork
 from ..core.auth import TokenData
-from ..service import CostService, QuoteService
+from ..service import (
+    CostService,
+    QuoteService,
+    QuoteExportService,
+    QuoteSummaryService,
+)
+from ..service.quote_export import EXPORT_MEDIA_TYPES, ExportFormat
+from ..model._enum import OrderStatusEnum
 from ..schema.quote import (
     CreateQuoteRequest,
     UpdateQuoteRequest,
     GetQuotesResponse,
     GetQuoteDetailsResponse,
     ConfirmQuoteRequest,
+    BatchQuotePriceRequest,
+    BatchQuotePriceResponse,
+    BulkCreateQuoteRequest,
+    BulkCreateQuoteResponse,
+    AdminQuoteFilter,
+    QuoteDashboardResponse,
 )
 from ..schema._common import BaseQuoteSchema
+from ..schema.cost import QuotePriceSchema, PricingCacheStatsResponse
 from ..core.auth import required_authorization
 
 router = APIRouter(prefix="/quote", tags=["quote"])
@@ -25,11 +43,24 @@ router = APIRouter(prefix="/quote", tags=["quote"])
     status_code=status.HTTP_200_OK,
 )
 async def get_quotes(
+    request: Request,
     uow: UnitOfWork = Depends(get_uow),
     token_data: TokenData = Depends(required_authorization),
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
 ):
     quote_service = QuoteService(uow)
-    return await quote_service.get_quotes(token_data.user_id)
+    etag = await quote_service.get_quotes_etag(token_data.user_id, limit, cursor)
+    if is_not_modified(request.headers.get(IF_NONE_MATCH_HEADER), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={ETAG_HEADER: etag}
+        )
+
+    headers = {ETAG_HEADER: etag}
+    page = await quote_service.get_quotes(token_data.user_id, limit, cursor)
+    if page.next_cursor:
+        headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return ORJSONResponse(page.items, headers=headers)
 
 
 @router.get(
@@ -41,6 +72,9 @@ async def get_quotes_admin(
     request: Request,
     uow: UnitOfWork = Depends(get_uow),
     token_data: TokenData = Depends(required_authorization),
+    limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    filters: AdminQuoteFilter = Depends(),
 ):
     status_values = []
     query_params = request.query_params
@@ -55,12 +89,59 @@ async def get_quotes_admin(
                 status_values.append(value)
     
     quote_service = QuoteService(uow)
-    return await quote_service.get_quotes_admin(token_data.role_id, status_values)
+    page = await quote_service.get_quotes_admin(
+        token_data.role_id, status_values, limit, cursor, filters
+    )
+    headers = {}
+    if page.next_cursor:
+        headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return ORJSONResponse(page.items, headers=headers)
+
+
+@router.get(
+    "/admin/export",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+)
+async def export_quotes_admin(
+    token_data: TokenData = Depends(required_authorization),
+    format: ExportFormat = Query("ndjson", description="ndjson 또는 csv"),
+    status_values: List[OrderStatusEnum] = Query(
+        [OrderStatusEnum.SUBMIT, OrderStatusEnum.ACCEPT], alias="status"
+    ),
+):
+    export_service = QuoteExportService()
+    chunks = export_service.export_quotes(token_data.role_id, status_values, format)
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="quotes.{format}"',
+        },
+    )
+
+
+@router.get(
+    "/admin/dashboard",
+    response_model=QuoteDashboardResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_quote_dashboard_admin(
+    uow: ReadOnlyUnitOfWork = Depends(get_read_only_uow),
+    token_data: TokenData = Depends(required_authorization),
+    status_values: Optional[List[OrderStatusEnum]] = Query(
+        None, alias="status", description="구역별/주별 집계에 포함할 상태 (기본: 전체)"
+    ),
+):
+    quote_summary_service = QuoteSummaryService(uow)
+    return ORJSONResponse(
+        await quote_summary_service.get_dashboard(token_data.role_id, status_values)
+    )
 
 
 @router.get(
     "/admin/{quote_id}",
-    response_model=list[GetQuotesResponse],
+    response_model=GetQuoteDetailsResponse,
     status_code=status.HTTP_200_OK,
 )
 async def get_quote_details_admin(
@@ -69,7 +150,7 @@ async def get_quote_details_admin(
     token_data: TokenData = Depends(required_authorization),
 ):
     quote_service = QuoteService(uow)
-    return await quote_service.get_quote_by_id(quote_id, token_data)
+    return ORJSONResponse(await quote_service.get_quote_by_id(quote_id, token_data))
 
 
 @router.get(
@@ -78,12 +159,22 @@ async def get_quote_details_admin(
     status_code=status.HTTP_200_OK,
 )
 async def get_quote_details(
+    request: Request,
     quote_id: str = Path(..., description="인용 ID"),
     uow: UnitOfWork = Depends(get_uow),
     token_data: TokenData = Depends(required_authorization),
 ):
     quote_service = QuoteService(uow)
-    return await quote_service.get_quote_by_id(quote_id, token_data)
+    etag = await quote_service.get_quote_etag(quote_id, token_data)
+    if is_not_modified(request.headers.get(IF_NONE_MATCH_HEADER), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={ETAG_HEADER: etag}
+        )
+
+    return ORJSONResponse(
+        await quote_service.get_quote_by_id(quote_id, token_data),
+        headers={ETAG_HEADER: etag},
+    )
 
 
 @router.post(
@@ -99,42 +190,76 @@ async def create_quote(
     cost_service = CostService(uow)
     quote_service = QuoteService(uow)
 
-    base_cost = await cost_service.calculate_base_cost(
-        cargo_transportation_id=request.cargo_transportation_id,
-        cargo_list=request.cargo,
-        from_location=request.from_location,
-        to_location=request.to_location,
-    )
-
-    if base_cost.is_max_load:
-        raise BadRequestException(
-            message="최대 금액을 초과했습니다. 고객사에 직접 문의해주세요.",
+    # 비용 계산과 견적 저장을 하나의 트랜잭션으로 묶어 커밋은 한 번만 발생합니다.
+    async with uow:
+        quote_price = await cost_service.price_quote(token_data, request)
+        quote = await quote_service.create_quote(
+            user_id=token_data.user_id,
+            quote_data=request,
+            quote_price=quote_price,
         )
+    return ORJSONResponse(quote)
 
-    location_type_cost = await cost_service.calculate_location_type_cost(
-        request.from_location, request.to_location, base_cost
-    )
-    extra_cost = await cost_service.calculate_extra_cost(
-        request.is_priority, request.from_location, request.to_location, base_cost
+
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_200_OK,
+    response_model=list[BulkCreateQuoteResponse],
+)
+async def create_quotes_bulk(
+    request: BulkCreateQuoteRequest,
+    uow: UnitOfWork = Depends(get_uow),
+    token_data: TokenData = Depends(required_authorization),
+):
+    quote_service = QuoteService(uow)
+    return ORJSONResponse(
+        await quote_service.create_quotes_bulk(token_data, request.quotes)
     )
 
-    total_price = base_cost.cost + location_type_cost.cost + extra_cost.cost
-    base_price = base_cost.cost
-    extra_price = location_type_cost.cost + extra_cost.cost
 
-    total_price_with_discount = await cost_service.calculate_discount(
-        token_data.user_id, total_price
-    )
-    return await quote_service.create_quote(
-        user_id=token_data.user_id,
-        quote_data=request,
-        total_weight=base_cost.freight_weight,
-        base_price=base_price,
-        extra_price=extra_price,
-        total_price_with_discount=total_price_with_discount.cost,
+@router.post(
+    "/estimate",
+    status_code=status.HTTP_200_OK,
+    response_model=QuotePriceSchema,
+)
+async def estimate_quote(
+    request: CreateQuoteRequest,
+    uow: ReadOnlyUnitOfWork = Depends(get_read_only_uow),
+    token_data: TokenData = Depends(required_authorization),
+):
+    cost_service = CostService(uow)
+    return ORJSONResponse(await cost_service.price_quote(token_data, request))
+
+
+@router.post(
+    "/price/batch",
+    status_code=status.HTTP_200_OK,
+    response_model=list[BatchQuotePriceResponse],
+)
+async def price_quotes_batch(
+    request: BatchQuotePriceRequest,
+    uow: ReadOnlyUnitOfWork = Depends(get_read_only_uow),
+    token_data: TokenData = Depends(required_authorization),
+):
+    cost_service = CostService(uow)
+    return ORJSONResponse(
+        await cost_service.calculate_batch_prices(token_data, request.quotes)
     )
 
 
+@router.get(
+    "/price/cache",
+    status_code=status.HTTP_200_OK,
+    response_model=PricingCacheStatsResponse,
+)
+async def get_pricing_cache_stats(
+    uow: UnitOfWork = Depends(get_uow),
+    token_data: TokenData = Depends(required_authorization),
+):
+    cost_service = CostService(uow)
+    return ORJSONResponse(cost_service.get_pricing_cache_stats(token_data.role_id))
+
+
 @router.put(
     "/{quote_id}",
     status_code=status.HTTP_200_OK,
@@ -149,41 +274,15 @@ async def update_quote(
     cost_service = CostService(uow)
     quote_service = QuoteService(uow)
 
-    base_cost = await cost_service.calculate_base_cost(
-        cargo_transportation_id=request.cargo_transportation_id,
-        cargo_list=request.cargo,
-        from_location=request.from_location,
-        to_location=request.to_location,
-    )
-
-    if base_cost.is_max_load:
-        raise BadRequestException(
-            message="최대 금액을 초과했습니다. 고객사에 직접 문의해주세요.",
+    async with uow:
+        quote_price = await cost_service.price_quote(token_data, request)
+        quote = await quote_service.update_quote(
+            quote_id=quote_id,
+            user_id=token_data.user_id,
+            quote_data=request,
+            quote_price=quote_price,
         )
-
-    location_type_cost = await cost_service.calculate_location_type_cost(
-        request.from_location, request.to_location, base_cost
-    )
-    extra_cost = await cost_service.calculate_extra_cost(
-        request.is_priority, request.from_location, request.to_location, base_cost
-    )
-
-    total_price = base_cost.cost + location_type_cost.cost + extra_cost.cost
-    base_price = base_cost.cost
-    extra_price = location_type_cost.cost + extra_cost.cost
-    total_price_with_discount = await cost_service.calculate_discount(
-        token_data.user_id, total_price
-    )
-
-    return await quote_service.update_quote(
-        quote_id=quote_id,
-        user_id=token_data.user_id,
-        quote_data=request,
-        total_weight=base_cost.freight_weight,
-        base_price=base_price,
-        extra_price=extra_price,
-        total_price_with_discount=total_price_with_discount.cost,
-    )
+    return ORJSONResponse(quote)
 
 
 @router.post(
@@ -197,7 +296,9 @@ async def submit_quote(
     quote_id: str = Path(..., description="인용 ID"),
 ):
     quote_service = QuoteService(uow)
-    return await quote_service.submit_quote(quote_id, token_data.user_id, token_data)
+    return ORJSONResponse(
+        await quote_service.submit_quote(quote_id, token_data.user_id, token_data)
+    )
 
 
 @router.post(
@@ -212,4 +313,8 @@ async def confirm_quote(
     quote_id: str = Path(..., description="인용 ID"),
 ):
     quote_service = QuoteService(uow)
-    return await quote_service.confirm_quote(quote_id, token_data.role_id, request, token_data)
+    return ORJSONResponse(
+        await quote_service.confirm_quote(
+            quote_id, token_data.role_id, request, token_data
+        )
+    )
@@ -1,9 +1,14 @@
-from fastapi import APIRouter, Query, Depends, status
+from fastapi import APIRouter, Query, Depends, File, UploadFile, status
 from typing import Optional, List
-from ..schema.rate import RateLocationResponse
+from ..schema.rate import (
+    RateLocationImportResponse,
+    RateLocationResponse,
+    RateSnapshotResponse,
+)
 from ..service import RateService
 from ..core.uow import get_uow
 from ..db.unit_of_work import UnitOfWork
+from ..core.auth import TokenData, required_authorization
 
 router = APIRouter(prefix="/rate", tags=["rate"])
 
@@ -18,6 +23,40 @@ async def get_locations_by_city_or_zip_code(
     region_id: int = Query(..., description="지역 ID"),
     city: Optional[str] = Query(None, description="도시명"),
     zip_code: Optional[str] = Query(None, description="우편번호"),
+    q: Optional[str] = Query(None, description="우편번호 또는 도시명 접두어 (자동완성)"),
+    limit: int = Query(10, ge=1, le=50, description="자동완성 최대 결과 수"),
 ):
     rate_service = RateService(uow)
+    if q is not None:
+        return await rate_service.search_rate_locations(region_id, q, limit)
     return await rate_service.get_rate_locations(region_id, city, zip_code)
+
+
+@router.post(
+    "/location/import",
+    response_model=RateLocationImportResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def import_rate_locations(
+    uow: UnitOfWork = Depends(get_uow),
+    token_data: TokenData = Depends(required_authorization),
+    region_id: int = Query(..., description="지역 ID"),
+    file: UploadFile = File(..., description="zip_code,city,state,county,area CSV"),
+):
+    rate_service = RateService(uow)
+    return await rate_service.import_rate_locations(
+        token_data.role_id, region_id, file.file
+    )
+
+
+@router.post(
+    "/snapshot/reload",
+    response_model=RateSnapshotResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def reload_rate_snapshot(
+    uow: UnitOfWork = Depends(get_uow),
+    token_data: TokenData = Depends(required_authorization),
+):
+    rate_service = RateService(uow)
+    return await rate_service.reload_rate_snapshot(token_data.role_id)
@@ -1,3 +1,4 @@
+from decimal import Decimal, InvalidOperation
 from fastapi import Depends, Cookie
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
@@ -10,9 +11,20 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 
 class TokenData:
-    def __init__(self, user_id: int, role_id: int):
+    def __init__(
+        self,
+        user_id: int,
+        role_id: int,
+        user_level_id: Optional[int] = None,
+        discount_rate: Optional[Decimal] = None,
+        level_version: Optional[str] = None,
+    ):
         self.user_id = user_id
         self.role_id = role_id
+        # 등급 클레임이 없는 이전 토큰은 None이며, 운임 계산 시 DB에서 등급을 조회합니다.
+        self.user_level_id = user_level_id
+        self.discount_rate = discount_rate
+        self.level_version = level_version
 
 
 async def get_refresh_token_from_cookie(
@@ -39,7 +51,22 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> TokenData:
         except (ValueError, TypeError):
             raise credentials_exception
 
-        return TokenData(user_id=user_id, role_id=role_id)
+        user_level_id = payload.get("user_level_id")
+        discount_rate = payload.get("discount_rate")
+        level_version = payload.get("level_version")
+        try:
+            user_level_id = int(user_level_id) if user_level_id is not None else None
+            discount_rate = Decimal(discount_rate) if discount_rate is not None else None
+        except (ValueError, TypeError, InvalidOperation):
+            user_level_id, discount_rate, level_version = None, None, None
+
+        return TokenData(
+            user_id=user_id,
+            role_id=role_id,
+            user_level_id=user_level_id,
+            discount_rate=discount_rate,
+            level_version=level_version,
+        )
 
     except JWTError:
         raise credentials_exception
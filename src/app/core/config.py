@@ -29,6 +29,30 @@ class Settings(BaseSettings):
     SMTP_EMAIL_PASSWORD: str
     SMTP_SENDER_EMAIL: str
 
+    # decimal: Decimal 빌더, fixed_point: 정수 고정소수점 코어 (service/cost_builder/fixed_point.py)
+    PRICING_ENGINE: Literal["decimal", "fixed_point"] = "decimal"
+    PRICING_CACHE_MAX_SIZE: int = 10000
+    PRICING_CACHE_TTL_SECONDS: int = 300
+
+    # 관리자 대시보드 집계: 다른 워커의 증분을 반영하는 캐시 재적재 주기, 전체 재집계(drift 보정) 주기
+    QUOTE_SUMMARY_CACHE_TTL_SECONDS: int = 60
+    QUOTE_SUMMARY_RECONCILE_INTERVAL_SECONDS: int = 60 * 60
+    # 서버 프로세스 안에서 재집계기를 실행할지 여부입니다. 워커마다 전체 스캔이 돌지 않도록 한 프로세스에서만 켭니다.
+    QUOTE_SUMMARY_RECONCILER_ENABLED: bool = False
+
+    # 대량 견적 생성(POST /quote/bulk) 한 번에 받을 수 있는 최대 견적 수
+    QUOTE_BULK_MAX_ITEMS: int = 500
+    # 일괄 비용 계산(POST /quote/price/batch) 한 번에 받을 수 있는 최대 견적 수
+    QUOTE_PRICE_BATCH_MAX_ITEMS: int = 500
+
+    # 이메일 발송기(email_outbox): 폴링 주기, 한 번에 가져올 건수, 최대 시도 횟수, 재시도 간격(지수 증가), 발송 중 점유 시간
+    EMAIL_OUTBOX_POLL_INTERVAL_SECONDS: int = 5
+    EMAIL_OUTBOX_BATCH_SIZE: int = 20
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 5
+    EMAIL_OUTBOX_RETRY_BASE_SECONDS: int = 30
+    EMAIL_OUTBOX_RETRY_MAX_SECONDS: int = 60 * 60
+    EMAIL_OUTBOX_LEASE_SECONDS: int = 120
+
     @property
     def DB_URL(self) -> str:
         return f"mysql+aiomysql://{self.DB_USER}:{self.DB_PASS}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
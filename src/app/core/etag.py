@@ -0,0 +1,26 @@
+import hashlib
+from typing import Optional
+
+ETAG_HEADER = "ETag"
+IF_NONE_MATCH_HEADER = "If-None-Match"
+
+
+def build_etag(*parts) -> str:
+    """응답 본문을 결정하는 값들로 강한 ETag를 만듭니다. 값이 같으면 본문도 같아야 합니다."""
+    source = "|".join("" if part is None else str(part) for part in parts)
+    return f'"{hashlib.sha256(source.encode()).hexdigest()[:32]}"'
+
+
+def is_not_modified(if_none_match: Optional[str], etag: str) -> bool:
+    # If-None-Match는 약한 비교를 사용하므로 W/ 접두어는 무시합니다.
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
@@ -0,0 +1,24 @@
+import base64
+from datetime import datetime
+from typing import Tuple
+
+from .exceptions import BadRequestException
+
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 100
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_at: datetime, id: str) -> str:
+    """(created_at, id) 키셋 커서를 URL에 그대로 쓸 수 있는 문자열로 만듭니다."""
+    raw = f"{created_at.isoformat()}|{id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = base64.urlsafe_b64decode(padded).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), id
+    except ValueError:
+        raise BadRequestException(message="유효하지 않은 커서입니다.")
@@ -0,0 +1,32 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _orjson_default(value: Any) -> Any:
+    # orjson이 직접 처리하지 못하는 값만 변환합니다. (datetime, date, Enum, dataclass는 orjson이 처리)
+    if isinstance(value, Decimal):
+        # BaseSchema의 json_encoders와 같이 Decimal은 숫자(float)로 내보냅니다.
+        return float(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    raise TypeError(f"{type(value).__name__}는 JSON으로 변환할 수 없습니다.")
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    orjson으로 직렬화하는 JSON 응답입니다. 앱의 기본 응답 클래스로 사용합니다.
+
+    서비스가 만든 검증된 Pydantic 모델이나 dict를 엔드포인트에서 ORJSONResponse로 바로 반환하면
+    response_model 재검증과 jsonable_encoder를 거치지 않고 한 번만 직렬화됩니다. (response_model은 문서용으로만 남습니다)
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+        )
@@ -2,9 +2,16 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db.session import get_async_session
-from ..db.unit_of_work import UnitOfWork
+from ..db.unit_of_work import UnitOfWork, ReadOnlyUnitOfWork
 
 
 async def get_uow(session: AsyncSession = Depends(get_async_session)) -> UnitOfWork:
     """UnitOfWork 의존성 주입 함수"""
-    return UnitOfWork(session) 
\ No newline at end of file
+    return UnitOfWork(session)
+
+
+async def get_read_only_uow(
+    session: AsyncSession = Depends(get_async_session),
+) -> ReadOnlyUnitOfWork:
+    """커밋하지 않는 UnitOfWork 의존성 주입 함수"""
+    return ReadOnlyUnitOfWork(session)
@@ -1,5 +1,10 @@
 from decimal import Decimal, ROUND_UP
 
+# 자리수별 quantize 기준값을 재사용합니다.
+_QUANTIZE_FORMATS = {places: Decimal(1).scaleb(-places) for places in range(7)}
+
 def round_up_decimal(value: Decimal, decimal_places: int = 3, rounding_mode: str = ROUND_UP) -> Decimal:
-    quantize_format = Decimal(f"0.{"0" * decimal_places}")
+    quantize_format = _QUANTIZE_FORMATS.get(decimal_places)
+    if quantize_format is None:
+        quantize_format = Decimal(1).scaleb(-decimal_places)
     return value.quantize(quantize_format, rounding=rounding_mode)
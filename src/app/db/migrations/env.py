@@ -15,7 +15,13 @@ from app.db.base import Base
 from app.model.user import User, UserLevel, UserAddress, Role
 from app.model.cargo import CargoTransportation, CargoAccessorial, CargoPackage
 from app.model.rate import RateArea, RateRegion, RateLocation
-from app.model.quote import Quote, QuoteLocation, QuoteLocationAccessorial
+from app.model.quote import (
+    Quote,
+    QuoteLocation,
+    QuoteLocationAccessorial,
+    QuoteSummary,
+)
+from app.model.email import EmailOutbox
 
 
 from app.core.config import get_settings
@@ -0,0 +1,101 @@
+"""add cargo_accessorial pricing
+
+Revision ID: 4b7e2d9c1a53
+Revises: 7cb46db48fbc
+Create Date: 2026-10-18 10:12:41.208734
+
+"""
+
+from typing import Sequence, Union
+from decimal import Decimal
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.model._enum import AccessorialPricingTypeEnum
+
+
+revision: str = "4b7e2d9c1a53"
+down_revision: Union[str, None] = "7cb46db48fbc"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def update_cargo_accessorial_pricing() -> None:
+    cargo_accessorial_table = sa.table(
+        "cargo_accessorial",
+        sa.column("id", sa.Integer),
+        sa.column("pricing_type", sa.Enum(AccessorialPricingTypeEnum)),
+        sa.column("price", sa.Numeric(16, 4)),
+        sa.column("min_price", sa.Numeric(16, 4)),
+        sa.column("max_price", sa.Numeric(16, 4)),
+    )
+    pricing = [
+        # Inside Delivery: 운임 무게 × $0.02, 최소 $25
+        {
+            "id": 1,
+            "pricing_type": AccessorialPricingTypeEnum.PER_WEIGHT,
+            "price": Decimal("0.02"),
+            "min_price": Decimal(25),
+            "max_price": None,
+        },
+        # Two Person
+        {
+            "id": 2,
+            "pricing_type": AccessorialPricingTypeEnum.FLAT,
+            "price": Decimal(80),
+            "min_price": None,
+            "max_price": None,
+        },
+        # Lift Gate
+        {
+            "id": 3,
+            "pricing_type": AccessorialPricingTypeEnum.FLAT,
+            "price": Decimal(25),
+            "min_price": None,
+            "max_price": None,
+        },
+    ]
+    for values in pricing:
+        op.execute(
+            cargo_accessorial_table.update()
+            .where(cargo_accessorial_table.c.id == values["id"])
+            .values(
+                pricing_type=values["pricing_type"],
+                price=values["price"],
+                min_price=values["min_price"],
+                max_price=values["max_price"],
+            )
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "cargo_accessorial",
+        sa.Column(
+            "pricing_type",
+            sa.Enum(AccessorialPricingTypeEnum),
+            nullable=False,
+            server_default=AccessorialPricingTypeEnum.FLAT.value,
+        ),
+    )
+    op.add_column(
+        "cargo_accessorial",
+        sa.Column("price", sa.Numeric(16, 4), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "cargo_accessorial", sa.Column("min_price", sa.Numeric(16, 4), nullable=True)
+    )
+    op.add_column(
+        "cargo_accessorial", sa.Column("max_price", sa.Numeric(16, 4), nullable=True)
+    )
+    update_cargo_accessorial_pricing()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("cargo_accessorial", "max_price")
+    op.drop_column("cargo_accessorial", "min_price")
+    op.drop_column("cargo_accessorial", "price")
+    op.drop_column("cargo_accessorial", "pricing_type")
@@ -0,0 +1,48 @@
+"""create quote summary
+
+Revision ID: a8c4e1f95b32
+Revises: f7b3d2e8a614
+Create Date: 2026-10-18 17:26:05.114582
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "a8c4e1f95b32"
+down_revision: Union[str, None] = "f7b3d2e8a614"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 집계는 애플리케이션 시작 시 재집계기(service/quote_summary.py)가 채웁니다.
+    op.create_table(
+        "quote_summary",
+        sa.Column(
+            "order_status",
+            sa.Enum(
+                "ESTIMATE",
+                "SUBMIT",
+                "ACCEPT",
+                "REJECT",
+                "COMPLETED",
+                name="orderstatusenum",
+            ),
+            nullable=False,
+        ),
+        sa.Column("area_id", sa.Integer(), nullable=False),
+        sa.Column("week_start", sa.Date(), nullable=False),
+        sa.Column("quote_count", sa.Integer(), nullable=False),
+        sa.Column("total_price", sa.Numeric(precision=16, scale=4), nullable=False),
+        sa.PrimaryKeyConstraint("order_status", "area_id", "week_start"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("quote_summary")
@@ -0,0 +1,30 @@
+"""add quote user updated index
+
+Revision ID: b61f0d9e7a25
+Revises: a8c4e1f95b32
+Create Date: 2026-10-18 18:03:44.270916
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "b61f0d9e7a25"
+down_revision: Union[str, None] = "a8c4e1f95b32"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 견적 목록 ETag(견적 수, 최신 생성/수정 시각)를 테이블을 읽지 않고 인덱스만으로 계산하기 위한 인덱스입니다.
+    op.create_index(
+        "ix_quote_user_updated", "quote", ["user_id", "updated_at", "created_at"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_quote_user_updated", table_name="quote")
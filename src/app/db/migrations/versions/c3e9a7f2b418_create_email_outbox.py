@@ -0,0 +1,59 @@
+"""create email outbox
+
+Revision ID: c3e9a7f2b418
+Revises: b61f0d9e7a25
+Create Date: 2026-10-18 21:04:37.502913
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "c3e9a7f2b418"
+down_revision: Union[str, None] = "b61f0d9e7a25"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "email_outbox",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("quote_id", sa.String(length=32), nullable=False),
+        sa.Column("subject", sa.String(length=255), nullable=False),
+        sa.Column("receiver_email", sa.String(length=255), nullable=False),
+        sa.Column("client_name", sa.String(length=255), nullable=False),
+        sa.Column("order_primary", sa.String(length=255), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("PENDING", "SENT", "DEAD", name="emailoutboxstatusenum"),
+            nullable=False,
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["quote_id"],
+            ["quote.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_email_outbox_status_next_attempt",
+        "email_outbox",
+        ["status", "next_attempt_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_email_outbox_status_next_attempt", table_name="email_outbox")
+    op.drop_table("email_outbox")
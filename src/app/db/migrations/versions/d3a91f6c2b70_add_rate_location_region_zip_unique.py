@@ -0,0 +1,30 @@
+"""add rate_location (region_id, zip_code) unique
+
+Revision ID: d3a91f6c2b70
+Revises: 4b7e2d9c1a53
+Create Date: 2026-10-18 13:40:22.518903
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "d3a91f6c2b70"
+down_revision: Union[str, None] = "4b7e2d9c1a53"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 우편번호 임포터의 ON DUPLICATE KEY UPDATE 기준 키입니다.
+    op.create_unique_constraint(
+        "uq_rate_location_region_zip", "rate_location", ["region_id", "zip_code"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("uq_rate_location_region_zip", "rate_location", type_="unique")
@@ -0,0 +1,41 @@
+"""add quote version
+
+Revision ID: d8f41b6a2c97
+Revises: c3e9a7f2b418
+Create Date: 2026-10-19 10:12:05.381442
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "d8f41b6a2c97"
+down_revision: Union[str, None] = "c3e9a7f2b418"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 견적 ETag는 초 단위 updated_at 대신 수정/제출/확정마다 올라가는 버전으로 계산합니다.
+    op.add_column(
+        "quote",
+        sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+    )
+    # 목록 ETag(견적 수, 최신 생성 시각, 버전 합계)를 인덱스만으로 계산하도록 ix_quote_user_updated를 대체합니다.
+    op.create_index(
+        "ix_quote_user_version", "quote", ["user_id", "version", "created_at"]
+    )
+    op.drop_index("ix_quote_user_updated", table_name="quote")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "ix_quote_user_updated", "quote", ["user_id", "updated_at", "created_at"]
+    )
+    op.drop_index("ix_quote_user_version", table_name="quote")
+    op.drop_column("quote", "version")
@@ -0,0 +1,30 @@
+"""add quote list indexes
+
+Revision ID: e52c8a4f7d19
+Revises: d3a91f6c2b70
+Create Date: 2026-10-18 15:02:47.331820
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "e52c8a4f7d19"
+down_revision: Union[str, None] = "d3a91f6c2b70"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 견적 목록의 created_at DESC, id DESC 키셋 페이지네이션용 인덱스입니다.
+    op.create_index("ix_quote_user_created", "quote", ["user_id", "created_at"])
+    op.create_index("ix_quote_status_created", "quote", ["order_status", "created_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_quote_status_created", table_name="quote")
+    op.drop_index("ix_quote_user_created", table_name="quote")
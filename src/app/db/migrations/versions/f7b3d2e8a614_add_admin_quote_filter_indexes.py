@@ -0,0 +1,56 @@
+"""add admin quote filter indexes
+
+Revision ID: f7b3d2e8a614
+Revises: e52c8a4f7d19
+Create Date: 2026-10-18 16:41:12.508213
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "f7b3d2e8a614"
+down_revision: Union[str, None] = "e52c8a4f7d19"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 관리자 견적 검색 조건용 인덱스입니다. 관리자 목록은 항상 order_status로 거르므로 order_status를 앞에 둡니다.
+    # 기간 조건은 ix_quote_status_created, user_id 조건은 ix_quote_user_created를 사용합니다.
+    op.create_index(
+        "ix_quote_status_transportation_created",
+        "quote",
+        ["order_status", "cargo_transportation_id", "created_at"],
+    )
+    op.create_index(
+        "ix_quote_status_priority_created",
+        "quote",
+        ["order_status", "is_priority", "created_at"],
+    )
+    op.create_index(
+        "ix_quote_status_total_price", "quote", ["order_status", "total_price"]
+    )
+    # 출발지/도착지 우편번호, 도시 조건은 quote_location에서 quote_id까지 인덱스만으로 찾은 뒤 quote를 PK로 조인합니다.
+    op.create_index(
+        "ix_quote_location_shipment_zip",
+        "quote_location",
+        ["shipment_type", "zip_code", "quote_id"],
+    )
+    op.create_index(
+        "ix_quote_location_shipment_city",
+        "quote_location",
+        ["shipment_type", "city", "quote_id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_quote_location_shipment_city", table_name="quote_location")
+    op.drop_index("ix_quote_location_shipment_zip", table_name="quote_location")
+    op.drop_index("ix_quote_status_total_price", table_name="quote")
+    op.drop_index("ix_quote_status_priority_created", table_name="quote")
+    op.drop_index("ix_quote_status_transportation_created", table_name="quote")
@@ -1,3 +1,5 @@
+from typing import Callable, List
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..repository import (
@@ -12,12 +14,16 @@ from ..repository import (
     QuoteLocationRepository,
     QuoteLocationAccessorialRepository,
     QuoteCargoRepository,
+    QuoteSummaryRepository,
+    EmailOutboxRepository,
 )
 
 
 class UnitOfWork:
     def __init__(self, session: AsyncSession):
         self._session = session
+        self._depth = 0
+        self._after_commit: List[Callable[[], None]] = []
 
         self.user: UserRepository = UserRepository(self._session)
         self.user_level: UserLevelRepository = UserLevelRepository(self._session)
@@ -40,15 +46,38 @@ class UnitOfWork:
             QuoteLocationAccessorialRepository(self._session)
         )
         self.quote_cargo: QuoteCargoRepository = QuoteCargoRepository(self._session)
+        self.quote_summary: QuoteSummaryRepository = QuoteSummaryRepository(
+            self._session
+        )
+        self.email_outbox: EmailOutboxRepository = EmailOutboxRepository(
+            self._session
+        )
 
     @property
     def session(self) -> AsyncSession:
         return self._session
 
+    def after_commit(self, callback: Callable[[], None]):
+        """가장 바깥 컨텍스트의 커밋이 성공한 뒤 실행할 콜백을 등록합니다. 롤백되면 버려집니다."""
+        self._after_commit.append(callback)
+
+    def _pop_after_commit(self) -> List[Callable[[], None]]:
+        callbacks, self._after_commit = self._after_commit, []
+        return callbacks
+
     async def __aenter__(self):
+        self._depth += 1
         return self
 
+    def _exit_nested(self) -> bool:
+        # 중첩된 컨텍스트에서는 커밋/롤백을 가장 바깥 컨텍스트에 맡깁니다.
+        self._depth -= 1
+        return self._depth > 0
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._exit_nested():
+            return False
+        callbacks = self._pop_after_commit()
         if exc_type is not None:
             await self._session.rollback()
             raise
@@ -58,3 +87,19 @@ class UnitOfWork:
             except Exception:
                 await self._session.rollback()
                 raise
+            for callback in callbacks:
+                callback()
+
+
+class ReadOnlyUnitOfWork(UnitOfWork):
+    """커밋하지 않는 UnitOfWork. 조회 전용 흐름에서 사용하며 종료 시 항상 롤백합니다."""
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._exit_nested():
+            return False
+        self._pop_after_commit()
+        # 롤백 시 만료되지 않도록 조회한 객체를 먼저 세션에서 분리합니다.
+        self._session.expunge_all()
+        await self._session.rollback()
+        if exc_type is not None:
+            raise
@@ -1,8 +1,20 @@
+import asyncio
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
 import logging
+from .core.config import settings
 from .core.exception_handlers import setup_exception_handlers
+from .core.etag import ETAG_HEADER
+from .core.pagination import NEXT_CURSOR_HEADER
+from .core.responses import ORJSONResponse
 from .api import router as api_router
+from .db.session import async_session
+from .db.unit_of_work import UnitOfWork
+from .service.rate_snapshot import rate_snapshot_store
+from .service.user_level_snapshot import user_level_store
+from .service.cargo_snapshot import cargo_snapshot_store
+from .service.quote_summary import run_quote_summary_reconciler
+from .service.email_outbox import run_email_outbox_worker
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 
@@ -11,8 +23,50 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
+    try:
+        async with async_session() as session:
+            rate_snapshot = await rate_snapshot_store.load(UnitOfWork(session))
+        logger.info("Loaded rate snapshot v%s", rate_snapshot.version)
+    except Exception:
+        # 첫 요금 계산 요청에서 다시 적재를 시도합니다.
+        logger.exception("Failed to load rate snapshot on startup")
+    try:
+        async with async_session() as session:
+            user_levels = await user_level_store.load(UnitOfWork(session))
+        logger.info("Loaded %s user levels", len(user_levels))
+    except Exception:
+        # 캐시가 비어 있으면 운임 계산 시 DB에서 등급을 조회합니다.
+        logger.exception("Failed to load user levels on startup")
+    try:
+        async with async_session() as session:
+            cargo_snapshot = await cargo_snapshot_store.load(UnitOfWork(session))
+        logger.info("Loaded cargo snapshot v%s", cargo_snapshot.version)
+    except Exception:
+        # 첫 기준 정보 조회 요청에서 다시 적재를 시도합니다.
+        logger.exception("Failed to load cargo snapshot on startup")
+    # 견적 알림 메일 발송기입니다. SMTP 발송은 스레드에서 실행되어 요청 처리를 막지 않습니다.
+    background_tasks = [
+        asyncio.create_task(
+            run_email_outbox_worker(settings.EMAIL_OUTBOX_POLL_INTERVAL_SECONDS)
+        )
+    ]
+    # 대시보드 집계 재집계기입니다. 설정으로 켠 프로세스에서만 요청 처리와 같은 이벤트 루프에서 주기적으로 실행됩니다.
+    if settings.QUOTE_SUMMARY_RECONCILER_ENABLED:
+        background_tasks.append(
+            asyncio.create_task(
+                run_quote_summary_reconciler(
+                    settings.QUOTE_SUMMARY_RECONCILE_INTERVAL_SECONDS
+                )
+            )
+        )
     yield
     logger.warning("Shutting down the application")
+    for background_task in background_tasks:
+        background_task.cancel()
+        try:
+            await background_task
+        except asyncio.CancelledError:
+            pass
 
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
@@ -28,6 +82,7 @@ app = FastAPI(
     description="BeyondX Local Trucking Platform API Server",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 origins = [
@@ -41,6 +96,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, ETAG_HEADER],
 )
 
 app.add_middleware(
@@ -31,7 +31,18 @@ class ShipmentTypeEnum(StrEnum):
     DELIVERY = "DELIVERY"
 
 
+class AccessorialPricingTypeEnum(StrEnum):
+    FLAT = "FLAT"
+    PER_WEIGHT = "PER_WEIGHT"
+
+
 class LocationTypeEnum(StrEnum):
     COMMERCIAL = "COMMERCIAL"
     RESIDENTIAL = "RESIDENTIAL"
     AIRPORT = "AIRPORT"
+
+
+class EmailOutboxStatusEnum(StrEnum):
+    PENDING = "PENDING"
+    SENT = "SENT"
+    DEAD = "DEAD"
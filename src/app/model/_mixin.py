@@ -3,8 +3,9 @@ from sqlalchemy import Column, DateTime, Integer
 
 
 class TimestampMixin(object):
-    created_at = Column(DateTime, default=datetime.now(UTC))
-    updated_at = Column(DateTime, onupdate=datetime.now(UTC))
+    # 모듈 로드 시각이 고정되지 않도록 행마다 호출되는 함수로 기본값을 지정합니다.
+    created_at = Column(DateTime, default=lambda: datetime.now(UTC))
+    updated_at = Column(DateTime, onupdate=lambda: datetime.now(UTC))
 
 
 class AutoIntegerIdMixin(object):
@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Enum, Integer, Numeric, String
 from sqlalchemy.orm import relationship
 from app.db.base import Base
+from app.model._enum import AccessorialPricingTypeEnum
 from app.model._mixin import AutoIntegerIdMixin
 
 
@@ -26,4 +27,13 @@ class CargoAccessorial(AutoIntegerIdMixin, Base):
 
     name = Column(String(255), nullable=False)
     description = Column(String(255), nullable=False)
+    # FLAT: price 고정 금액, PER_WEIGHT: 운임 무게 × price (min_price/max_price로 하한/상한 적용)
+    pricing_type = Column(
+        Enum(AccessorialPricingTypeEnum),
+        nullable=False,
+        default=AccessorialPricingTypeEnum.FLAT,
+    )
+    price = Column(Numeric(16, 4), nullable=False, default=0)
+    min_price = Column(Numeric(16, 4))
+    max_price = Column(Numeric(16, 4))
     quote_location_accessorial = relationship("QuoteLocationAccessorial", back_populates="cargo_accessorial")
\ No newline at end of file
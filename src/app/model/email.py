@@ -0,0 +1,32 @@
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String, Text, Index
+from app.db.base import Base
+from app.model._enum import EmailOutboxStatusEnum
+from app.model._mixin import AutoIntegerIdMixin, TimestampMixin
+
+
+class EmailOutbox(AutoIntegerIdMixin, TimestampMixin, Base):
+    """
+    발송할 이메일입니다. 견적 상태 변경과 같은 트랜잭션에 기록하고, 백그라운드 발송기(service/email_outbox.py)가 발송합니다.
+    발송에 실패하면 next_attempt_at을 늦춰 다시 시도하고, 최대 시도 횟수를 넘기면 DEAD로 남깁니다.
+    """
+
+    __tablename__ = "email_outbox"
+
+    quote_id = Column(String(32), ForeignKey("quote.id"), nullable=False)
+    subject = Column(String(255), nullable=False)
+    receiver_email = Column(String(255), nullable=False)
+    client_name = Column(String(255), nullable=False)
+    order_primary = Column(String(255), nullable=False)
+    status = Column(
+        Enum(EmailOutboxStatusEnum),
+        nullable=False,
+        default=EmailOutboxStatusEnum.PENDING,
+    )
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False)
+    sent_at = Column(DateTime)
+    last_error = Column(Text)
+
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt", "status", "next_attempt_at"),
+    )
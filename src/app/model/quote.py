@@ -1,5 +1,6 @@
 from sqlalchemy import (
     Column,
+    Date,
     DateTime,
     Enum,
     ForeignKey,
@@ -9,6 +10,7 @@ from sqlalchemy import (
     Text,
     Boolean,
     UniqueConstraint,
+    Index,
 )
 from sqlalchemy.orm import relationship
 from app.db.base import Base
@@ -34,12 +36,33 @@ class Quote(TimestampMixin, Base):
     )
     order_primary = Column(String(255))
     order_additional_request = Column(Text)
+    # 수정/제출/확정마다 1씩 올리는 버전입니다. 초 단위 updated_at 대신 ETag 계산에 사용합니다.
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
     user = relationship("User", back_populates="quote")
     cargo_transportation = relationship("CargoTransportation", back_populates="quote")
     quote_location = relationship("QuoteLocation", back_populates="quote")
     quote_cargo = relationship("QuoteCargo", back_populates="quote")
 
+    __table_args__ = (
+        Index("ix_quote_user_created", "user_id", "created_at"),
+        Index("ix_quote_user_version", "user_id", "version", "created_at"),
+        Index("ix_quote_status_created", "order_status", "created_at"),
+        Index(
+            "ix_quote_status_transportation_created",
+            "order_status",
+            "cargo_transportation_id",
+            "created_at",
+        ),
+        Index(
+            "ix_quote_status_priority_created",
+            "order_status",
+            "is_priority",
+            "created_at",
+        ),
+        Index("ix_quote_status_total_price", "order_status", "total_price"),
+    )
+
 
 class QuoteLocation(AutoIntegerIdMixin, Base):
     __tablename__ = "quote_location"
@@ -60,6 +83,10 @@ class QuoteLocation(AutoIntegerIdMixin, Base):
         UniqueConstraint(
             "quote_id", "shipment_type", name="uq_quote_location_shipment_type"
         ),
+        Index(
+            "ix_quote_location_shipment_zip", "shipment_type", "zip_code", "quote_id"
+        ),
+        Index("ix_quote_location_shipment_city", "shipment_type", "city", "quote_id"),
     )
 
 
@@ -97,3 +124,18 @@ class QuoteCargo(AutoIntegerIdMixin, Base):
     hazardous_detail = Column(Text)
 
     quote = relationship("Quote", back_populates="quote_cargo")
+
+
+class QuoteSummary(Base):
+    """
+    관리자 대시보드용 견적 집계입니다. (상태, 구역, 주 시작일)별 견적 수와 금액 합계를 견적 상태 변경 시 증분으로 갱신합니다.
+    area_id는 운임 계산과 같은 기준 구역이며, 요율표에서 구역을 찾지 못한 견적은 0으로 집계합니다.
+    """
+
+    __tablename__ = "quote_summary"
+
+    order_status = Column(Enum(OrderStatusEnum), primary_key=True)
+    area_id = Column(Integer, primary_key=True)
+    week_start = Column(Date, primary_key=True)
+    quote_count = Column(Integer, nullable=False, default=0)
+    total_price = Column(Numeric(16, 4), nullable=False, default=0)
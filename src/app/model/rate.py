@@ -62,6 +62,7 @@ class RateLocation(AutoIntegerIdMixin, TimestampMixin, Base):
 
     __table_args__ = (
         UniqueConstraint("area_id", "zip_code", name="uq_rate_location"),
+        UniqueConstraint("region_id", "zip_code", name="uq_rate_location_region_zip"),
         Index("ix_rate_location_region_id", "region_id"),
         Index("ix_rate_location_region_area", "region_id", "area_id"),
     )
@@ -9,6 +9,8 @@ from .quote import QuoteRepository
 from .quote_location import QuoteLocationRepository
 from .quote_location_accessorial import QuoteLocationAccessorialRepository
 from .quote_cargo import QuoteCargoRepository
+from .quote_summary import QuoteSummaryRepository
+from .email_outbox import EmailOutboxRepository
 
 __all__ = [
     "UserRepository",
@@ -22,4 +24,6 @@ __all__ = [
     "QuoteLocationRepository",
     "QuoteLocationAccessorialRepository",
     "QuoteCargoRepository",
+    "QuoteSummaryRepository",
+    "EmailOutboxRepository",
 ]
\ No newline at end of file
@@ -3,6 +3,7 @@ from sqlalchemy import select
 from typing import List
 
 from app.model.cargo import CargoTransportation, CargoAccessorial, CargoPackage
+from ..schema.cargo import CreateCargoAccessorialRequest
 
 
 class CargoRepository:
@@ -23,6 +24,21 @@ class CargoRepository:
         result = await self.db_session.execute(query)
         return result.scalars().all()
     
+    async def create_cargo_accessorial(
+        self, accessorial_data: CreateCargoAccessorialRequest
+    ) -> CargoAccessorial:
+        accessorial = CargoAccessorial(
+            name=accessorial_data.name,
+            description=accessorial_data.description,
+            pricing_type=accessorial_data.pricing_type,
+            price=accessorial_data.price,
+            min_price=accessorial_data.min_price,
+            max_price=accessorial_data.max_price,
+        )
+        self.db_session.add(accessorial)
+        await self.db_session.flush()
+        return accessorial
+
     async def get_cargo_package(
         self,
     ) -> List[CargoPackage]:
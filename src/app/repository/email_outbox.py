@@ -0,0 +1,89 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Row, select, update
+from datetime import datetime
+from typing import List, Optional
+
+from app.model._enum import EmailOutboxStatusEnum
+from app.model.email import EmailOutbox
+
+
+class EmailOutboxRepository:
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def create_email(
+        self,
+        quote_id: str,
+        subject: str,
+        receiver_email: str,
+        client_name: str,
+        order_primary: str,
+        next_attempt_at: datetime,
+    ) -> EmailOutbox:
+        email = EmailOutbox(
+            quote_id=quote_id,
+            subject=subject,
+            receiver_email=receiver_email,
+            client_name=client_name,
+            order_primary=order_primary,
+            status=EmailOutboxStatusEnum.PENDING,
+            attempts=0,
+            next_attempt_at=next_attempt_at,
+        )
+        self.db_session.add(email)
+        await self.db_session.flush()
+        return email
+
+    async def claim_due_emails(
+        self, now: datetime, lease_until: datetime, limit: int
+    ) -> List[Row]:
+        """
+        발송할 때가 된 이메일을 limit건 가져와 시도 횟수를 올리고 lease_until까지 다른 발송기가 가져가지 않도록 미룹니다.
+        SKIP LOCKED로 여러 워커가 같은 행을 동시에 가져가지 않습니다.
+        """
+        result = await self.db_session.execute(
+            select(
+                EmailOutbox.id,
+                EmailOutbox.quote_id,
+                EmailOutbox.subject,
+                EmailOutbox.receiver_email,
+                EmailOutbox.client_name,
+                EmailOutbox.order_primary,
+                (EmailOutbox.attempts + 1).label("attempts"),
+            )
+            .where(
+                EmailOutbox.status == EmailOutboxStatusEnum.PENDING,
+                EmailOutbox.next_attempt_at <= now,
+            )
+            .order_by(EmailOutbox.next_attempt_at, EmailOutbox.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        rows = result.all()
+        if rows:
+            await self.db_session.execute(
+                update(EmailOutbox)
+                .where(EmailOutbox.id.in_([row.id for row in rows]))
+                .values(attempts=EmailOutbox.attempts + 1, next_attempt_at=lease_until)
+            )
+        return rows
+
+    async def mark_sent(self, email_id: int, sent_at: datetime):
+        await self.db_session.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.id == email_id)
+            .values(status=EmailOutboxStatusEnum.SENT, sent_at=sent_at, last_error=None)
+        )
+
+    async def mark_failed(
+        self, email_id: int, error: str, next_attempt_at: Optional[datetime]
+    ):
+        """next_attempt_at이 없으면 더 이상 재시도하지 않도록 DEAD로 바꿉니다."""
+        values = {"last_error": error}
+        if next_attempt_at is None:
+            values["status"] = EmailOutboxStatusEnum.DEAD
+        else:
+            values["next_attempt_at"] = next_attempt_at
+        await self.db_session.execute(
+            update(EmailOutbox).where(EmailOutbox.id == email_id).values(**values)
+        )
@@ -1,43 +1,326 @@
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, join, func, cast, Date
-from sqlalchemy.orm import selectinload, joinedload
-from typing import List, Optional
-from datetime import date
+from sqlalchemy import Row, select, insert, update, join, func, cast, Date, and_, or_
+from sqlalchemy.orm import aliased, selectinload, joinedload
+from typing import AsyncIterator, List, Optional, Tuple
+from datetime import UTC, date, datetime
+from decimal import Decimal
 
 from app.model._enum import OrderStatusEnum, ShipmentTypeEnum
 from app.model.quote import Quote, QuoteLocation, QuoteCargo, QuoteLocationAccessorial
-from ..schema.quote.request import CreateQuoteRequest
+from app.model.user import User, UserLevel
+from ..schema.cost import QuotePriceSchema
+from ..schema.quote.request import AdminQuoteFilter, CreateQuoteRequest
+from .quote_cargo import QUOTE_CARGO_FIELDS, build_quote_cargo
+from .quote_location import QUOTE_LOCATION_FIELDS, build_quote_location
+
+
+QUOTE_LIST_FIELDS = (
+    "id",
+    "user_id",
+    "cargo_transportation_id",
+    "is_priority",
+    "total_weight",
+    "base_price",
+    "extra_price",
+    "total_price",
+    "order_status",
+    "order_primary",
+    "order_additional_request",
+    "created_at",
+)
+QUOTE_LIST_LOCATION_FIELDS = (
+    "id",
+    "state",
+    "county",
+    "city",
+    "zip_code",
+    "address",
+    "request_datetime",
+)
+
+
+# 목록 쿼리의 출발지/도착지 별칭입니다. 관리자 검색 조건도 같은 별칭에 걸어야 하므로 모듈 수준에 둡니다.
+LIST_PICKUP_LOCATION = aliased(QuoteLocation, name="pickup")
+LIST_DELIVERY_LOCATION = aliased(QuoteLocation, name="delivery")
+
+
+def _build_quote_list_query():
+    """
+    목록 응답용 프로젝션 쿼리입니다. ORM 객체 대신 견적 컬럼(QUOTE_LIST_FIELDS), 출발지 컬럼, 도착지 컬럼
+    (QUOTE_LIST_LOCATION_FIELDS) 순서의 한 행으로 조회합니다. 출발지나 도착지가 없는 견적은 목록에서 제외됩니다.
+    """
+    pickup = LIST_PICKUP_LOCATION
+    delivery = LIST_DELIVERY_LOCATION
+    return (
+        select(
+            *(getattr(Quote, field) for field in QUOTE_LIST_FIELDS),
+            *(
+                getattr(pickup, field).label(f"from_{field}")
+                for field in QUOTE_LIST_LOCATION_FIELDS
+            ),
+            *(
+                getattr(delivery, field).label(f"to_{field}")
+                for field in QUOTE_LIST_LOCATION_FIELDS
+            ),
+        )
+        .join(
+            pickup,
+            and_(
+                pickup.quote_id == Quote.id,
+                pickup.shipment_type == ShipmentTypeEnum.PICKUP,
+            ),
+        )
+        .join(
+            delivery,
+            and_(
+                delivery.quote_id == Quote.id,
+                delivery.shipment_type == ShipmentTypeEnum.DELIVERY,
+            ),
+        )
+    )
+
+
+QUOTE_EXPORT_COLUMNS = (
+    "quote_id",
+    "user_id",
+    "order_status",
+    "order_primary",
+    "cargo_transportation_id",
+    "is_priority",
+    "total_weight",
+    "base_price",
+    "extra_price",
+    "total_price",
+    "created_at",
+    "pickup_state",
+    "pickup_city",
+    "pickup_zip_code",
+    "pickup_location_type",
+    "pickup_request_datetime",
+    "delivery_state",
+    "delivery_city",
+    "delivery_zip_code",
+    "delivery_location_type",
+    "delivery_request_datetime",
+    "cargo_count",
+    "cargo_quantity",
+    "cargo_weight",
+)
+
+
+def _build_quote_export_query():
+    """내보내기용 평면 컬럼(QUOTE_EXPORT_COLUMNS 순서) 쿼리입니다. 화물은 견적별 합계만 내보냅니다."""
+    pickup = aliased(QuoteLocation)
+    delivery = aliased(QuoteLocation)
+    cargo_totals = (
+        select(
+            QuoteCargo.quote_id,
+            func.count(QuoteCargo.id).label("cargo_count"),
+            func.sum(QuoteCargo.quantity).label("cargo_quantity"),
+            func.sum(QuoteCargo.weight * QuoteCargo.quantity).label("cargo_weight"),
+        )
+        .group_by(QuoteCargo.quote_id)
+        .subquery()
+    )
+    location_fields = ("state", "city", "zip_code", "location_type", "request_datetime")
+    return (
+        select(
+            Quote.id.label("quote_id"),
+            Quote.user_id,
+            Quote.order_status,
+            Quote.order_primary,
+            Quote.cargo_transportation_id,
+            Quote.is_priority,
+            Quote.total_weight,
+            Quote.base_price,
+            Quote.extra_price,
+            Quote.total_price,
+            Quote.created_at,
+            *(getattr(pickup, field).label(f"pickup_{field}") for field in location_fields),
+            *(
+                getattr(delivery, field).label(f"delivery_{field}")
+                for field in location_fields
+            ),
+            func.coalesce(cargo_totals.c.cargo_count, 0).label("cargo_count"),
+            func.coalesce(cargo_totals.c.cargo_quantity, 0).label("cargo_quantity"),
+            func.coalesce(cargo_totals.c.cargo_weight, 0).label("cargo_weight"),
+        )
+        .outerjoin(
+            pickup,
+            and_(
+                pickup.quote_id == Quote.id,
+                pickup.shipment_type == ShipmentTypeEnum.PICKUP,
+            ),
+        )
+        .outerjoin(
+            delivery,
+            and_(
+                delivery.quote_id == Quote.id,
+                delivery.shipment_type == ShipmentTypeEnum.DELIVERY,
+            ),
+        )
+        .outerjoin(cargo_totals, cargo_totals.c.quote_id == Quote.id)
+    )
+
+
+def _build_quote_summary_query():
+    """대시보드 집계용 견적 컬럼(상태, 생성 시각, 총액, 출발지/도착지 우편번호) 쿼리입니다."""
+    pickup = aliased(QuoteLocation)
+    delivery = aliased(QuoteLocation)
+    return (
+        select(
+            Quote.order_status,
+            Quote.created_at,
+            Quote.total_price,
+            pickup.zip_code.label("from_zip_code"),
+            delivery.zip_code.label("to_zip_code"),
+        )
+        .outerjoin(
+            pickup,
+            and_(
+                pickup.quote_id == Quote.id,
+                pickup.shipment_type == ShipmentTypeEnum.PICKUP,
+            ),
+        )
+        .outerjoin(
+            delivery,
+            and_(
+                delivery.quote_id == Quote.id,
+                delivery.shipment_type == ShipmentTypeEnum.DELIVERY,
+            ),
+        )
+    )
+
+
+# 요청마다 SELECT 구문을 다시 만들지 않도록 한 번만 구성해 재사용합니다.
+QUOTE_LIST_QUERY = _build_quote_list_query()
+QUOTE_EXPORT_QUERY = _build_quote_export_query()
+QUOTE_SUMMARY_QUERY = _build_quote_summary_query()
 
 
 class QuoteRepository:
     def __init__(self, db_session: AsyncSession):
         self.db_session = db_session
 
-    async def get_all_quotes(self, status: List[str]) -> List[Quote]:
-        result = await self.db_session.execute(
-            select(Quote)
-            .options(
-                selectinload(Quote.quote_location), selectinload(Quote.quote_cargo)
+    def _paginate(
+        self,
+        query,
+        limit: int,
+        cursor: Optional[Tuple[datetime, str]] = None,
+    ):
+        # created_at DESC, id DESC 키셋 페이지네이션입니다. 다음 페이지 여부를 알기 위해 한 건 더 조회합니다.
+        if cursor is not None:
+            cursor_created_at, cursor_id = cursor
+            query = query.where(
+                or_(
+                    Quote.created_at < cursor_created_at,
+                    and_(Quote.created_at == cursor_created_at, Quote.id < cursor_id),
+                )
+            )
+        return query.order_by(Quote.created_at.desc(), Quote.id.desc()).limit(limit + 1)
+
+    def _filter_admin_quotes(self, query, filters: AdminQuoteFilter):
+        # 조건마다 ix_quote_* 또는 ix_quote_location_* 인덱스를 탈 수 있는 등호/범위 조건만 사용합니다.
+        conditions = []
+        if filters.created_from is not None:
+            conditions.append(Quote.created_at >= filters.created_from)
+        if filters.created_to is not None:
+            conditions.append(Quote.created_at < filters.created_to)
+        if filters.user_id is not None:
+            conditions.append(Quote.user_id == filters.user_id)
+        if filters.cargo_transportation_id is not None:
+            conditions.append(
+                Quote.cargo_transportation_id == filters.cargo_transportation_id
             )
-            .where(Quote.order_status.in_(status))
+        if filters.is_priority is not None:
+            conditions.append(Quote.is_priority == filters.is_priority)
+        if filters.min_total_price is not None:
+            conditions.append(Quote.total_price >= filters.min_total_price)
+        if filters.max_total_price is not None:
+            conditions.append(Quote.total_price <= filters.max_total_price)
+        if filters.from_zip_code:
+            conditions.append(LIST_PICKUP_LOCATION.zip_code == filters.from_zip_code)
+        if filters.from_city:
+            conditions.append(LIST_PICKUP_LOCATION.city == filters.from_city)
+        if filters.to_zip_code:
+            conditions.append(LIST_DELIVERY_LOCATION.zip_code == filters.to_zip_code)
+        if filters.to_city:
+            conditions.append(LIST_DELIVERY_LOCATION.city == filters.to_city)
+        return query.where(*conditions) if conditions else query
+
+    async def get_all_quote_list_rows(
+        self,
+        status: List[str],
+        limit: int,
+        cursor: Optional[Tuple[datetime, str]] = None,
+        filters: Optional[AdminQuoteFilter] = None,
+    ) -> List[Row]:
+        query = QUOTE_LIST_QUERY.where(Quote.order_status.in_(status))
+        if filters is not None:
+            query = self._filter_admin_quotes(query, filters)
+        result = await self.db_session.execute(self._paginate(query, limit, cursor))
+        return result.all()
+
+    async def get_quote_etag_row(self, quote_id: str) -> Optional[Row]:
+        """ETag 계산용 견적 컬럼(사용자 ID, 버전)을 PK로 조회합니다."""
+        result = await self.db_session.execute(
+            select(Quote.user_id, Quote.version).where(Quote.id == quote_id)
         )
-        quotes = result.scalars().unique().all()
-        return quotes
+        return result.first()
 
-    async def get_quotes(self, user_id: int) -> List[Quote]:
+    async def get_quote_list_fingerprint(self, user_id: int) -> Row:
+        """사용자 견적 목록의 (견적 수, 최신 생성 시각, 버전 합계)를 ix_quote_user_version만 읽어 계산합니다."""
         result = await self.db_session.execute(
-            select(Quote)
-            .options(
-                selectinload(Quote.quote_location), selectinload(Quote.quote_cargo)
-            )
-            .where(Quote.user_id == user_id)
+            select(
+                func.count(),
+                func.max(Quote.created_at),
+                func.coalesce(func.sum(Quote.version), 0),
+            ).where(Quote.user_id == user_id)
+        )
+        return result.one()
+
+    async def get_quote_list_rows(
+        self,
+        user_id: int,
+        limit: int,
+        cursor: Optional[Tuple[datetime, str]] = None,
+    ) -> List[Row]:
+        query = QUOTE_LIST_QUERY.where(Quote.user_id == user_id)
+        result = await self.db_session.execute(self._paginate(query, limit, cursor))
+        return result.all()
+
+    async def stream_export_rows(
+        self, status: List[str], batch_size: int
+    ) -> AsyncIterator[List[Row]]:
+        """서버 측 커서(stream_results)로 내보내기 행을 batch_size 단위로 읽습니다."""
+        result = await self.db_session.stream(
+            QUOTE_EXPORT_QUERY.where(Quote.order_status.in_(status))
+            .order_by(Quote.created_at, Quote.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for rows in result.partitions():
+            yield rows
+
+    async def get_quote_summary_row(self, quote_id: str) -> Optional[Row]:
+        result = await self.db_session.execute(
+            QUOTE_SUMMARY_QUERY.where(Quote.id == quote_id)
         )
-        quotes = result.scalars().unique().all()
+        return result.first()
 
-        return quotes
+    async def stream_summary_rows(self, batch_size: int) -> AsyncIterator[List[Row]]:
+        """대시보드 재집계용 행을 서버 측 커서로 batch_size 단위로 읽습니다."""
+        result = await self.db_session.stream(
+            QUOTE_SUMMARY_QUERY.execution_options(yield_per=batch_size)
+        )
+        async for rows in result.partitions():
+            yield rows
 
     async def get_quote_by_id(self, quote_id: str) -> Optional[Quote]:
+        """
+        견적 집합체(위치 → 부가 서비스 → 추가 서비스 정보, 화물)를 고정된 4개의 쿼리로 적재합니다.
+        같은 세션에서 수정한 뒤 다시 조회해도 최신 값이 보이도록 populate_existing을 사용합니다.
+        """
         result = await self.db_session.execute(
             select(Quote)
             .options(
@@ -47,6 +330,7 @@ class QuoteRepository:
                 selectinload(Quote.quote_cargo),
             )
             .where(Quote.id == quote_id)
+            .execution_options(populate_existing=True)
         )
         quote = result.scalar_one_or_none()
 
@@ -61,6 +345,10 @@ class QuoteRepository:
         total_price_with_discount: float,
         quote_payload: CreateQuoteRequest,
     ) -> Quote:
+        """
+        견적 집합체(견적, 출발지/도착지와 각 부가 서비스, 화물)를 관계로 구성해 한 번의 flush로 저장합니다.
+        위치 ID는 flush 중에 채워지므로 저장 후 다시 조회하지 않습니다.
+        """
         quote_id = str(uuid.uuid4().hex.upper())
         new_quote = Quote(
             id=quote_id,
@@ -72,11 +360,100 @@ class QuoteRepository:
             extra_price=extra_price,
             total_price=total_price_with_discount,
             order_status=OrderStatusEnum.ESTIMATE,
+            quote_location=[
+                build_quote_location(
+                    quote_payload.from_location, ShipmentTypeEnum.PICKUP
+                ),
+                build_quote_location(
+                    quote_payload.to_location, ShipmentTypeEnum.DELIVERY
+                ),
+            ],
+            quote_cargo=[build_quote_cargo(cargo) for cargo in quote_payload.cargo],
         )
         self.db_session.add(new_quote)
         await self.db_session.flush()
         return new_quote
 
+    async def bulk_create_quotes(
+        self,
+        user_id: int,
+        priced_quotes: List[Tuple[CreateQuoteRequest, QuotePriceSchema]],
+    ) -> List[dict]:
+        """
+        여러 견적 집합체를 테이블별 다중 행 INSERT로 저장하고 저장한 견적 행을 반환합니다.
+        MySQL은 다중 행 INSERT의 ID를 돌려주지 않으므로, 부가 서비스를 연결할 위치 ID만 견적 ID 묶음으로 한 번 조회합니다.
+        """
+        if not priced_quotes:
+            return []
+
+        created_at = datetime.now(UTC)
+        quote_rows = []
+        location_rows = []
+        cargo_rows = []
+        accessorial_ids = {}
+        for quote_payload, quote_price in priced_quotes:
+            quote_id = str(uuid.uuid4().hex.upper())
+            quote_rows.append(
+                {
+                    "id": quote_id,
+                    "user_id": user_id,
+                    "cargo_transportation_id": quote_payload.cargo_transportation_id,
+                    "is_priority": quote_payload.is_priority,
+                    "total_weight": quote_price.total_weight,
+                    "base_price": quote_price.base_price,
+                    "extra_price": quote_price.extra_price,
+                    "total_price": quote_price.total_price,
+                    "order_status": OrderStatusEnum.ESTIMATE,
+                    "order_primary": None,
+                    "order_additional_request": None,
+                    "created_at": created_at,
+                }
+            )
+            for shipment_type, location in (
+                (ShipmentTypeEnum.PICKUP, quote_payload.from_location),
+                (ShipmentTypeEnum.DELIVERY, quote_payload.to_location),
+            ):
+                location_rows.append(
+                    {
+                        "quote_id": quote_id,
+                        "shipment_type": shipment_type,
+                        **location.model_dump(include=set(QUOTE_LOCATION_FIELDS)),
+                    }
+                )
+                accessorial_ids[(quote_id, shipment_type)] = [
+                    accessorial.cargo_accessorial_id
+                    for accessorial in location.accessorials
+                ]
+            cargo_rows.extend(
+                {
+                    "quote_id": quote_id,
+                    **cargo.model_dump(include=set(QUOTE_CARGO_FIELDS)),
+                }
+                for cargo in quote_payload.cargo
+            )
+
+        await self.db_session.execute(insert(Quote), quote_rows)
+        await self.db_session.execute(insert(QuoteLocation), location_rows)
+        if cargo_rows:
+            await self.db_session.execute(insert(QuoteCargo), cargo_rows)
+
+        if any(accessorial_ids.values()):
+            result = await self.db_session.execute(
+                select(
+                    QuoteLocation.id, QuoteLocation.quote_id, QuoteLocation.shipment_type
+                ).where(QuoteLocation.quote_id.in_([row["id"] for row in quote_rows]))
+            )
+            accessorial_rows = [
+                {"quote_location_id": location_id, "cargo_accessorial_id": accessorial_id}
+                for location_id, quote_id, shipment_type in result.all()
+                for accessorial_id in accessorial_ids[(quote_id, shipment_type)]
+            ]
+            await self.db_session.execute(
+                insert(QuoteLocationAccessorial), accessorial_rows
+            )
+
+        return quote_rows
+
     async def update_quote(
         self,
         quote_id: str,
@@ -95,13 +472,18 @@ class QuoteRepository:
             "base_price": base_price,
             "extra_price": extra_price,
             "total_price": total_price_with_discount,
+            "version": Quote.version + 1,
         }
 
-        await self.db_session.execute(
+        result = await self.db_session.execute(
             update(Quote)
             .where(Quote.id == quote_id, Quote.user_id == user_id)
             .values(**values)
         )
+        # 없거나 다른 사용자의 견적이면 수정된 행이 없습니다. (version이 항상 바뀌므로 값이 같아도 1건으로 집계됩니다)
+        # 호출자가 위치/화물을 수정하기 전에 None으로 알립니다.
+        if result.rowcount == 0:
+            return None
         await self.db_session.flush()
 
         return await self.get_quote_by_id(quote_id)
@@ -119,7 +501,11 @@ class QuoteRepository:
         await self.db_session.execute(
             update(Quote)
             .where(Quote.id == quote_id, Quote.user_id == user_id)
-            .values(order_status=OrderStatusEnum.SUBMIT, order_primary=order_primary)
+            .values(
+                order_status=OrderStatusEnum.SUBMIT,
+                order_primary=order_primary,
+                version=Quote.version + 1,
+            )
         )
         await self.db_session.flush()
 
@@ -127,6 +513,26 @@ class QuoteRepository:
         await self.db_session.execute(
             update(Quote)
             .where(Quote.id == quote_id)
-            .values(order_status=OrderStatusEnum.ACCEPT, total_price=actual_price)
+            .values(
+                order_status=OrderStatusEnum.ACCEPT,
+                total_price=actual_price,
+                version=Quote.version + 1,
+            )
         )
         await self.db_session.flush()
+
+    async def get_repricing_rows(self) -> List[Tuple[str, int, bool, Decimal, Decimal]]:
+        """재산정용 견적 컬럼(견적 ID, 운송 수단, 우선 처리 여부, 저장된 총액, 사용자 등급 할인율)을 조회합니다."""
+        result = await self.db_session.execute(
+            select(
+                Quote.id,
+                Quote.cargo_transportation_id,
+                Quote.is_priority,
+                Quote.total_price,
+                UserLevel.discount_rate,
+            )
+            .join(User, User.id == Quote.user_id)
+            .join(UserLevel, UserLevel.id == User.user_level_id)
+            .order_by(Quote.id)
+        )
+        return [tuple(row) for row in result.all()]
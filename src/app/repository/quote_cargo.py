@@ -1,36 +1,80 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
-from typing import List, Optional
+from sqlalchemy import Row, select, delete, insert, update
+from typing import List, Optional, Tuple
 
 from app.model.quote import QuoteCargo
+from ..schema._common import QuoteCargoSchema
+
+
+# 화물 스키마(QuoteCargoSchema)와 같은 순서의 화물 값 컬럼입니다.
+QUOTE_CARGO_FIELDS = (
+    "width",
+    "length",
+    "height",
+    "weight",
+    "quantity",
+    "package_description",
+    "cargo_stackable",
+    "cargo_temperature",
+    "is_hazardous",
+    "hazardous_detail",
+)
+# 목록 응답을 검증 없이 바로 직렬화하므로 QuoteCargoWithIDSchema의 필드 순서(id가 마지막)를 따릅니다.
+QUOTE_CARGO_LIST_FIELDS = QUOTE_CARGO_FIELDS + ("id",)
+
+
+def build_quote_cargo(cargo: QuoteCargoSchema) -> QuoteCargo:
+    """화물 스키마로 QuoteCargo를 만듭니다. 세션에는 추가하지 않습니다."""
+    return QuoteCargo(
+        width=cargo.width,
+        length=cargo.length,
+        height=cargo.height,
+        weight=cargo.weight,
+        quantity=cargo.quantity,
+        package_description=cargo.package_description,
+        cargo_stackable=cargo.cargo_stackable,
+        cargo_temperature=cargo.cargo_temperature,
+        is_hazardous=cargo.is_hazardous,
+        hazardous_detail=cargo.hazardous_detail,
+    )
 
 
 class QuoteCargoRepository:
     def __init__(self, db_session: AsyncSession):
         self.db_session = db_session
 
-    async def create_quote_cargo(
-        self, quote_id: int, quote_cargo: List[QuoteCargo]
-    ) -> List[QuoteCargo]:
-        quote_cargos = [
-            QuoteCargo(
-                quote_id=quote_id,
-                width=cargo.width,
-                length=cargo.length,
-                height=cargo.height,
-                weight=cargo.weight,
-                quantity=cargo.quantity,
-                package_description=cargo.package_description,
-                cargo_stackable=cargo.cargo_stackable,
-                cargo_temperature=cargo.cargo_temperature,
-                is_hazardous=cargo.is_hazardous,
-                hazardous_detail=cargo.hazardous_detail,
+    async def insert_quote_cargo(
+        self, quote_id: str, quote_cargo: List[QuoteCargoSchema]
+    ):
+        """화물 여러 건을 하나의 다중 행 INSERT로 추가합니다."""
+        if not quote_cargo:
+            return
+        await self.db_session.execute(
+            insert(QuoteCargo),
+            [
+                {
+                    "quote_id": quote_id,
+                    **cargo.model_dump(include=set(QUOTE_CARGO_FIELDS)),
+                }
+                for cargo in quote_cargo
+            ],
+        )
+
+    async def update_quote_cargo(self, rows: List[dict]):
+        """id를 포함한 화물 값 목록을 기본 키 기준 일괄 UPDATE 한 번으로 수정합니다."""
+        if not rows:
+            return
+        await self.db_session.execute(update(QuoteCargo), rows)
+
+    async def delete_quote_cargo_by_ids(self, quote_id: str, cargo_ids: List[int]):
+        """견적의 화물 중 지정한 ID의 화물을 DELETE 한 번으로 삭제합니다."""
+        if not cargo_ids:
+            return
+        await self.db_session.execute(
+            delete(QuoteCargo).where(
+                QuoteCargo.quote_id == quote_id, QuoteCargo.id.in_(cargo_ids)
             )
-            for cargo in quote_cargo
-        ]
-        self.db_session.add_all(quote_cargos)
-        await self.db_session.flush()
-        return quote_cargos
+        )
 
     async def get_quote_cargo(self, quote_id: str) -> List[QuoteCargo]:
         result = await self.db_session.execute(
@@ -38,9 +82,37 @@ class QuoteCargoRepository:
         )
         return result.scalars().all()
 
+    async def get_list_rows_by_quote_ids(self, quote_ids: List[str]) -> List[Row]:
+        """목록 응답용 화물 컬럼을 견적 ID 묶음으로 한 번에 조회합니다."""
+        if not quote_ids:
+            return []
+        result = await self.db_session.execute(
+            select(
+                QuoteCargo.quote_id,
+                *(getattr(QuoteCargo, field) for field in QUOTE_CARGO_LIST_FIELDS),
+            )
+            .where(QuoteCargo.quote_id.in_(quote_ids))
+            .order_by(QuoteCargo.id)
+        )
+        return result.all()
+
     async def delete_quote_cargo(self, quote_id: str):
         """견적 ID에 해당하는 모든 화물 정보를 삭제합니다."""
         await self.db_session.execute(
             delete(QuoteCargo).where(QuoteCargo.quote_id == quote_id)
         )
         await self.db_session.flush()
+
+    async def get_repricing_rows(self) -> List[Tuple[str, int, int, int, int, int]]:
+        """재산정용 화물 컬럼(견적 ID, 무게, 수량, 가로, 높이, 길이)을 조회합니다."""
+        result = await self.db_session.execute(
+            select(
+                QuoteCargo.quote_id,
+                QuoteCargo.weight,
+                QuoteCargo.quantity,
+                QuoteCargo.width,
+                QuoteCargo.height,
+                QuoteCargo.length,
+            )
+        )
+        return [tuple(row) for row in result.all()]
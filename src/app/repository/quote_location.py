@@ -1,9 +1,42 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 
-from app.model.quote import QuoteLocation
-from app.model._enum import ShipmentTypeEnum
+from app.model.quote import QuoteLocation, QuoteLocationAccessorial
+from app.model._enum import LocationTypeEnum, ShipmentTypeEnum
+from ..schema._common import QuoteLocationSchema
+
+# 견적 수정 시 요청 값으로 덮어쓰는 위치 컬럼입니다.
+QUOTE_LOCATION_FIELDS = (
+    "state",
+    "county",
+    "city",
+    "zip_code",
+    "address",
+    "location_type",
+    "request_datetime",
+)
+
+
+def build_quote_location(
+    location: QuoteLocationSchema, shipment_type: ShipmentTypeEnum
+) -> QuoteLocation:
+    """위치 스키마로 부가 서비스를 포함한 QuoteLocation을 만듭니다. 세션에는 추가하지 않습니다."""
+    return QuoteLocation(
+        state=location.state,
+        county=location.county,
+        city=location.city,
+        zip_code=location.zip_code,
+        address=location.address,
+        location_type=location.location_type,
+        shipment_type=shipment_type,
+        request_datetime=location.request_datetime,
+        quote_location_accessorial=[
+            QuoteLocationAccessorial(cargo_accessorial_id=accessorial.cargo_accessorial_id)
+            for accessorial in location.accessorials
+        ],
+    )
 
 
 class QuoteLocationRepository:
@@ -37,38 +70,11 @@ class QuoteLocationRepository:
         )
         return result.scalar_one_or_none()
 
-    async def create_quote_location(
-        self,
-        quote_id: int,
-        quote_location: QuoteLocation,
-        shipment_type: ShipmentTypeEnum,
-    ) -> QuoteLocation:
-        quote_location = QuoteLocation(
-            quote_id=quote_id,
-            state=quote_location.state,
-            county=quote_location.county,
-            city=quote_location.city,
-            zip_code=quote_location.zip_code,
-            address=quote_location.address,
-            location_type=quote_location.location_type,
-            shipment_type=shipment_type,
-            request_datetime=quote_location.request_datetime,
-        )
-        self.db_session.add(quote_location)
-        await self.db_session.flush()
-        return quote_location
-
     async def update_quote_location(
-        self, quote_location_id: int, quote_location: dict
-    ) -> QuoteLocation:
+        self, quote_location_id: int, quote_location: QuoteLocationSchema
+    ):
         values = {
-            "state": quote_location.state,
-            "county": quote_location.county,
-            "city": quote_location.city,
-            "zip_code": quote_location.zip_code,
-            "address": quote_location.address,
-            "location_type": quote_location.location_type,
-            "request_datetime": quote_location.request_datetime,
+            field: getattr(quote_location, field) for field in QUOTE_LOCATION_FIELDS
         }
 
         await self.db_session.execute(
@@ -78,4 +84,18 @@ class QuoteLocationRepository:
         )
         await self.db_session.flush()
 
-        return await self.get_quote_location_by_id(quote_location_id)
+    async def get_repricing_rows(
+        self,
+    ) -> List[Tuple[int, str, str, LocationTypeEnum, ShipmentTypeEnum, datetime]]:
+        """재산정용 위치 컬럼(위치 ID, 견적 ID, 우편번호, 위치 유형, 배송 유형, 요청 일시)을 조회합니다."""
+        result = await self.db_session.execute(
+            select(
+                QuoteLocation.id,
+                QuoteLocation.quote_id,
+                QuoteLocation.zip_code,
+                QuoteLocation.location_type,
+                QuoteLocation.shipment_type,
+                QuoteLocation.request_datetime,
+            )
+        )
+        return [tuple(row) for row in result.all()]
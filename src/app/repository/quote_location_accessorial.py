@@ -1,7 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import delete, select
 from sqlalchemy.orm import joinedload
-from typing import List, Set
+from typing import List, Set, Tuple
 
 from app.model.quote import QuoteLocationAccessorial
 from ..schema._common import QuoteLocationAccessorialSchema
@@ -71,3 +71,13 @@ class QuoteLocationAccessorialRepository:
             )
         )
         await self.db_session.flush()
+
+    async def get_repricing_rows(self) -> List[Tuple[int, int]]:
+        """재산정용 위치별 추가 서비스 컬럼(위치 ID, 추가 서비스 ID)을 조회합니다."""
+        result = await self.db_session.execute(
+            select(
+                QuoteLocationAccessorial.quote_location_id,
+                QuoteLocationAccessorial.cargo_accessorial_id,
+            )
+        )
+        return [tuple(row) for row in result.all()]
@@ -0,0 +1,49 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from typing import Dict, List, Tuple
+from datetime import date
+from decimal import Decimal
+
+from app.model._enum import OrderStatusEnum
+from app.model.quote import QuoteSummary
+
+
+class QuoteSummaryRepository:
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def get_all_summaries(
+        self, for_update: bool = False
+    ) -> List[Tuple[OrderStatusEnum, int, date, int, Decimal]]:
+        """
+        집계 컬럼(상태, 구역, 주 시작일, 견적 수, 금액 합계)을 조회합니다.
+        for_update면 전체 행(과 행 사이 간격)을 잠가 다른 트랜잭션의 증감분 반영이 커밋까지 기다리게 합니다.
+        """
+        query = select(
+            QuoteSummary.order_status,
+            QuoteSummary.area_id,
+            QuoteSummary.week_start,
+            QuoteSummary.quote_count,
+            QuoteSummary.total_price,
+        )
+        if for_update:
+            query = query.with_for_update()
+        result = await self.db_session.execute(query)
+        return result.all()
+
+    async def apply_summary_deltas(self, rows: List[Dict]) -> None:
+        # 같은 키의 행이 있으면 증감분만 더하므로 동시에 들어온 변경끼리 덮어쓰지 않습니다.
+        statement = mysql_insert(QuoteSummary).values(rows)
+        statement = statement.on_duplicate_key_update(
+            quote_count=QuoteSummary.quote_count + statement.inserted.quote_count,
+            total_price=QuoteSummary.total_price + statement.inserted.total_price,
+        )
+        await self.db_session.execute(statement)
+
+    async def delete_empty_summaries(self) -> None:
+        await self.db_session.execute(
+            delete(QuoteSummary).where(
+                QuoteSummary.quote_count == 0, QuoteSummary.total_price == 0
+            )
+        )
@@ -1,6 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from typing import Optional
+from typing import List, Optional
 from ..model.rate import RateArea, RateLocation
 
 
@@ -16,3 +16,15 @@ class RateAreaRepository:
         )
         result = await self.db_session.execute(query)
         return result.scalar_one_or_none()
+
+    async def get_all_areas(self) -> List[RateArea]:
+        query = select(RateArea).order_by(RateArea.id)
+        result = await self.db_session.execute(query)
+        return result.scalars().all()
+
+    async def get_areas_by_region(self, region_id: int) -> List[RateArea]:
+        query = (
+            select(RateArea).where(RateArea.region_id == region_id).order_by(RateArea.id)
+        )
+        result = await self.db_session.execute(query)
+        return result.scalars().all()
@@ -12,3 +12,10 @@ class RateAreaCostRepository:
         query = select(RateAreaCost).where(RateAreaCost.area_id == area_id)
         result = await self.db_session.execute(query)
         return result.scalars().all()
+
+    async def get_all_area_costs(self) -> List[RateAreaCost]:
+        query = select(RateAreaCost).order_by(
+            RateAreaCost.area_id, RateAreaCost.min_weight
+        )
+        result = await self.db_session.execute(query)
+        return result.scalars().all()
@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from typing import List, Optional
+from sqlalchemy.dialects.mysql import insert
+from typing import Dict, List, Optional, Tuple
 from ..model.rate import RateLocation, RateArea, RateAreaCost
 
 
@@ -23,4 +24,32 @@ class RateLocationRepository:
             query = query.where(RateLocation.zip_code == zip_code)
 
         result = await self.db_session.execute(query)
-        return result.scalars().all()
\ No newline at end of file
+        return result.scalars().all()
+
+    async def get_all_rate_locations(
+        self,
+    ) -> List[Tuple[int, int, int, str, str, str, str]]:
+        """스냅샷용 위치 컬럼(ID, 구역, 지역, 주, 카운티, 도시, 우편번호)을 조회합니다."""
+        query = select(
+            RateLocation.id,
+            RateLocation.area_id,
+            RateLocation.region_id,
+            RateLocation.state,
+            RateLocation.county,
+            RateLocation.city,
+            RateLocation.zip_code,
+        ).order_by(RateLocation.id)
+        result = await self.db_session.execute(query)
+        return result.all()
+
+    async def upsert_rate_locations(self, rows: List[Dict]) -> None:
+        # (region_id, zip_code)가 이미 있으면 구역과 주소 정보만 갱신합니다.
+        statement = insert(RateLocation).values(rows)
+        statement = statement.on_duplicate_key_update(
+            area_id=statement.inserted.area_id,
+            state=statement.inserted.state,
+            county=statement.inserted.county,
+            city=statement.inserted.city,
+            updated_at=statement.inserted.updated_at,
+        )
+        await self.db_session.execute(statement)
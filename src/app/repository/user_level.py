@@ -1,3 +1,4 @@
+from typing import List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from ..model.user import UserLevel
@@ -14,3 +15,8 @@ class UserLevelRepository:
         query = select(UserLevel).where(UserLevel.id == id)
         result = await self.db_session.execute(query)
         return result.scalar_one_or_none()
+
+    async def get_all_levels(self) -> List[UserLevel]:
+        query = select(UserLevel).order_by(UserLevel.id)
+        result = await self.db_session.execute(query)
+        return list(result.scalars().all())
@@ -1,3 +1,4 @@
+from .request import CreateCargoAccessorialRequest
 from .response import (   
     CargoTransportationResponse,
     CargoAccessorialResponse,
@@ -5,6 +6,7 @@ from .response import (
 )
 
 __all__ = [
+    "CreateCargoAccessorialRequest",
     "CargoTransportationResponse",
     "CargoAccessorialResponse",
     "CargoPackageResponse",
@@ -0,0 +1,13 @@
+from decimal import Decimal
+from typing import Optional
+from .._base import BaseSchema
+from ...model._enum import AccessorialPricingTypeEnum
+
+
+class CreateCargoAccessorialRequest(BaseSchema):
+    name: str
+    description: str
+    pricing_type: AccessorialPricingTypeEnum
+    price: Decimal
+    min_price: Optional[Decimal] = None
+    max_price: Optional[Decimal] = None
@@ -1,6 +1,8 @@
+from decimal import Decimal
 from typing import Optional
 from .._base import IntegerIDSchema
 from .._common import BaseSchema
+from ...model._enum import AccessorialPricingTypeEnum
 
 class CargoTransportationResponse(IntegerIDSchema, BaseSchema):
     name: str
@@ -10,6 +12,10 @@ class CargoTransportationResponse(IntegerIDSchema, BaseSchema):
 class CargoAccessorialResponse(IntegerIDSchema, BaseSchema):
     name: str
     description: str
+    pricing_type: AccessorialPricingTypeEnum
+    price: Decimal
+    min_price: Optional[Decimal] = None
+    max_price: Optional[Decimal] = None
 
 
 class CargoPackageResponse(IntegerIDSchema, BaseSchema):
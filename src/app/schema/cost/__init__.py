@@ -3,6 +3,8 @@ from .response import (
     ExtraCostSchema,
     LocationCostSchema,
     DiscountCostSchema,
+    QuotePriceSchema,
+    PricingCacheStatsResponse,
 )
 
 __all__ = [
@@ -10,4 +12,6 @@ __all__ = [
     "ExtraCostSchema",
     "LocationCostSchema",
     "DiscountCostSchema",
+    "QuotePriceSchema",
+    "PricingCacheStatsResponse",
 ]
@@ -19,3 +19,19 @@ class LocationCostSchema(CostModelSchema):
 class DiscountCostSchema(CostModelSchema):
   pass
 
+
+class QuotePriceSchema(BaseSchema):
+    total_weight: Decimal
+    base_price: Decimal
+    location_type_price: Decimal
+    service_price: Decimal
+    extra_price: Decimal
+    total_price: Decimal
+
+
+class PricingCacheStatsResponse(BaseSchema):
+    size: int
+    max_size: int
+    ttl_seconds: int
+    hits: int
+    misses: int
@@ -1,5 +1,18 @@
-from .request import CreateQuoteRequest, UpdateQuoteRequest, ConfirmQuoteRequest
-from .response import GetQuoteDetailsResponse, GetQuotesResponse
+from .request import (
+    CreateQuoteRequest,
+    UpdateQuoteRequest,
+    ConfirmQuoteRequest,
+    BatchQuotePriceRequest,
+    BulkCreateQuoteRequest,
+    AdminQuoteFilter,
+)
+from .response import (
+    GetQuoteDetailsResponse,
+    GetQuotesResponse,
+    BatchQuotePriceResponse,
+    BulkCreateQuoteResponse,
+    QuoteDashboardResponse,
+)
 
 __all__ = [
     "CreateQuoteRequest",
@@ -7,4 +20,10 @@ __all__ = [
     "GetQuoteDetailsResponse",
     "GetQuotesResponse",
     "ConfirmQuoteRequest",
+    "BatchQuotePriceRequest",
+    "BatchQuotePriceResponse",
+    "BulkCreateQuoteRequest",
+    "BulkCreateQuoteResponse",
+    "AdminQuoteFilter",
+    "QuoteDashboardResponse",
 ]
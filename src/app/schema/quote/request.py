@@ -1,4 +1,6 @@
-from typing import List
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional
 from app.schema._common import QuoteLocationSchema, QuoteCargoSchema
 from app.schema._base import BaseSchema
 
@@ -11,13 +13,42 @@ class CreateQuoteRequest(BaseSchema):
     cargo: List[QuoteCargoSchema]
 
 
+class UpdateQuoteCargoSchema(QuoteCargoSchema):
+    # 기존 화물은 상세 응답의 화물 ID를 함께 보냅니다. ID가 없으면 새 화물로 추가하고, 요청에 없는 기존 화물은 삭제합니다.
+    id: Optional[int] = None
+
+
 class UpdateQuoteRequest(BaseSchema):
     cargo_transportation_id: int
     is_priority: bool
     from_location: QuoteLocationSchema
     to_location: QuoteLocationSchema
-    cargo: List[QuoteCargoSchema]
+    cargo: List[UpdateQuoteCargoSchema]
 
 
 class ConfirmQuoteRequest(BaseSchema):
-    actual_price: float
\ No newline at end of file
+    actual_price: float
+
+
+class BatchQuotePriceRequest(BaseSchema):
+    quotes: List[CreateQuoteRequest]
+
+
+class BulkCreateQuoteRequest(BaseSchema):
+    quotes: List[CreateQuoteRequest]
+
+
+class AdminQuoteFilter(BaseSchema):
+    """관리자 견적 목록 검색 조건입니다. 값이 없는 조건은 적용하지 않습니다."""
+
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+    user_id: Optional[int] = None
+    from_zip_code: Optional[str] = None
+    from_city: Optional[str] = None
+    to_zip_code: Optional[str] = None
+    to_city: Optional[str] = None
+    cargo_transportation_id: Optional[int] = None
+    is_priority: Optional[bool] = None
+    min_total_price: Optional[Decimal] = None
+    max_total_price: Optional[Decimal] = None
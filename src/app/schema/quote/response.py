@@ -1,7 +1,11 @@
-from datetime import datetime
-from typing import List
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List, Optional
+from ...core.exceptions import ErrorDetail
+from ...model._enum import OrderStatusEnum
 from ...schema._common import BaseQuoteSchema, QuoteLocationSchema, QuoteCargoSchema
 from ...schema._base import BaseSchema, IntegerIDSchema, StringIDSchema
+from ...schema.cost import QuotePriceSchema
 
 
 class QuoteLocationWithIDSchema(IntegerIDSchema, QuoteLocationSchema):
@@ -29,3 +33,39 @@ class GetQuotesResponse(BaseQuoteSchema):
     from_location: GetQuotesLocationSchema
     to_location: GetQuotesLocationSchema
     cargo: List[QuoteCargoWithIDSchema]
+
+
+class BatchQuotePriceResponse(BaseSchema):
+    index: int
+    price: Optional[QuotePriceSchema] = None
+    error: Optional[ErrorDetail] = None
+
+
+class BulkCreateQuoteResponse(BaseSchema):
+    index: int
+    quote: Optional[BaseQuoteSchema] = None
+    error: Optional[ErrorDetail] = None
+
+
+class QuoteSummaryCountSchema(BaseSchema):
+    quote_count: int
+    total_price: Decimal
+
+
+class QuoteStatusSummarySchema(QuoteSummaryCountSchema):
+    order_status: OrderStatusEnum
+
+
+class QuoteAreaSummarySchema(QuoteSummaryCountSchema):
+    area_id: int
+    area_name: Optional[str] = None
+
+
+class QuoteWeekSummarySchema(QuoteSummaryCountSchema):
+    week_start: date
+
+
+class QuoteDashboardResponse(BaseSchema):
+    by_status: List[QuoteStatusSummarySchema]
+    by_area: List[QuoteAreaSummarySchema]
+    by_week: List[QuoteWeekSummarySchema]
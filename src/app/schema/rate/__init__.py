@@ -1,3 +1,7 @@
-from .response import RateLocationResponse
+from .response import (
+    RateLocationImportResponse,
+    RateLocationResponse,
+    RateSnapshotResponse,
+)
 
-__all__ = ["RateLocationResponse"]
+__all__ = ["RateLocationImportResponse", "RateLocationResponse", "RateSnapshotResponse"]
@@ -1,5 +1,25 @@
+from datetime import datetime
+from typing import List
 from .._common import BaseRateLocationSchema
-from .._base import IntegerIDSchema
+from .._base import BaseSchema, IntegerIDSchema
 
 class RateLocationResponse(IntegerIDSchema, BaseRateLocationSchema):
     pass
+
+
+class RateSnapshotResponse(BaseSchema):
+    version: int
+    loaded_at: datetime
+    area_count: int
+    zip_code_count: int
+
+
+class RateLocationImportResponse(BaseSchema):
+    region_id: int
+    rows_read: int
+    rows_upserted: int
+    rows_skipped: int
+    unknown_areas: List[str]
+    elapsed_seconds: float
+    rows_per_second: float
+    rate_snapshot_version: int
@@ -2,6 +2,8 @@ from .user import UserService
 from .auth import AuthService
 from .cargo import CargoService
 from .quote import QuoteService
+from .quote_export import QuoteExportService
+from .quote_summary import QuoteSummaryService
 from .rate import RateService
 from .cost import CostService
 from .cost_builder import *
@@ -11,6 +13,8 @@ __all__ = [
     "AuthService",
     "CargoService",
     "QuoteService",
+    "QuoteExportService",
+    "QuoteSummaryService",
     "RateService",
     "CostService",
     "BaseCostBuilder",
@@ -16,6 +16,7 @@ from ..core.jwt import create_access_token, create_refresh_token
 from ..db.unit_of_work import UnitOfWork
 from ..core.exceptions import AuthException, NotFoundException
 from ..core.config import settings
+from .user_level_snapshot import UserLevelSnapshot, user_level_store
 
 
 class AuthService:
@@ -74,6 +75,18 @@ class AuthService:
             },
         }
 
+    def _build_token_data(
+        self, user_id: int, role_id: int, user_level: UserLevel
+    ) -> dict:
+        # 운임 계산 시 DB 조회를 건너뛸 수 있도록 등급과 할인율을 클레임으로 함께 싣습니다.
+        level_snapshot = UserLevelSnapshot.from_model(user_level)
+        user_level_store.put(level_snapshot)
+        return {
+            "sub": str(user_id),
+            "role_id": role_id,
+            **level_snapshot.to_claims(),
+        }
+
     async def login(self, request: LoginRequest, response: Response) -> LoginResponse:
         async with self.uow:
             user = await self.uow.user.get_user_by_email(request.email)
@@ -83,17 +96,16 @@ class AuthService:
             if not verify_password(request.password, user.password):
                 raise AuthException(message="비밀번호가 일치하지 않습니다.")
 
-            token_data = {"sub": str(user.id), "role_id": user.role_id}
+            user_level = await self.uow.user_level.get_level_by_id(user.user_level_id)
+            if not user_level:
+                raise NotFoundException(message="유효하지 않은 사용자 레벨입니다.")
+
+            token_data = self._build_token_data(user.id, user.role_id, user_level)
             access_token_info = create_access_token(data=token_data)
             refresh_token_info = create_refresh_token(data=token_data)
 
             self._set_refresh_token_cookie(response, refresh_token_info)
 
-        async with self.uow:
-            user_level = await self.uow.user_level.get_level_by_id(user.user_level_id)
-            if not user_level:
-                raise NotFoundException(message="유효하지 않은 사용자 레벨입니다.")
-
             user_data_dict = self._prepare_auth_user_data(
                 user, user_level, access_token_info
             )
@@ -104,20 +116,19 @@ class AuthService:
     ) -> RefreshTokenResponse:
         async with self.uow:
             user = await self.uow.user.get_user_by_id(user_id)
-        if not user:
-            raise NotFoundException(message="사용자를 찾을 수 없습니다.")
+            if not user:
+                raise NotFoundException(message="사용자를 찾을 수 없습니다.")
+
+            user_level = await self.uow.user_level.get_level_by_id(user.user_level_id)
+        if not user_level:
+            raise NotFoundException(message="유효하지 않은 사용자 레벨입니다.")
 
-        new_token_data = {"sub": str(user_id), "role_id": role_id}
+        new_token_data = self._build_token_data(user_id, role_id, user_level)
         new_access_token_info = create_access_token(data=new_token_data)
         new_refresh_token_info = create_refresh_token(data=new_token_data)
 
         self._set_refresh_token_cookie(response, new_refresh_token_info)
 
-        async with self.uow:
-            user_level = await self.uow.user_level.get_level_by_id(user.user_level_id)
-        if not user_level:
-            raise NotFoundException(message="유효하지 않은 사용자 레벨입니다.")
-
         user_data_dict = self._prepare_auth_user_data(
             user, user_level, new_access_token_info
         )
@@ -1,29 +1,53 @@
-from ..schema.cargo import CargoTransportationResponse, CargoAccessorialResponse, CargoPackageResponse
+from ..schema.cargo import (
+    CargoAccessorialResponse,
+    CreateCargoAccessorialRequest,
+)
 from ..db.unit_of_work import UnitOfWork
-from typing import List
+from ..core.exceptions import BadRequestException, ForbiddenException
+from .cargo_snapshot import CachedJSONBody, cargo_snapshot_store
+from .rate_snapshot import rate_snapshot_store
 
 
 class CargoService:
     def __init__(self, uow: UnitOfWork):
         self.uow = uow
 
-    async def get_cargo_transportation(
-        self,
-    ) -> List[CargoTransportationResponse]:
-        async with self.uow:
-            locations = await self.uow.cargo.get_cargo_transportation()
-            return [CargoTransportationResponse.model_validate(loc) for loc in locations]
+    # 기준 정보 조회는 캐시에 미리 직렬화해 둔 응답 본문을 돌려줍니다. (캐시가 비어 있을 때만 DB를 읽습니다)
+    async def get_cargo_transportation(self) -> CachedJSONBody:
+        return (await cargo_snapshot_store.get(self.uow)).transportation
 
-    async def get_cargo_accessorial(
-        self,
-    ) -> List[CargoAccessorialResponse]:
-        async with self.uow:
-            accessorials = await self.uow.cargo.get_cargo_accessorial()
-            return [CargoAccessorialResponse.model_validate(acc) for acc in accessorials]
+    async def get_cargo_accessorial(self) -> CachedJSONBody:
+        return (await cargo_snapshot_store.get(self.uow)).accessorial
+
+    async def create_cargo_accessorial(
+        self, role_id: int, accessorial_data: CreateCargoAccessorialRequest
+    ) -> CargoAccessorialResponse:
+        if role_id != 2:
+            raise ForbiddenException(message="Forbidden:: Admin only")
+
+        prices = [
+            accessorial_data.price,
+            accessorial_data.min_price,
+            accessorial_data.max_price,
+        ]
+        if any(price is not None and price < 0 for price in prices):
+            raise BadRequestException(message="추가 서비스 금액은 0 이상이어야 합니다.")
+        if (
+            accessorial_data.min_price is not None
+            and accessorial_data.max_price is not None
+            and accessorial_data.min_price > accessorial_data.max_price
+        ):
+            raise BadRequestException(message="최소 금액이 최대 금액보다 클 수 없습니다.")
 
-    async def get_cargo_package(
-        self,
-    ) -> List[CargoPackageResponse]:
         async with self.uow:
-            packages = await self.uow.cargo.get_cargo_package()
-            return [CargoPackageResponse.model_validate(pkg) for pkg in packages]
+            accessorial = await self.uow.cargo.create_cargo_accessorial(accessorial_data)
+            response = CargoAccessorialResponse.model_validate(accessorial)
+
+        # 신규 추가 서비스가 바로 운임 계산과 기준 정보 응답에 반영되도록 스냅샷을 다시 적재합니다.
+        cargo_snapshot_store.invalidate()
+        await rate_snapshot_store.load(self.uow)
+        await cargo_snapshot_store.load(self.uow)
+        return response
+
+    async def get_cargo_package(self) -> CachedJSONBody:
+        return (await cargo_snapshot_store.get(self.uow)).package
@@ -0,0 +1,94 @@
+import asyncio
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Type
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from ..core.etag import build_etag
+from ..db.unit_of_work import UnitOfWork
+from ..schema._base import BaseSchema
+from ..schema.cargo import (
+    CargoAccessorialResponse,
+    CargoPackageResponse,
+    CargoTransportationResponse,
+)
+
+
+@dataclass(frozen=True)
+class CachedJSONBody:
+    """미리 직렬화한 JSON 응답 본문과 본문 해시로 만든 ETag입니다. 워커가 달라도 본문이 같으면 ETag도 같습니다."""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_models(
+        cls, schema: Type[BaseSchema], models: Sequence[object]
+    ) -> "CachedJSONBody":
+        # response_model을 거친 응답과 같은 바이트가 되도록 FastAPI와 같은 방식으로 직렬화합니다.
+        items: List[BaseSchema] = [schema.model_validate(model) for model in models]
+        body = JSONResponse(content=jsonable_encoder(items)).body
+        return cls(body=body, etag=build_etag(body.decode("utf-8")))
+
+
+@dataclass(frozen=True)
+class CargoSnapshot:
+    """견적 입력 화면의 기준 정보(운송 수단, 추가 서비스, 포장 종류) 응답 캐시입니다."""
+
+    version: int
+    transportation: CachedJSONBody
+    accessorial: CachedJSONBody
+    package: CachedJSONBody
+
+
+class CargoSnapshotStore:
+    """
+    프로세스 내 기준 정보 캐시입니다. 서버 시작 시 적재하고, 관리자 경로에서 기준 정보를 바꾸면 다시 적재합니다.
+    적재된 뒤의 조회는 DB를 사용하지 않습니다.
+    """
+
+    def __init__(self):
+        self._snapshot: Optional[CargoSnapshot] = None
+        self._version = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def snapshot(self) -> Optional[CargoSnapshot]:
+        return self._snapshot
+
+    async def get(self, uow: UnitOfWork) -> CargoSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = await self.load(uow)
+        return snapshot
+
+    async def load(self, uow: UnitOfWork) -> CargoSnapshot:
+        async with self._lock:
+            async with uow:
+                transportation_models = await uow.cargo.get_cargo_transportation()
+                accessorial_models = await uow.cargo.get_cargo_accessorial()
+                package_models = await uow.cargo.get_cargo_package()
+
+                snapshot = CargoSnapshot(
+                    version=self._version + 1,
+                    transportation=CachedJSONBody.from_models(
+                        CargoTransportationResponse, transportation_models
+                    ),
+                    accessorial=CachedJSONBody.from_models(
+                        CargoAccessorialResponse, accessorial_models
+                    ),
+                    package=CachedJSONBody.from_models(
+                        CargoPackageResponse, package_models
+                    ),
+                )
+            self._version = snapshot.version
+            self._snapshot = snapshot
+            return snapshot
+
+    def invalidate(self):
+        # 다음 조회에서 DB를 다시 읽습니다.
+        self._snapshot = None
+
+
+cargo_snapshot_store = CargoSnapshotStore()
@@ -1,9 +1,16 @@
 from decimal import Decimal
-from typing import List
+from typing import Dict, List, Mapping, Tuple, Union
 
+from ..core.auth import TokenData
 from ..db.unit_of_work import UnitOfWork
 from ..schema import QuoteLocationSchema, QuoteCargoSchema
+from ..schema.quote import (
+    CreateQuoteRequest,
+    UpdateQuoteRequest,
+    BatchQuotePriceResponse,
+)
 from ..service.cost_builder import (
+    AccessorialRule,
     BaseCostBuilder,
     ExtraCostBuilder,
     LocationCostBuilder,
@@ -14,11 +21,31 @@ from ..schema.cost import (
     DiscountCostSchema,
     ExtraCostSchema,
     LocationCostSchema,
+    QuotePriceSchema,
+    PricingCacheStatsResponse,
+)
+from ..service.cost_builder import fixed_point
+from ..core.cache import LRUTTLCache
+from ..core.config import settings
+from ..core.exceptions import (
+    AppException,
+    BadRequestException,
+    ForbiddenException,
+    NotFoundException,
+)
+from .rate_snapshot import RateAreaSnapshot, RateSnapshot, rate_snapshot_store
+from .user_level_snapshot import UserLevelSnapshot, user_level_store
+
+
+quote_price_cache: LRUTTLCache[QuotePriceSchema] = LRUTTLCache(
+    maxsize=settings.PRICING_CACHE_MAX_SIZE,
+    ttl_seconds=settings.PRICING_CACHE_TTL_SECONDS,
 )
-from ..core.exceptions import NotFoundException
 
 
 class CostService:
+    FSC = Decimal("0.35")
+
     def __init__(
         self,
         uow: UnitOfWork,
@@ -33,53 +60,60 @@ class CostService:
         from_location: QuoteLocationSchema,
         to_location: QuoteLocationSchema,
     ) -> BaseCostSchema:
-        builder = BaseCostBuilder(fsc=Decimal("0.35"))
-        async with self.uow:
-            for cargo in cargo_list:
-                builder.set_freight_weight(
-                    cargo.weight, cargo.quantity, cargo.width, cargo.height, cargo.length
-                )
+        rate_snapshot = await rate_snapshot_store.get(self.uow)
+        base_area = self._get_base_area(
+            rate_snapshot, from_location.zip_code, to_location.zip_code
+        )
+        return self._calculate_base_cost(cargo_transportation_id, cargo_list, base_area)
 
-            from_location_area = await self.uow.rate_area.get_area_by_zip_code(
-                from_location.zip_code
-            )
-            to_location_area = await self.uow.rate_area.get_area_by_zip_code(
-                to_location.zip_code
-            )
+    def _get_base_area(
+        self, rate_snapshot: RateSnapshot, from_zip_code: str, to_zip_code: str
+    ) -> RateAreaSnapshot:
+        from_location_area = rate_snapshot.get_area_by_zip_code(from_zip_code)
+        to_location_area = rate_snapshot.get_area_by_zip_code(to_zip_code)
 
-            if from_location_area is None or to_location_area is None:
-                raise NotFoundException(message="지역 요율 정보를 찾을 수 없습니다.")
+        if from_location_area is None or to_location_area is None:
+            raise NotFoundException(message="지역 요율 정보를 찾을 수 없습니다.")
 
-            base_area = (
-                from_location_area
-                if from_location_area.id >= to_location_area.id
-                else to_location_area
-            )
-            builder.set_location_rate(
-                min_load=base_area.min_load,
-                max_load=base_area.max_load,
-                max_load_weight=base_area.max_load_weight,
-            )
-            base_area_id = base_area.id
-            area_costs = await self.uow.rate_area_cost.get_area_costs(
-                base_area_id
+        return (
+            from_location_area
+            if from_location_area.id >= to_location_area.id
+            else to_location_area
+        )
+
+    def _calculate_base_cost(
+        self,
+        cargo_transportation_id: int,
+        cargo_list: List[QuoteCargoSchema],
+        base_area: RateAreaSnapshot,
+    ) -> BaseCostSchema:
+        builder = BaseCostBuilder(fsc=self.FSC)
+        for cargo in cargo_list:
+            builder.set_freight_weight(
+                cargo.weight, cargo.quantity, cargo.width, cargo.height, cargo.length
             )
 
-            if cargo_transportation_id == 2: # FTL
-                builder.calculate_ftl_cost()
-            else: # LTL
-                builder.set_price_per_weight(area_costs)
-                builder.calculate_base_cost()
-            
-            builder.calculate_with_fsc()
-            
-            # 개별 화물에 대한 계산 결과를 가져옵니다.
-            cargo_cost_schema = builder.calculate()
-            
-            # 계산된 비용과 무게를 전체 합계에 누적합니다.
-            total_cost = cargo_cost_schema.cost
-            total_freight_weight = cargo_cost_schema.freight_weight
-            is_any_max_load = cargo_cost_schema.is_max_load
+        builder.set_location_rate(
+            min_load=base_area.min_load,
+            max_load=base_area.max_load,
+            max_load_weight=base_area.max_load_weight,
+        )
+
+        if cargo_transportation_id == 2: # FTL
+            builder.calculate_ftl_cost()
+        else: # LTL
+            builder.set_price_per_weight(base_area.tier_table)
+            builder.calculate_base_cost()
+
+        builder.calculate_with_fsc()
+
+        # 개별 화물에 대한 계산 결과를 가져옵니다.
+        cargo_cost_schema = builder.calculate()
+
+        # 계산된 비용과 무게를 전체 합계에 누적합니다.
+        total_cost = cargo_cost_schema.cost
+        total_freight_weight = cargo_cost_schema.freight_weight
+        is_any_max_load = cargo_cost_schema.is_max_load
 
         # 합산된 결과로 최종 BaseCostSchema를 생성하여 반환합니다.
         return BaseCostSchema(
@@ -93,6 +127,14 @@ class CostService:
         from_location: QuoteLocationSchema,
         to_location: QuoteLocationSchema,
         base_cost: BaseCostSchema,
+    ) -> LocationCostSchema:
+        return self._calculate_location_type_cost(from_location, to_location, base_cost)
+
+    def _calculate_location_type_cost(
+        self,
+        from_location: QuoteLocationSchema,
+        to_location: QuoteLocationSchema,
+        base_cost: BaseCostSchema,
     ) -> LocationCostSchema:
         builder = LocationCostBuilder(base_cost=base_cost)
         builder.check_location_type(from_location.location_type, "PICK_UP")
@@ -106,10 +148,27 @@ class CostService:
         from_location: QuoteLocationSchema,
         to_location: QuoteLocationSchema,
         base_cost: BaseCostSchema,
+    ) -> ExtraCostSchema:
+        rate_snapshot = await rate_snapshot_store.get(self.uow)
+        return self._calculate_extra_cost(
+            is_priority,
+            from_location,
+            to_location,
+            base_cost,
+            rate_snapshot.accessorial_rules,
+        )
+
+    def _calculate_extra_cost(
+        self,
+        is_priority: bool,
+        from_location: QuoteLocationSchema,
+        to_location: QuoteLocationSchema,
+        base_cost: BaseCostSchema,
+        accessorial_rules: Mapping[int, AccessorialRule],
     ) -> ExtraCostSchema:
         builder = ExtraCostBuilder(base_cost=base_cost)
-        builder.calculate_accesserial(from_location)
-        builder.calculate_accesserial(to_location)
+        builder.calculate_accesserial(from_location, accessorial_rules)
+        builder.calculate_accesserial(to_location, accessorial_rules)
         builder.calculate_service_extra_cost(is_priority, from_location)
         builder.calculate_service_extra_cost(is_priority, to_location)
         return builder.calculate()
@@ -119,7 +178,19 @@ class CostService:
         user_id: int,
         total_cost: Decimal,
     ) -> DiscountCostSchema:
-        builder = DiscountBuilder(total_cost=total_cost)
+        user_level = await self._get_user_level(user_id)
+        return self._calculate_discount(user_level, total_cost)
+
+    async def _get_token_user_level(self, token_data: TokenData) -> UserLevelSnapshot:
+        """토큰의 등급 버전이 프로세스 내 캐시와 같으면 조회 없이 사용하고, 다르면 DB에서 다시 읽습니다."""
+        user_level = user_level_store.get(
+            token_data.user_level_id, token_data.level_version
+        )
+        if user_level is None:
+            user_level = await self._get_user_level(token_data.user_id)
+        return user_level
+
+    async def _get_user_level(self, user_id: int) -> UserLevelSnapshot:
         async with self.uow:
             user = await self.uow.user.get_user_by_id(user_id)
             if user is None:
@@ -130,6 +201,194 @@ class CostService:
             )
             if user_level is None:
                 raise NotFoundException(message=f"사용자 등급 ID {user.user_level_id}를 찾을 수 없습니다.")
+        level_snapshot = UserLevelSnapshot.from_model(user_level)
+        user_level_store.put(level_snapshot)
+        return level_snapshot
 
-            builder.calculate_discount(user_level)
+    def _calculate_discount(
+        self, user_level: UserLevelSnapshot, total_cost: Decimal
+    ) -> DiscountCostSchema:
+        builder = DiscountBuilder(total_cost=total_cost)
+        builder.calculate_discount(user_level)
         return builder.calculate()
+
+    def _calculate_quote_price(
+        self,
+        quote_request: Union[CreateQuoteRequest, UpdateQuoteRequest],
+        rate_snapshot: RateSnapshot,
+        base_area: RateAreaSnapshot,
+        user_level: UserLevelSnapshot,
+    ) -> QuotePriceSchema:
+        """같은 입력의 계산 결과는 quote_price_cache에서 재사용합니다."""
+        quote_price_cache.ensure_generation(rate_snapshot.version)
+        cache_key = self._quote_price_cache_key(quote_request, base_area, user_level)
+        quote_price = quote_price_cache.get(cache_key)
+        if quote_price is None:
+            quote_price = self._price_quote_request(
+                quote_request, rate_snapshot, base_area, user_level
+            )
+            quote_price_cache.set(cache_key, quote_price)
+        return quote_price
+
+    def _quote_price_cache_key(
+        self,
+        quote_request: Union[CreateQuoteRequest, UpdateQuoteRequest],
+        base_area: RateAreaSnapshot,
+        user_level: UserLevelSnapshot,
+    ) -> Tuple:
+        # 운임에 영향을 주는 값만 정규화해서 담습니다. 우편번호는 기준 구역으로, 요청 일시는 할증 판단 값으로 바꿉니다.
+        def location_key(location: QuoteLocationSchema) -> Tuple:
+            weekday = location.request_datetime.weekday()
+            hour = location.request_datetime.hour
+            return (
+                location.location_type,
+                tuple(
+                    sorted(
+                        accessory.cargo_accessorial_id
+                        for accessory in location.accessorials
+                    )
+                ),
+                weekday >= 5,
+                hour >= 17,
+                weekday < 5 and 9 <= hour < 17,
+            )
+
+        return (
+            quote_request.cargo_transportation_id,
+            quote_request.is_priority,
+            tuple(
+                sorted(
+                    (cargo.weight, cargo.quantity, cargo.width, cargo.height, cargo.length)
+                    for cargo in quote_request.cargo
+                )
+            ),
+            base_area.id,
+            location_key(quote_request.from_location),
+            location_key(quote_request.to_location),
+            user_level.id,
+            user_level.discount_rate,
+        )
+
+    def _price_quote_request(
+        self,
+        quote_request: Union[CreateQuoteRequest, UpdateQuoteRequest],
+        rate_snapshot: RateSnapshot,
+        base_area: RateAreaSnapshot,
+        user_level: UserLevelSnapshot,
+    ) -> QuotePriceSchema:
+        if settings.PRICING_ENGINE == "fixed_point":
+            return fixed_point.calculate_quote_price(
+                quote_request,
+                fixed_point.get_rate_card(rate_snapshot),
+                base_area.id,
+                user_level,
+                self.FSC,
+            )
+
+        base_cost = self._calculate_base_cost(
+            quote_request.cargo_transportation_id, quote_request.cargo, base_area
+        )
+        if base_cost.is_max_load:
+            raise BadRequestException(
+                message="최대 금액을 초과했습니다. 고객사에 직접 문의해주세요.",
+            )
+
+        location_type_cost = self._calculate_location_type_cost(
+            quote_request.from_location, quote_request.to_location, base_cost
+        )
+        extra_cost = self._calculate_extra_cost(
+            quote_request.is_priority,
+            quote_request.from_location,
+            quote_request.to_location,
+            base_cost,
+            rate_snapshot.accessorial_rules,
+        )
+
+        extra_price = location_type_cost.cost + extra_cost.cost
+        total_price_with_discount = self._calculate_discount(
+            user_level, base_cost.cost + extra_price
+        )
+        return QuotePriceSchema(
+            total_weight=base_cost.freight_weight,
+            base_price=base_cost.cost,
+            location_type_price=location_type_cost.cost,
+            service_price=extra_cost.cost,
+            extra_price=extra_price,
+            total_price=total_price_with_discount.cost,
+        )
+
+    async def price_quote(
+        self,
+        token_data: TokenData,
+        quote_request: Union[CreateQuoteRequest, UpdateQuoteRequest],
+    ) -> QuotePriceSchema:
+        """
+        기본 운임, 위치 유형, 추가 서비스, 할인까지 전 단계를 하나의 UnitOfWork 컨텍스트에서 계산합니다.
+        호출자가 이미 컨텍스트를 열었다면 중간 커밋 없이 그 트랜잭션에 합류합니다.
+        """
+        async with self.uow:
+            rate_snapshot = await rate_snapshot_store.get(self.uow)
+            user_level = await self._get_token_user_level(token_data)
+            base_area = self._get_base_area(
+                rate_snapshot,
+                quote_request.from_location.zip_code,
+                quote_request.to_location.zip_code,
+            )
+            return self._calculate_quote_price(
+                quote_request, rate_snapshot, base_area, user_level
+            )
+
+    async def calculate_batch_prices(
+        self,
+        token_data: TokenData,
+        quote_requests: List[CreateQuoteRequest],
+    ) -> List[BatchQuotePriceResponse]:
+        """
+        여러 견적의 비용을 저장 없이 계산합니다.
+        사용자 등급은 토큰 클레임에서 가져오거나 한 번만 조회하고, 출발지/도착지 우편번호 조합별 기준 구역도 한 번만 결정합니다.
+        """
+        if not quote_requests:
+            raise BadRequestException(message="계산할 견적이 없습니다.")
+        if len(quote_requests) > settings.QUOTE_PRICE_BATCH_MAX_ITEMS:
+            raise BadRequestException(
+                message=f"한 번에 최대 {settings.QUOTE_PRICE_BATCH_MAX_ITEMS}건까지 계산할 수 있습니다."
+            )
+
+        async with self.uow:
+            rate_snapshot = await rate_snapshot_store.get(self.uow)
+            user_level = await self._get_token_user_level(token_data)
+
+        base_areas: Dict[Tuple[str, str], RateAreaSnapshot] = {}
+        results = []
+        for index, quote_request in enumerate(quote_requests):
+            lane = (
+                quote_request.from_location.zip_code,
+                quote_request.to_location.zip_code,
+            )
+            try:
+                base_area = base_areas.get(lane)
+                if base_area is None:
+                    base_area = self._get_base_area(rate_snapshot, *lane)
+                    base_areas[lane] = base_area
+
+                price = self._calculate_quote_price(
+                    quote_request, rate_snapshot, base_area, user_level
+                )
+                results.append(BatchQuotePriceResponse(index=index, price=price))
+            except AppException as e:
+                results.append(
+                    BatchQuotePriceResponse(index=index, error=e.to_error_detail())
+                )
+        return results
+
+    def get_pricing_cache_stats(self, role_id: int) -> PricingCacheStatsResponse:
+        if role_id != 2:
+            raise ForbiddenException(message="Forbidden:: Admin only")
+
+        return PricingCacheStatsResponse(
+            size=len(quote_price_cache),
+            max_size=quote_price_cache.maxsize,
+            ttl_seconds=quote_price_cache.ttl_seconds,
+            hits=quote_price_cache.hits,
+            misses=quote_price_cache.misses,
+        )
@@ -1,10 +1,13 @@
-from .base_cost_builder import BaseCostBuilder
-from .extra_cost_builder import ExtraCostBuilder
+from .base_cost_builder import BaseCostBuilder, RateCost, RateTierTable
+from .extra_cost_builder import AccessorialRule, ExtraCostBuilder
 from .location_type_cost_builder import LocationCostBuilder
 from .discount_builder import DiscountBuilder
 
 __all__ = [
     "BaseCostBuilder",
+    "RateCost",
+    "RateTierTable",
+    "AccessorialRule",
     "ExtraCostBuilder",
     "LocationCostBuilder",
     "DiscountBuilder",
@@ -1,16 +1,63 @@
-from typing import List
+from bisect import bisect_right
+from typing import Iterable, Tuple
 from decimal import Decimal
 from dataclasses import dataclass
 from ...core.utils import round_up_decimal
+from ...core.exceptions import BadRequestException, NotFoundException
 from ...schema.cost import BaseCostSchema
 
 
-@dataclass
+@dataclass(frozen=True)
 class RateCost:
     min_weight: Decimal
     max_weight: Decimal
     price_per_weight: Decimal
 
+
+@dataclass(frozen=True)
+class RateTierTable:
+    """
+    구역별 무게 구간 단가표입니다.
+    각 구간은 [min_weight, 다음 구간의 min_weight) 범위를 담당하므로
+    1000.5 lbs처럼 정수 구간 경계 사이의 무게도 앞 구간의 단가로 계산됩니다.
+    """
+
+    lower_bounds: Tuple[int, ...]
+    prices: Tuple[Decimal, ...]
+    max_weight: int
+
+    @classmethod
+    def from_rate_costs(cls, rate_costs: Iterable[RateCost]) -> "RateTierTable":
+        tiers = sorted(rate_costs, key=lambda rate_cost: rate_cost.min_weight)
+        for tier in tiers:
+            if tier.min_weight > tier.max_weight:
+                raise ValueError(
+                    f"잘못된 무게 구간입니다: {tier.min_weight}-{tier.max_weight}"
+                )
+        for prev, tier in zip(tiers, tiers[1:]):
+            if tier.min_weight <= prev.max_weight:
+                raise ValueError(
+                    f"무게 구간이 겹칩니다: {prev.min_weight}-{prev.max_weight}, "
+                    f"{tier.min_weight}-{tier.max_weight}"
+                )
+            if tier.min_weight > prev.max_weight + 1:
+                raise ValueError(
+                    f"무게 구간 사이에 빈 구간이 있습니다: {prev.max_weight}-{tier.min_weight}"
+                )
+        return cls(
+            lower_bounds=tuple(tier.min_weight for tier in tiers),
+            prices=tuple(tier.price_per_weight for tier in tiers),
+            max_weight=tiers[-1].max_weight if tiers else 0,
+        )
+
+    def get_price_per_weight(self, weight: Decimal) -> Decimal:
+        if not self.prices:
+            raise NotFoundException(message="지역 요율 정보를 찾을 수 없습니다.")
+        # 첫 구간보다 가벼운 화물은 첫 구간, 마지막 구간보다 무거운 화물은 마지막 구간 단가를 적용합니다.
+        index = max(bisect_right(self.lower_bounds, weight) - 1, 0)
+        return self.prices[index]
+
+
 class BaseCostBuilder:
     def __init__(self, fsc: Decimal):
         self._freight_weight = Decimal(
@@ -54,19 +101,13 @@ class BaseCostBuilder:
         self._max_load_weight = max_load_weight
         return self
 
-    def set_price_per_weight(self, rate_costs: List[RateCost]) -> "BaseCostBuilder":
+    def set_price_per_weight(self, tier_table: RateTierTable) -> "BaseCostBuilder":
         if self._freight_weight > self._max_load_weight:
-            raise Exception(
+            raise BadRequestException(
                 # 영어로 변경
-                "최대 운임 무게를 초과했습니다. 운영사에 직접 문의해주세요."
+                message="최대 운임 무게를 초과했습니다. 운영사에 직접 문의해주세요."
             )
-        for rate_cost in rate_costs:
-            if (
-                self._freight_weight >= rate_cost.min_weight
-                and self._freight_weight <= rate_cost.max_weight
-            ):
-                self._price_per_weight = rate_cost.price_per_weight
-                break
+        self._price_per_weight = tier_table.get_price_per_weight(self._freight_weight)
         return self
 
     def calculate_base_cost(self) -> "BaseCostBuilder":
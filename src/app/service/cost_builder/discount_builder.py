@@ -1,15 +1,15 @@
 from decimal import Decimal
 
-from ...model.user import UserLevel
 from ...schema.cost import DiscountCostSchema
 from ...core.utils import round_up_decimal
+from ..user_level_snapshot import UserLevelSnapshot
 
 
 class DiscountBuilder:
     def __init__(self, total_cost: Decimal):
         self._total_cost = total_cost
 
-    def calculate_discount(self, user_level: UserLevel) -> "DiscountBuilder":
+    def calculate_discount(self, user_level: UserLevelSnapshot) -> "DiscountBuilder":
         if user_level.discount_rate > 0:
             self._total_cost -= self._calculate_discount(user_level.discount_rate)
         return self
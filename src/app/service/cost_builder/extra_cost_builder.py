@@ -1,11 +1,37 @@
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from typing import Mapping, Optional
 
 from ...core.utils import round_up_decimal
+from ...core.exceptions import NotFoundException
+from ...model._enum import AccessorialPricingTypeEnum
 from ...schema.cost import BaseCostSchema, ExtraCostSchema
 from ...schema import QuoteLocationSchema
 
 
+@dataclass(frozen=True)
+class AccessorialRule:
+    """cargo_accessorial의 가격 규칙입니다. 요율 스냅샷 적재 시 ID별로 한 번만 만들어집니다."""
+
+    pricing_type: AccessorialPricingTypeEnum
+    price: Decimal
+    min_price: Optional[Decimal] = None
+    max_price: Optional[Decimal] = None
+
+    def calculate(self, freight_weight: Decimal) -> Decimal:
+        if self.pricing_type == AccessorialPricingTypeEnum.PER_WEIGHT:
+            cost = round_up_decimal(freight_weight * self.price)
+        else:
+            cost = self.price
+
+        if self.min_price is not None:
+            cost = max(cost, self.min_price)
+        if self.max_price is not None:
+            cost = min(cost, self.max_price)
+        return cost
+
+
 class ExtraCostBuilder:
     def __init__(self, base_cost: BaseCostSchema):
         self._base_cost = base_cost
@@ -13,30 +39,19 @@ class ExtraCostBuilder:
         self._priority_cost_added = False
 
     def calculate_accesserial(
-        self, location: QuoteLocationSchema
+        self,
+        location: QuoteLocationSchema,
+        accessorial_rules: Mapping[int, AccessorialRule],
     ) -> "ExtraCostBuilder":
-        if len(location.accessorials) > 0:
-            for accessory in location.accessorials:
-                if accessory.name == "Inside Delivery":
-                    self._final_cost += self._calculate_inside_delivery_cost()
-                elif accessory.name == "Two Person":
-                    self._final_cost += self._calculate_two_person_cost()
-                elif accessory.name == "Lift Gate":
-                    self._final_cost += self._calculate_lift_gate_cost()
+        for accessory in location.accessorials:
+            rule = accessorial_rules.get(accessory.cargo_accessorial_id)
+            if rule is None:
+                raise NotFoundException(
+                    message=f"추가 서비스 ID {accessory.cargo_accessorial_id}를 찾을 수 없습니다."
+                )
+            self._final_cost += rule.calculate(self._base_cost.freight_weight)
         return self
 
-    def _calculate_inside_delivery_cost(self) -> Decimal:
-        return max(
-            Decimal(25),
-            round_up_decimal(self._base_cost.freight_weight * Decimal("0.02")),
-        )
-
-    def _calculate_two_person_cost(self) -> Decimal:
-        return Decimal(80)
-
-    def _calculate_lift_gate_cost(self) -> Decimal:
-        return Decimal(25)
-
     def calculate_service_extra_cost(
         self, is_priority: bool, location: QuoteLocationSchema
     ) -> "ExtraCostBuilder":
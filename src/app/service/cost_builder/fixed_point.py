@@ -0,0 +1,298 @@
+"""
+정수 고정소수점 운임 계산 코어입니다.
+
+무게는 0.001 lbs, 금액은 0.001 달러, 단가/비율은 0.0001 단위의 int로 계산하며
+Decimal 빌더와 같은 ROUND_UP(소수점 3자리) 규칙을 올림 나눗셈으로 적용합니다.
+설정에서 PRICING_ENGINE=fixed_point로 지정하면 CostService가 이 코어를 사용합니다.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Literal, Mapping, Optional, Tuple
+
+from ...core.exceptions import BadRequestException, NotFoundException
+from ...model._enum import AccessorialPricingTypeEnum, LocationTypeEnum
+from ...schema import QuoteCargoSchema, QuoteLocationSchema
+from ...schema.cost import QuotePriceSchema
+from ..user_level_snapshot import UserLevelSnapshot
+from .extra_cost_builder import AccessorialRule
+from .location_type_cost_builder import LocationCostBuilder
+
+WEIGHT_SCALE = 1000  # 0.001 lbs
+MONEY_SCALE = 1000  # 0.001 달러
+RATE_SCALE = 10000  # Numeric(16, 4) 단가/비율
+PRODUCT_SCALE = WEIGHT_SCALE * RATE_SCALE  # 무게 × 단가
+
+VOLUME_WEIGHT_DIVISOR = 166
+SERVICE_EXTRA_COST = 100 * MONEY_SCALE
+
+
+def to_scaled(value: Decimal, scale: int) -> int:
+    scaled = Decimal(value) * scale
+    if scaled != scaled.to_integral_value():
+        raise ValueError(f"{value}는 1/{scale} 단위로 표현할 수 없습니다.")
+    return int(scaled)
+
+
+def from_scaled(value: int, scale: int = MONEY_SCALE) -> Decimal:
+    return (Decimal(int(value)) / scale).quantize(Decimal(1) / scale)
+
+
+def ceil_div(numerator, denominator: int):
+    # 모든 값이 0 이상이므로 올림 나눗셈이 ROUND_UP과 같습니다. NumPy 배열에도 그대로 사용할 수 있습니다.
+    return -(-numerator // denominator)
+
+
+_AIRPORT_CONFIG = {
+    delivery_type: (
+        to_scaled(config["min_cost"], PRODUCT_SCALE),
+        to_scaled(config["max_cost"], PRODUCT_SCALE),
+        to_scaled(config["price_per_weight"], RATE_SCALE),
+    )
+    for delivery_type, config in LocationCostBuilder.AIRPORT_CONFIG.items()
+}
+_RESIDENTIAL_COST = to_scaled(LocationCostBuilder.RESIDENTIAL_COST, MONEY_SCALE)
+
+
+@dataclass(frozen=True)
+class FixedPointArea:
+    min_load: int  # 1/PRODUCT_SCALE 달러
+    max_load: int
+    max_load_weight: Optional[int]  # 0.001 lbs
+    lower_bounds: Tuple[int, ...]  # 0.001 lbs
+    prices: Tuple[int, ...]  # 1/RATE_SCALE 달러
+
+
+@dataclass(frozen=True)
+class FixedPointAccessorialRule:
+    price_per_weight: int  # 1/RATE_SCALE 달러, PER_WEIGHT만
+    flat_price: int  # 0.001 달러, FLAT만
+    min_price: Optional[int]
+    max_price: Optional[int]
+
+    @classmethod
+    def from_rule(cls, rule: AccessorialRule) -> "FixedPointAccessorialRule":
+        is_per_weight = rule.pricing_type == AccessorialPricingTypeEnum.PER_WEIGHT
+        return cls(
+            price_per_weight=to_scaled(rule.price, RATE_SCALE) if is_per_weight else 0,
+            flat_price=0 if is_per_weight else to_scaled(rule.price, MONEY_SCALE),
+            min_price=None
+            if rule.min_price is None
+            else to_scaled(rule.min_price, MONEY_SCALE),
+            max_price=None
+            if rule.max_price is None
+            else to_scaled(rule.max_price, MONEY_SCALE),
+        )
+
+    def calculate(self, freight_weight: int) -> int:
+        cost = self.flat_price + ceil_div(
+            freight_weight * self.price_per_weight, PRODUCT_SCALE // MONEY_SCALE
+        )
+        if self.min_price is not None:
+            cost = max(cost, self.min_price)
+        if self.max_price is not None:
+            cost = min(cost, self.max_price)
+        return cost
+
+
+@dataclass(frozen=True)
+class FixedPointRateCard:
+    """요율 스냅샷을 정수 단위로 변환한 요율표입니다. 스냅샷 버전별로 한 번만 만들어집니다."""
+
+    version: int
+    areas: Mapping[int, FixedPointArea]
+    accessorial_rules: Mapping[int, FixedPointAccessorialRule]
+
+    @classmethod
+    def from_snapshot(cls, rate_snapshot) -> "FixedPointRateCard":
+        return cls(
+            version=rate_snapshot.version,
+            areas={
+                area.id: FixedPointArea(
+                    min_load=to_scaled(area.min_load, PRODUCT_SCALE),
+                    max_load=to_scaled(area.max_load, PRODUCT_SCALE),
+                    max_load_weight=None
+                    if area.max_load_weight is None
+                    else to_scaled(area.max_load_weight, WEIGHT_SCALE),
+                    lower_bounds=tuple(
+                        lower_bound * WEIGHT_SCALE
+                        for lower_bound in area.tier_table.lower_bounds
+                    ),
+                    prices=tuple(
+                        to_scaled(price, RATE_SCALE) for price in area.tier_table.prices
+                    ),
+                )
+                for area in rate_snapshot.areas.values()
+            },
+            accessorial_rules={
+                accessorial_id: FixedPointAccessorialRule.from_rule(rule)
+                for accessorial_id, rule in rate_snapshot.accessorial_rules.items()
+            },
+        )
+
+
+_rate_card_cache: Dict[int, FixedPointRateCard] = {}
+
+
+def get_rate_card(rate_snapshot) -> FixedPointRateCard:
+    rate_card = _rate_card_cache.get(rate_snapshot.version)
+    if rate_card is None:
+        rate_card = FixedPointRateCard.from_snapshot(rate_snapshot)
+        _rate_card_cache.clear()
+        _rate_card_cache[rate_snapshot.version] = rate_card
+    return rate_card
+
+
+def calculate_freight_weight(cargo_list: List[QuoteCargoSchema]) -> int:
+    freight_weight = 0
+    for cargo in cargo_list:
+        package_weight = cargo.weight * cargo.quantity * WEIGHT_SCALE
+        volume_weight = ceil_div(
+            cargo.width * cargo.height * cargo.length * cargo.quantity * WEIGHT_SCALE,
+            VOLUME_WEIGHT_DIVISOR,
+        )
+        freight_weight += max(package_weight, volume_weight)
+    return freight_weight
+
+
+def calculate_base_cost(
+    cargo_transportation_id: int,
+    freight_weight: int,
+    area: FixedPointArea,
+    fsc: int,
+) -> Tuple[int, bool]:
+    """(FSC 포함 기본 운임, max_load 초과 여부)를 반환합니다."""
+    is_max_load = False
+    if cargo_transportation_id == 2:  # FTL
+        freight_cost = area.max_load
+    else:  # LTL
+        if area.max_load_weight is not None and freight_weight > area.max_load_weight:
+            raise BadRequestException(
+                message="최대 운임 무게를 초과했습니다. 운영사에 직접 문의해주세요."
+            )
+        if not area.prices:
+            raise NotFoundException(message="지역 요율 정보를 찾을 수 없습니다.")
+
+        index = max(bisect_right(area.lower_bounds, freight_weight) - 1, 0)
+        base_freight_cost = freight_weight * area.prices[index]
+        if base_freight_cost > area.max_load:
+            is_max_load = True
+            freight_cost = area.max_load
+        elif base_freight_cost < area.min_load:
+            freight_cost = area.min_load
+        else:
+            freight_cost = base_freight_cost
+
+    return (
+        ceil_div(freight_cost * (RATE_SCALE + fsc), PRODUCT_SCALE * RATE_SCALE // MONEY_SCALE),
+        is_max_load,
+    )
+
+
+def calculate_location_type_cost(
+    location_type: LocationTypeEnum,
+    delivery_type: Literal["PICK_UP", "DELIVERY"],
+    freight_weight: int,
+) -> int:
+    if location_type == LocationTypeEnum.RESIDENTIAL:
+        return _RESIDENTIAL_COST
+    if location_type == LocationTypeEnum.AIRPORT:
+        min_cost, max_cost, price_per_weight = _AIRPORT_CONFIG[delivery_type]
+        cost = freight_weight * price_per_weight
+        if cost > max_cost:
+            cost = max_cost
+        elif cost < min_cost:
+            cost = min_cost
+        return ceil_div(cost, PRODUCT_SCALE // MONEY_SCALE)
+    return 0
+
+
+def calculate_service_extra_cost(
+    is_priority: bool, request_datetimes: Tuple[datetime, ...]
+) -> int:
+    cost = 0
+    priority_cost_added = False
+    for request_datetime in request_datetimes:
+        weekday, hour = request_datetime.weekday(), request_datetime.hour
+        if weekday >= 5:
+            cost += SERVICE_EXTRA_COST
+        if hour >= 17:
+            cost += SERVICE_EXTRA_COST
+        if is_priority and weekday < 5 and 9 <= hour < 17 and not priority_cost_added:
+            priority_cost_added = True
+            cost += SERVICE_EXTRA_COST
+    return cost
+
+
+def calculate_accessorial_cost(
+    location: QuoteLocationSchema,
+    freight_weight: int,
+    accessorial_rules: Mapping[int, FixedPointAccessorialRule],
+) -> int:
+    cost = 0
+    for accessory in location.accessorials:
+        rule = accessorial_rules.get(accessory.cargo_accessorial_id)
+        if rule is None:
+            raise NotFoundException(
+                message=f"추가 서비스 ID {accessory.cargo_accessorial_id}를 찾을 수 없습니다."
+            )
+        cost += rule.calculate(freight_weight)
+    return cost
+
+
+def calculate_discount(total_cost: int, discount_rate: int) -> int:
+    if discount_rate > 0:
+        return ceil_div(total_cost * (RATE_SCALE - discount_rate), RATE_SCALE)
+    return total_cost
+
+
+def calculate_quote_price(
+    quote_request,
+    rate_card: FixedPointRateCard,
+    area_id: int,
+    user_level: UserLevelSnapshot,
+    fsc: Decimal,
+) -> QuotePriceSchema:
+    """CostService._calculate_quote_price와 같은 순서로 계산하고 같은 예외를 발생시킵니다."""
+    area = rate_card.areas[area_id]
+    freight_weight = calculate_freight_weight(quote_request.cargo)
+    base_cost, is_max_load = calculate_base_cost(
+        quote_request.cargo_transportation_id,
+        freight_weight,
+        area,
+        to_scaled(fsc, RATE_SCALE),
+    )
+    if is_max_load:
+        raise BadRequestException(
+            message="최대 금액을 초과했습니다. 고객사에 직접 문의해주세요.",
+        )
+
+    from_location, to_location = quote_request.from_location, quote_request.to_location
+    location_type_cost = calculate_location_type_cost(
+        from_location.location_type, "PICK_UP", freight_weight
+    ) + calculate_location_type_cost(
+        to_location.location_type, "DELIVERY", freight_weight
+    )
+    extra_cost = (
+        calculate_accessorial_cost(from_location, freight_weight, rate_card.accessorial_rules)
+        + calculate_accessorial_cost(to_location, freight_weight, rate_card.accessorial_rules)
+        + calculate_service_extra_cost(
+            quote_request.is_priority,
+            (from_location.request_datetime, to_location.request_datetime),
+        )
+    )
+
+    extra_price = location_type_cost + extra_cost
+    total_price = calculate_discount(
+        base_cost + extra_price, to_scaled(user_level.discount_rate, RATE_SCALE)
+    )
+    return QuotePriceSchema(
+        total_weight=from_scaled(freight_weight, WEIGHT_SCALE),
+        base_price=from_scaled(base_cost),
+        location_type_price=from_scaled(location_type_cost),
+        service_price=from_scaled(extra_cost),
+        extra_price=from_scaled(extra_price),
+        total_price=from_scaled(total_price),
+    )
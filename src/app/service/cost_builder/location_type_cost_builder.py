@@ -13,12 +13,12 @@ class LocationCostBuilder:
         "PICK_UP": {
             "min_cost": Decimal(30),
             "max_cost": Decimal(200),
-            "price_per_weight": Decimal(0.035),
+            "price_per_weight": Decimal("0.035"),
         },
         "DELIVERY": {
             "min_cost": Decimal(25),
             "max_cost": Decimal(200),
-            "price_per_weight": Decimal(0.03),
+            "price_per_weight": Decimal("0.03"),
         },
     }
 
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import smtplib
 from email.mime.multipart import MIMEMultipart
@@ -91,8 +92,10 @@ For any questions or concerns regarding this order, contact <a href="mailto:disp
         html_part = MIMEText(self._format_body_as_html(), "html", "utf-8")
         msg.attach(html_part)
 
+        # smtplib은 블로킹이므로 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+        await asyncio.to_thread(self._send_message, msg)
 
-
+    def _send_message(self, msg: MIMEMultipart) -> None:
         try:
             print(f"SMTP 서버에 연결 중: {self.SMTP_HOST}:{self.SMTP_PORT}")
             with smtplib.SMTP(
@@ -0,0 +1,149 @@
+"""
+견적 알림 이메일 발송 대기열(email_outbox)을 관리합니다.
+
+견적 제출은 상태 변경과 같은 트랜잭션에서 email_outbox에 보낼 이메일을 기록만 하고, SMTP 발송은 서버 안의 백그라운드 발송기가 맡습니다.
+발송기는 보낼 때가 된 이메일을 짧은 트랜잭션으로 점유한 뒤 트랜잭션 밖에서 보내고, 결과를 다시 기록합니다.
+실패하면 점점 늘어나는 간격으로 다시 시도하고, 최대 시도 횟수를 넘기면 DEAD로 남깁니다.
+점유 시간(EMAIL_OUTBOX_LEASE_SECONDS)이 지나도록 결과가 기록되지 않으면 다시 발송하므로, 드물게 같은 메일이 두 번 갈 수 있습니다.
+"""
+
+import asyncio
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import List, NamedTuple, Optional
+
+from fastapi import HTTPException
+
+from ..core.config import settings
+from ..db.session import async_session
+from ..db.unit_of_work import UnitOfWork
+from .email import EmailSender
+
+logger = logging.getLogger(__name__)
+
+# 같은 프로세스에서 기록된 이메일은 폴링 주기를 기다리지 않고 바로 보내도록 발송기를 깨웁니다.
+email_outbox_wakeup = asyncio.Event()
+
+
+class EmailOutboxMessage(NamedTuple):
+    """점유한 이메일 한 건입니다. attempts는 이번 시도를 포함한 시도 횟수입니다."""
+
+    id: int
+    quote_id: str
+    subject: str
+    receiver_email: str
+    client_name: str
+    order_primary: str
+    attempts: int
+
+
+def get_retry_at(now: datetime, attempts: int) -> Optional[datetime]:
+    """다음 시도 시각입니다. 최대 시도 횟수를 채웠으면 None(DEAD)입니다."""
+    if attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+        return None
+    delay_seconds = settings.EMAIL_OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1)
+    return now + timedelta(
+        seconds=min(delay_seconds, settings.EMAIL_OUTBOX_RETRY_MAX_SECONDS)
+    )
+
+
+class EmailOutboxService:
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    async def enqueue_quote_submitted(
+        self,
+        quote_id: str,
+        receiver_email: str,
+        client_name: str,
+        order_primary: str,
+    ):
+        """견적 접수 안내 메일을 현재 트랜잭션에 기록합니다. 커밋되면 발송기를 깨웁니다."""
+        await self.uow.email_outbox.create_email(
+            quote_id=quote_id,
+            subject=f"Load {order_primary} Order Received",
+            receiver_email=receiver_email,
+            client_name=client_name,
+            order_primary=order_primary,
+            next_attempt_at=datetime.now(UTC),
+        )
+        self.uow.after_commit(email_outbox_wakeup.set)
+
+    async def claim_due_emails(self, limit: int) -> List[EmailOutboxMessage]:
+        now = datetime.now(UTC)
+        lease_until = now + timedelta(seconds=settings.EMAIL_OUTBOX_LEASE_SECONDS)
+        async with self.uow:
+            rows = await self.uow.email_outbox.claim_due_emails(now, lease_until, limit)
+        return [EmailOutboxMessage(*row) for row in rows]
+
+    async def send(self, message: EmailOutboxMessage) -> bool:
+        """점유한 이메일을 보내고 결과를 기록합니다. SMTP 발송 중에는 트랜잭션을 열어 두지 않습니다."""
+        try:
+            email_sender = EmailSender(
+                subject=message.subject,
+                receiver_email=message.receiver_email,
+                client_name=message.client_name,
+                quote_id=message.quote_id,
+                order_primary=message.order_primary,
+            )
+            await email_sender.send_email()
+        except Exception as e:
+            error = e.detail if isinstance(e, HTTPException) else str(e)
+            retry_at = get_retry_at(datetime.now(UTC), message.attempts)
+            async with self.uow:
+                await self.uow.email_outbox.mark_failed(message.id, str(error), retry_at)
+            if retry_at is None:
+                logger.error(
+                    "Email %s for quote %s is dead after %s attempts: %s",
+                    message.id,
+                    message.quote_id,
+                    message.attempts,
+                    error,
+                )
+            else:
+                logger.warning(
+                    "Failed to send email %s (attempt %s), retrying at %s: %s",
+                    message.id,
+                    message.attempts,
+                    retry_at,
+                    error,
+                )
+            return False
+
+        async with self.uow:
+            await self.uow.email_outbox.mark_sent(message.id, datetime.now(UTC))
+        return True
+
+
+async def drain_email_outbox(
+    batch_size: int = settings.EMAIL_OUTBOX_BATCH_SIZE,
+) -> int:
+    """보낼 때가 된 이메일을 최대 batch_size건 보내고, 점유한 건수를 반환합니다."""
+    async with async_session() as session:
+        email_outbox_service = EmailOutboxService(UnitOfWork(session))
+        messages = await email_outbox_service.claim_due_emails(batch_size)
+        for message in messages:
+            await email_outbox_service.send(message)
+    return len(messages)
+
+
+async def run_email_outbox_worker(poll_interval_seconds: float):
+    """
+    email_outbox를 계속 비웁니다. 가져온 건수가 batch_size보다 적으면 새 이메일이 기록되거나
+    poll_interval_seconds가 지날 때까지 기다립니다. 실패해도 다음 주기에 다시 시도합니다.
+    """
+    while True:
+        email_outbox_wakeup.clear()
+        try:
+            claimed = await drain_email_outbox()
+        except Exception:
+            logger.exception("Failed to drain email outbox")
+            claimed = 0
+        if claimed >= settings.EMAIL_OUTBOX_BATCH_SIZE:
+            continue
+        try:
+            await asyncio.wait_for(
+                email_outbox_wakeup.wait(), timeout=poll_interval_seconds
+            )
+        except asyncio.TimeoutError:
+            pass
@@ -1,32 +1,54 @@
+from dataclasses import dataclass
 from decimal import Decimal
-from pprint import pprint
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime, date
 import calendar
 
-from fastapi import HTTPException, Depends
+from fastapi import Depends
+from sqlalchemy import Row
 from app.core.auth import TokenData, required_authorization
 
 from ..db.unit_of_work import UnitOfWork
 from ..model.quote import Quote
-from ..model.quote import QuoteLocation
-from ..model.quote import QuoteCargo
+from ..model.quote import QuoteCargo, QuoteLocation
 from ..core.exceptions import NotFoundException, ForbiddenException, BadRequestException
+from ..core.config import settings
+from ..core.etag import build_etag
+from ..core.pagination import DEFAULT_PAGE_LIMIT, decode_cursor, encode_cursor
 from ..model._enum import ShipmentTypeEnum, OrderStatusEnum
-from ..schema._common import BaseQuoteSchema, QuoteLocationAccessorialSchema
+from ..schema._common import (
+    BaseQuoteSchema,
+    QuoteLocationAccessorialSchema,
+    QuoteLocationSchema,
+)
+from ..schema.cost import QuotePriceSchema
 from ..schema.quote.request import (
     CreateQuoteRequest,
     UpdateQuoteRequest,
+    UpdateQuoteCargoSchema,
     ConfirmQuoteRequest,
+    AdminQuoteFilter,
 )
 from ..schema.quote.response import (
-    GetQuotesResponse,
+    BulkCreateQuoteResponse,
     GetQuoteDetailsResponse,
     QuoteLocationWithIDSchema,
     QuoteCargoWithIDSchema,
-    GetQuotesLocationSchema,
 )
-from app.service.email import EmailSender
+from ..repository.quote import QUOTE_LIST_FIELDS, QUOTE_LIST_LOCATION_FIELDS
+from ..repository.quote_cargo import QUOTE_CARGO_FIELDS, QUOTE_CARGO_LIST_FIELDS
+from ..repository.quote_location import QUOTE_LOCATION_FIELDS
+from app.service.cost import CostService
+from app.service.email_outbox import EmailOutboxService
+from app.service.quote_summary import QuoteSummaryRow, QuoteSummaryService
+
+
+@dataclass(frozen=True)
+class QuoteListPage:
+    """견적 목록 한 페이지입니다. items는 GetQuotesResponse와 같은 구조의 dict입니다."""
+
+    items: List[dict]
+    next_cursor: Optional[str] = None
 
 
 class QuoteService:
@@ -35,116 +57,100 @@ class QuoteService:
         uow: UnitOfWork,
     ):
         self.uow = uow
+        self.quote_summary = QuoteSummaryService(uow)
+        self.email_outbox = EmailOutboxService(uow)
 
     async def get_quotes_admin(
-        self, role_id: int, status: List[str]
-    ) -> List[GetQuotesResponse]:
-        async with self.uow:
-            if role_id != 2:
-                raise ForbiddenException(message="Forbidden:: Admin only")
-
-            quote_models = await self.uow.quote.get_all_quotes(status)
-            response_list = []
-            for quote_model in quote_models:
-                from_location_data = None
-                to_location_data = None
-                for loc_model in quote_model.quote_location:
-                    loc_schema_data = GetQuotesLocationSchema.model_validate(loc_model)
-                    if loc_model.shipment_type == ShipmentTypeEnum.PICKUP:
-                        from_location_data = loc_schema_data
-                    elif loc_model.shipment_type == ShipmentTypeEnum.DELIVERY:
-                        to_location_data = loc_schema_data
-
-                if not from_location_data or not to_location_data:
-                    continue
+        self,
+        role_id: int,
+        status: List[str],
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: Optional[str] = None,
+        filters: Optional[AdminQuoteFilter] = None,
+    ) -> QuoteListPage:
+        if role_id != 2:
+            raise ForbiddenException(message="Forbidden:: Admin only")
+        if filters is not None:
+            self._validate_admin_filters(filters)
 
-                cargo_data = []
-                if hasattr(quote_model, "quote_cargo") and quote_model.quote_cargo:
-                    cargo_data = [
-                        QuoteCargoWithIDSchema.model_validate(qc_model)
-                        for qc_model in quote_model.quote_cargo
-                    ]
-
-                response_list.append(
-                    GetQuotesResponse(
-                        id=quote_model.id,
-                        user_id=quote_model.user_id,
-                        cargo_transportation_id=quote_model.cargo_transportation_id,
-                        is_priority=quote_model.is_priority,
-                        total_weight=quote_model.total_weight,
-                        base_price=quote_model.base_price,
-                        extra_price=quote_model.extra_price,
-                        total_price=quote_model.total_price,
-                        order_status=quote_model.order_status,
-                        order_primary=quote_model.order_primary,
-                        order_additional_request=quote_model.order_additional_request,
-                        from_location=from_location_data,
-                        to_location=to_location_data,
-                        cargo=cargo_data,
-                        created_at=quote_model.created_at,
-                    )
-                )
-            return sorted(response_list, key=lambda x: x.created_at, reverse=True)
+        async with self.uow:
+            quote_rows = await self.uow.quote.get_all_quote_list_rows(
+                status, limit, decode_cursor(cursor) if cursor else None, filters
+            )
+            return await self._build_quotes_page(quote_rows, limit)
+
+    @staticmethod
+    def _validate_admin_filters(filters: AdminQuoteFilter):
+        if (
+            filters.created_from is not None
+            and filters.created_to is not None
+            and filters.created_from > filters.created_to
+        ):
+            raise BadRequestException(message="created_from은 created_to보다 늦을 수 없습니다.")
+        if (
+            filters.min_total_price is not None
+            and filters.max_total_price is not None
+            and filters.min_total_price > filters.max_total_price
+        ):
+            raise BadRequestException(
+                message="min_total_price는 max_total_price보다 클 수 없습니다."
+            )
 
-    async def get_quotes(self, user_id: int) -> List[GetQuotesResponse]:
+    async def get_quotes(
+        self,
+        user_id: int,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        cursor: Optional[str] = None,
+    ) -> QuoteListPage:
         async with self.uow:
-            quote_models = await self.uow.quote.get_quotes(user_id)
-            response_list = []
-            for quote_model in quote_models:
-                from_location_data = None
-                to_location_data = None
-                for loc_model in quote_model.quote_location:
-                    loc_schema_data = GetQuotesLocationSchema.model_validate(loc_model)
-                    if loc_model.shipment_type == ShipmentTypeEnum.PICKUP:
-                        from_location_data = loc_schema_data
-                    elif loc_model.shipment_type == ShipmentTypeEnum.DELIVERY:
-                        to_location_data = loc_schema_data
-
-                if not from_location_data or not to_location_data:
-                    continue
+            quote_rows = await self.uow.quote.get_quote_list_rows(
+                user_id, limit, decode_cursor(cursor) if cursor else None
+            )
+            return await self._build_quotes_page(quote_rows, limit)
+
+    async def _build_quotes_page(self, quote_rows: List[Row], limit: int) -> QuoteListPage:
+        """
+        프로젝션 행을 GetQuotesResponse 형태의 dict로 바로 조립합니다. 화물은 견적 ID 묶음으로 한 번만 조회합니다.
+        저장소가 limit + 1건을 created_at DESC, id DESC 순으로 돌려주므로 초과분이 있으면 다음 커서를 만듭니다.
+        """
+        next_cursor = None
+        if len(quote_rows) > limit:
+            quote_rows = quote_rows[:limit]
+            next_cursor = encode_cursor(quote_rows[-1].created_at, quote_rows[-1].id)
+
+        cargo_by_quote_id = {}
+        cargo_rows = await self.uow.quote_cargo.get_list_rows_by_quote_ids(
+            [row.id for row in quote_rows]
+        )
+        for quote_id, *values in cargo_rows:
+            cargo_by_quote_id.setdefault(quote_id, []).append(
+                dict(zip(QUOTE_CARGO_LIST_FIELDS, values))
+            )
 
-                cargo_data = []
-                if hasattr(quote_model, "quote_cargo") and quote_model.quote_cargo:
-                    cargo_data = [
-                        QuoteCargoWithIDSchema.model_validate(qc_model)
-                        for qc_model in quote_model.quote_cargo
-                    ]
-
-                response_list.append(
-                    GetQuotesResponse(
-                        id=quote_model.id,
-                        user_id=quote_model.user_id,
-                        cargo_transportation_id=quote_model.cargo_transportation_id,
-                        is_priority=quote_model.is_priority,
-                        total_weight=quote_model.total_weight,
-                        base_price=quote_model.base_price,
-                        extra_price=quote_model.extra_price,
-                        total_price=quote_model.total_price,
-                        order_status=quote_model.order_status,
-                        order_primary=quote_model.order_primary,
-                        order_additional_request=quote_model.order_additional_request,
-                        from_location=from_location_data,
-                        to_location=to_location_data,
-                        cargo=cargo_data,
-                        created_at=quote_model.created_at,
-                    )
-                )
-            return sorted(response_list, key=lambda x: x.created_at, reverse=True)
+        # 행은 견적 컬럼, 출발지 컬럼, 도착지 컬럼 순서입니다.
+        quote_end = len(QUOTE_LIST_FIELDS)
+        from_end = quote_end + len(QUOTE_LIST_LOCATION_FIELDS)
+        items = []
+        for row in quote_rows:
+            item = dict(zip(QUOTE_LIST_FIELDS, row[:quote_end]))
+            item["from_location"] = dict(
+                zip(QUOTE_LIST_LOCATION_FIELDS, row[quote_end:from_end])
+            )
+            item["to_location"] = dict(zip(QUOTE_LIST_LOCATION_FIELDS, row[from_end:]))
+            item["cargo"] = cargo_by_quote_id.get(item["id"], [])
+            items.append(item)
+        return QuoteListPage(items=items, next_cursor=next_cursor)
 
-    async def _get_location_detail_schema(
+    def _build_location_detail(
         self, loc_model: QuoteLocation
     ) -> QuoteLocationWithIDSchema:
-        accessorial_models = (
-            await self.uow.quote_location_accessorial.get_quote_location_accessorials(
-                loc_model.id
-            )
-        )
+        # quote_location_accessorial → cargo_accessorial은 get_quote_by_id에서 함께 적재되어 있어 추가 조회가 없습니다.
         accessorial_schemas = [
             QuoteLocationAccessorialSchema(
                 cargo_accessorial_id=acc.cargo_accessorial_id,
                 name=acc.cargo_accessorial.name,
             )
-            for acc in accessorial_models
+            for acc in loc_model.quote_location_accessorial
         ]
         return QuoteLocationWithIDSchema(
             id=loc_model.id,
@@ -158,287 +164,268 @@ class QuoteService:
             accessorials=accessorial_schemas,
         )
 
-    async def _get_cargo_detail_schemas(
-        self, quote_cargo_models: List[QuoteCargo]
-    ) -> List[QuoteCargoWithIDSchema]:
+    def _build_location_details(
+        self, quote_model: Quote
+    ) -> Tuple[Optional[QuoteLocationWithIDSchema], Optional[QuoteLocationWithIDSchema]]:
+        """(출발지, 도착지) 상세를 반환합니다. 없는 위치는 None입니다."""
+        from_location_detail = None
+        to_location_detail = None
+        for loc_model in quote_model.quote_location:
+            if loc_model.shipment_type == ShipmentTypeEnum.PICKUP:
+                from_location_detail = self._build_location_detail(loc_model)
+            elif loc_model.shipment_type == ShipmentTypeEnum.DELIVERY:
+                to_location_detail = self._build_location_detail(loc_model)
+        return from_location_detail, to_location_detail
+
+    def _build_cargo_details(self, quote_model: Quote) -> List[QuoteCargoWithIDSchema]:
         return [
             QuoteCargoWithIDSchema.model_validate(qc_model)
-            for qc_model in quote_cargo_models
+            for qc_model in quote_model.quote_cargo
         ]
 
-    async def get_quote_by_id(
-        self, quote_id: str, token_data: TokenData
-    ) -> GetQuoteDetailsResponse:
+    def _build_quote_details(self, quote_model: Quote) -> GetQuoteDetailsResponse:
+        """상세 조회/수정 응답 공용 조립기입니다. get_quote_by_id로 적재한 집합체만 사용합니다."""
+        from_location_detail, to_location_detail = self._build_location_details(
+            quote_model
+        )
+        if not from_location_detail or not to_location_detail:
+            raise NotFoundException(
+                message=f"견적 {quote_model.id}의 출발지 또는 도착지 정보를 찾을 수 없습니다."
+            )
+
+        return GetQuoteDetailsResponse(
+            id=quote_model.id,
+            user_id=quote_model.user_id,
+            cargo_transportation_id=quote_model.cargo_transportation_id,
+            is_priority=quote_model.is_priority,
+            total_weight=quote_model.total_weight,
+            base_price=quote_model.base_price,
+            extra_price=quote_model.extra_price,
+            total_price=quote_model.total_price,
+            order_status=quote_model.order_status,
+            order_primary=quote_model.order_primary,
+            order_additional_request=quote_model.order_additional_request,
+            from_location=from_location_detail,
+            to_location=to_location_detail,
+            cargo=self._build_cargo_details(quote_model),
+            created_at=quote_model.created_at,
+        )
+
+    async def get_quotes_etag(
+        self, user_id: int, limit: int = DEFAULT_PAGE_LIMIT, cursor: Optional[str] = None
+    ) -> str:
+        """
+        목록 응답의 ETag입니다. 견적이 추가되면 견적 수가, 수정/제출/확정되면 버전 합계가 바뀝니다.
+        (위치/화물 변경도 견적 행의 버전을 함께 올립니다. 초 단위 수정 시각과 달리 같은 초의 연속 수정도 구분됩니다)
+        """
         async with self.uow:
+            quote_count, last_created_at, version_sum = (
+                await self.uow.quote.get_quote_list_fingerprint(user_id)
+            )
+        return build_etag(
+            "quotes", user_id, quote_count, last_created_at, version_sum, limit, cursor
+        )
 
-            quote_model = await self.uow.quote.get_quote_by_id(quote_id)
+    async def get_quote_etag(self, quote_id: str, token_data: TokenData) -> str:
+        """상세 응답의 ETag입니다. 집합체를 적재하기 전에 PK 조회 한 번으로 권한 확인과 함께 계산합니다."""
+        async with self.uow:
+            etag_row = await self.uow.quote.get_quote_etag_row(quote_id)
+        if etag_row is None:
+            raise NotFoundException(message="견적을 찾을 수 없습니다.")
 
-            if token_data.role_id == 1 and quote_model.user_id != token_data.user_id:
-                raise ForbiddenException(message="Forbidden:: Owner only")
+        if token_data.role_id == 1 and etag_row.user_id != token_data.user_id:
+            raise ForbiddenException(message="Forbidden:: Owner only")
 
-            pprint(quote_model.__dict__ if quote_model else "quote_model is None")
-            if quote_model:
-                quote_location_models = quote_model.quote_location
-                if quote_location_models and len(quote_location_models) > 0:
-                    pprint(
-                        quote_location_models[0].__dict__
-                        if len(quote_location_models) > 0
-                        else "quote_location_models[0] is not accessible"
-                    )
-                    if len(quote_location_models) > 1:
-                        pprint(
-                            quote_location_models[1].__dict__
-                            if len(quote_location_models) > 1
-                            else "quote_location_models[1] is not accessible"
-                        )
-                else:
-                    print("quote_location_models is None or empty")
-
-                quote_cargo_models = quote_model.quote_cargo
-                if quote_cargo_models and len(quote_cargo_models) > 0:
-                    pprint(
-                        quote_cargo_models[0].__dict__
-                        if len(quote_cargo_models) > 0
-                        else "quote_cargo_models[0] is not accessible"
-                    )
-                else:
-                    print("quote_cargo_models is None or empty")
+        return build_etag("quote", quote_id, *etag_row[1:])
 
+    async def get_quote_by_id(
+        self, quote_id: str, token_data: TokenData
+    ) -> GetQuoteDetailsResponse:
+        async with self.uow:
+            quote_model = await self.uow.quote.get_quote_by_id(quote_id)
             if quote_model is None:
                 raise NotFoundException(message="견적을 찾을 수 없습니다.")
 
-            from_location_detail = None
-            to_location_detail = None
-
-            if hasattr(quote_model, "quote_location") and quote_model.quote_location:
-                for loc_model in quote_model.quote_location:
-                    loc_detail_schema = await self._get_location_detail_schema(
-                        loc_model
-                    )
-                    if loc_model.shipment_type == ShipmentTypeEnum.PICKUP:
-                        from_location_detail = loc_detail_schema
-                    elif loc_model.shipment_type == ShipmentTypeEnum.DELIVERY:
-                        to_location_detail = loc_detail_schema
-
-            if not from_location_detail or not to_location_detail:
-                raise NotFoundException(
-                    message=f"견적 {quote_id}의 출발지 또는 도착지 정보를 찾을 수 없습니다."
-                )
-
-            cargo_details = []
-            if hasattr(quote_model, "quote_cargo") and quote_model.quote_cargo:
-                cargo_details = await self._get_cargo_detail_schemas(
-                    quote_model.quote_cargo
-                )
+            if token_data.role_id == 1 and quote_model.user_id != token_data.user_id:
+                raise ForbiddenException(message="Forbidden:: Owner only")
 
-            return GetQuoteDetailsResponse(
-                id=quote_model.id,
-                user_id=quote_model.user_id,
-                cargo_transportation_id=quote_model.cargo_transportation_id,
-                is_priority=quote_model.is_priority,
-                total_weight=quote_model.total_weight,
-                base_price=quote_model.base_price,
-                extra_price=quote_model.extra_price,
-                total_price=quote_model.total_price,
-                order_status=quote_model.order_status,
-                order_primary=quote_model.order_primary,
-                order_additional_request=quote_model.order_additional_request,
-                from_location=from_location_detail,
-                to_location=to_location_detail,
-                cargo=cargo_details,
-                created_at=quote_model.created_at,
-            )
+            return self._build_quote_details(quote_model)
 
     async def create_quote(
         self,
         user_id: int,
         quote_data: CreateQuoteRequest,
-        total_weight: Decimal,
-        base_price: Decimal,
-        extra_price: Decimal,
-        total_price_with_discount: Decimal,
+        quote_price: QuotePriceSchema,
     ) -> BaseQuoteSchema:
         async with self.uow:
             new_quote_model = await self.uow.quote.create_quote(
                 user_id=user_id,
-                total_weight=total_weight,
-                base_price=base_price,
-                extra_price=extra_price,
-                total_price_with_discount=total_price_with_discount,
+                total_weight=quote_price.total_weight,
+                base_price=quote_price.base_price,
+                extra_price=quote_price.extra_price,
+                total_price_with_discount=quote_price.total_price,
                 quote_payload=quote_data,
             )
 
-            await self.uow.quote_location.create_quote_location(
-                new_quote_model.id, quote_data.from_location, ShipmentTypeEnum.PICKUP
+            await self.quote_summary.record_change(
+                None,
+                QuoteSummaryRow(
+                    order_status=new_quote_model.order_status,
+                    created_at=new_quote_model.created_at,
+                    total_price=quote_price.total_price,
+                    from_zip_code=quote_data.from_location.zip_code,
+                    to_zip_code=quote_data.to_location.zip_code,
+                ),
             )
-            await self.uow.quote_location_accessorial.create_quote_location_accessorial(
-                (
-                    await self.uow.quote_location.get_quote_location_by_shipment_type(
-                        new_quote_model.id, ShipmentTypeEnum.PICKUP
-                    )
-                ).id,
-                quote_data.from_location.accessorials,
+
+            return BaseQuoteSchema.model_validate(new_quote_model)
+
+    async def create_quotes_bulk(
+        self, token_data: TokenData, quote_requests: List[CreateQuoteRequest]
+    ) -> List[BulkCreateQuoteResponse]:
+        """
+        여러 견적을 한 트랜잭션에서 생성합니다. 모든 항목을 먼저 검증/계산하고, 실패한 항목은 index별 오류로 돌려줍니다.
+        성공한 항목은 테이블별 다중 행 INSERT로 한 번에 저장하므로 요청 수가 아니라 견적 수에 비례해 비용이 늘어납니다.
+        """
+        if not quote_requests:
+            raise BadRequestException(message="생성할 견적이 없습니다.")
+        if len(quote_requests) > settings.QUOTE_BULK_MAX_ITEMS:
+            raise BadRequestException(
+                message=f"한 번에 최대 {settings.QUOTE_BULK_MAX_ITEMS}건까지 생성할 수 있습니다."
             )
-            await self.uow.quote_location.create_quote_location(
-                new_quote_model.id, quote_data.to_location, ShipmentTypeEnum.DELIVERY
+
+        async with self.uow:
+            price_results = await CostService(self.uow).calculate_batch_prices(
+                token_data, quote_requests
             )
-            await self.uow.quote_location_accessorial.create_quote_location_accessorial(
-                (
-                    await self.uow.quote_location.get_quote_location_by_shipment_type(
-                        new_quote_model.id, ShipmentTypeEnum.DELIVERY
+            # 운송 수단은 운임 계산에서 검증되지 않으므로, FK 오류로 전체가 롤백되지 않도록 미리 확인합니다.
+            transportation_ids = {
+                transportation.id
+                for transportation in await self.uow.cargo.get_cargo_transportation()
+            }
+
+            results: List[BulkCreateQuoteResponse] = []
+            priced_quotes = []
+            priced_indexes = []
+            for quote_request, price_result in zip(quote_requests, price_results):
+                error = price_result.error
+                if (
+                    error is None
+                    and quote_request.cargo_transportation_id not in transportation_ids
+                ):
+                    error = NotFoundException(
+                        message=f"운송 수단 ID {quote_request.cargo_transportation_id}를 찾을 수 없습니다."
+                    ).to_error_detail()
+                if error is not None:
+                    results.append(
+                        BulkCreateQuoteResponse(index=price_result.index, error=error)
                     )
-                ).id,
-                quote_data.to_location.accessorials,
+                    continue
+                priced_quotes.append((quote_request, price_result.price))
+                priced_indexes.append(price_result.index)
+
+            quote_rows = await self.uow.quote.bulk_create_quotes(
+                token_data.user_id, priced_quotes
             )
-            await self.uow.quote_cargo.create_quote_cargo(
-                new_quote_model.id, quote_data.cargo
+            await self.quote_summary.record_created(
+                [
+                    QuoteSummaryRow(
+                        order_status=quote_row["order_status"],
+                        created_at=quote_row["created_at"],
+                        total_price=quote_row["total_price"],
+                        from_zip_code=quote_request.from_location.zip_code,
+                        to_zip_code=quote_request.to_location.zip_code,
+                    )
+                    for quote_row, (quote_request, _) in zip(quote_rows, priced_quotes)
+                ]
             )
 
-            return BaseQuoteSchema.model_validate(new_quote_model)
+        results.extend(
+            BulkCreateQuoteResponse(
+                index=index, quote=BaseQuoteSchema.model_validate(quote_row)
+            )
+            for index, quote_row in zip(priced_indexes, quote_rows)
+        )
+        results.sort(key=lambda result: result.index)
+        return results
 
     async def update_quote(
         self,
         quote_id: str,
         user_id: int,
         quote_data: UpdateQuoteRequest,
-        total_weight: Decimal,
-        base_price: Decimal,
-        extra_price: Decimal,
-        total_price_with_discount: Decimal,
+        quote_price: QuotePriceSchema,
     ) -> GetQuoteDetailsResponse:
         async with self.uow:
+            summary_before = await self.uow.quote.get_quote_summary_row(quote_id)
             updated_quote_model = await self.uow.quote.update_quote(
                 quote_id=quote_id,
                 user_id=user_id,
                 is_priority=quote_data.is_priority,
                 cargo_transportation_id=quote_data.cargo_transportation_id,
-                total_weight=total_weight,
-                base_price=base_price,
-                extra_price=extra_price,
-                total_price_with_discount=total_price_with_discount,
+                total_weight=quote_price.total_weight,
+                base_price=quote_price.base_price,
+                extra_price=quote_price.extra_price,
+                total_price_with_discount=quote_price.total_price,
             )
             if updated_quote_model is None:
                 raise NotFoundException(
                     message=f"견적 ID {quote_id}를 업데이트하거나 찾을 수 없습니다."
                 )
 
-            from_location_model = (
-                await self.uow.quote_location.get_quote_location_by_shipment_type(
-                    quote_id, ShipmentTypeEnum.PICKUP
-                )
-            )
+            # 수정 결과로 다시 적재한 집합체와 요청을 비교해 바뀐 행만 반영합니다.
+            location_models = {
+                location.shipment_type: location
+                for location in updated_quote_model.quote_location
+            }
+            from_location_model = location_models.get(ShipmentTypeEnum.PICKUP)
             if from_location_model is None:
                 raise NotFoundException(
                     message=f"견적 {quote_id}의 출발지 정보를 찾을 수 없습니다."
                 )
-            await self.uow.quote_location.update_quote_location(
-                from_location_model.id, quote_data.from_location
-            )
-            await self._update_accessorials(
-                from_location_model.id, quote_data.from_location.accessorials
-            )
+            await self._update_location(from_location_model, quote_data.from_location)
 
-            to_location_model = (
-                await self.uow.quote_location.get_quote_location_by_shipment_type(
-                    quote_id, ShipmentTypeEnum.DELIVERY
-                )
-            )
+            to_location_model = location_models.get(ShipmentTypeEnum.DELIVERY)
             if to_location_model is None:
                 raise NotFoundException(
                     message=f"견적 {quote_id}의 도착지 정보를 찾을 수 없습니다."
                 )
-            await self.uow.quote_location.update_quote_location(
-                to_location_model.id, quote_data.to_location
-            )
-            await self._update_accessorials(
-                to_location_model.id, quote_data.to_location.accessorials
-            )
-
-            await self.uow.quote_cargo.delete_quote_cargo(quote_id)
-            created_cargos_models = await self.uow.quote_cargo.create_quote_cargo(
-                quote_id, quote_data.cargo
-            )
-
-            from_accessorial_models = await self.uow.quote_location_accessorial.get_quote_location_accessorials(
-                from_location_model.id
-            )
-            from_accessorial_schemas = [
-                QuoteLocationAccessorialSchema(
-                    cargo_accessorial_id=acc.cargo_accessorial_id,
-                    name=acc.cargo_accessorial.name,
-                )
-                for acc in from_accessorial_models
-            ]
-
-            from_location_schema = QuoteLocationWithIDSchema(
-                id=from_location_model.id,
-                state=from_location_model.state,
-                county=from_location_model.county,
-                city=from_location_model.city,
-                zip_code=from_location_model.zip_code,
-                address=from_location_model.address,
-                location_type=from_location_model.location_type,
-                request_datetime=from_location_model.request_datetime,
-                accessorials=from_accessorial_schemas,
-            )
+            await self._update_location(to_location_model, quote_data.to_location)
 
-            to_accessorial_models = await self.uow.quote_location_accessorial.get_quote_location_accessorials(
-                to_location_model.id
+            await self._update_cargo(
+                quote_id, updated_quote_model.quote_cargo, quote_data.cargo
             )
-            to_accessorial_schemas = [
-                QuoteLocationAccessorialSchema(
-                    cargo_accessorial_id=acc.cargo_accessorial_id,
-                    name=acc.cargo_accessorial.name,
-                )
-                for acc in to_accessorial_models
-            ]
-
-            to_location_schema = QuoteLocationWithIDSchema(
-                id=to_location_model.id,
-                state=to_location_model.state,
-                county=to_location_model.county,
-                city=to_location_model.city,
-                zip_code=to_location_model.zip_code,
-                address=to_location_model.address,
-                location_type=to_location_model.location_type,
-                request_datetime=to_location_model.request_datetime,
-                accessorials=to_accessorial_schemas,
+            await self.quote_summary.record_change(
+                QuoteSummaryRow(*summary_before),
+                QuoteSummaryRow(*await self.uow.quote.get_quote_summary_row(quote_id)),
             )
 
-            cargo_details_schemas = []
-            for qc_model in created_cargos_models:
-                cargo_details_schemas.append(
-                    QuoteCargoWithIDSchema.model_validate(qc_model)
-                )
+            # 변경된 위치/부가 서비스/화물을 반영하도록 집합체를 다시 적재해 공용 조립기로 응답을 만듭니다.
+            quote_model = await self.uow.quote.get_quote_by_id(quote_id)
+            return self._build_quote_details(quote_model)
 
-            return GetQuoteDetailsResponse(
-                id=updated_quote_model.id,
-                user_id=updated_quote_model.user_id,
-                cargo_transportation_id=updated_quote_model.cargo_transportation_id,
-                is_priority=updated_quote_model.is_priority,
-                total_weight=updated_quote_model.total_weight,
-                base_price=updated_quote_model.base_price,
-                extra_price=updated_quote_model.extra_price,
-                total_price=updated_quote_model.total_price,
-                order_status=updated_quote_model.order_status,
-                order_primary=updated_quote_model.order_primary,
-                order_additional_request=updated_quote_model.order_additional_request,
-                from_location=from_location_schema,
-                to_location=to_location_schema,
-                cargo=cargo_details_schemas,
-                created_at=updated_quote_model.created_at,
+    async def _update_location(
+        self, location_model: QuoteLocation, location_data: QuoteLocationSchema
+    ):
+        # 위치 값이 그대로면 UPDATE를 보내지 않습니다.
+        if any(
+            getattr(location_model, field) != getattr(location_data, field)
+            for field in QUOTE_LOCATION_FIELDS
+        ):
+            await self.uow.quote_location.update_quote_location(
+                location_model.id, location_data
             )
+        await self._update_accessorials(location_model, location_data.accessorials)
 
     async def _update_accessorials(
-        self, location_id: int, new_accessorials: List[QuoteLocationAccessorialSchema]
+        self,
+        location_model: QuoteLocation,
+        new_accessorials: List[QuoteLocationAccessorialSchema],
     ):
-        current_accessorials = (
-            await self.uow.quote_location_accessorial.get_quote_location_accessorials(
-                location_id
-            )
-        )
+        location_id = location_model.id
         current_cargo_accessorial_ids = {
-            acc.cargo_accessorial_id for acc in current_accessorials
+            acc.cargo_accessorial_id
+            for acc in location_model.quote_location_accessorial
         }
         new_cargo_accessorial_ids = {
             acc_schema.cargo_accessorial_id for acc_schema in new_accessorials
@@ -462,30 +449,55 @@ class QuoteService:
                 location_id, to_add_schemas
             )
 
-    async def _prepare_bol_payload(self, quote_model: Quote) -> dict:
-
-        from_loc_bol_schema = None
-        to_loc_bol_schema = None
-
-        if hasattr(quote_model, "quote_location") and quote_model.quote_location:
-            for loc_model in quote_model.quote_location:
-                loc_schema = await self._get_location_detail_schema(loc_model)
-                if loc_model.shipment_type == ShipmentTypeEnum.PICKUP:
-                    from_loc_bol_schema = loc_schema
-                elif loc_model.shipment_type == ShipmentTypeEnum.DELIVERY:
-                    to_loc_bol_schema = loc_schema
+    async def _update_cargo(
+        self,
+        quote_id: str,
+        current_cargos: List[QuoteCargo],
+        new_cargos: List[UpdateQuoteCargoSchema],
+    ):
+        """
+        화물 ID 기준으로 바뀐 화물은 UPDATE, ID가 없는 화물은 INSERT, 요청에 없는 화물은 DELETE 합니다.
+        각각 한 번의 일괄 문장으로 실행하고, 바뀌지 않은 화물에는 문장을 보내지 않습니다.
+        """
+        current_cargo_by_id = {cargo.id: cargo for cargo in current_cargos}
+        requested_ids = [cargo.id for cargo in new_cargos if cargo.id is not None]
+        if len(requested_ids) != len(set(requested_ids)):
+            raise BadRequestException(
+                message="같은 화물 ID가 두 번 이상 요청되었습니다."
+            )
+        unknown_ids = set(requested_ids) - current_cargo_by_id.keys()
+        if unknown_ids:
+            raise BadRequestException(
+                message=f"견적 {quote_id}에 없는 화물 ID입니다: {sorted(unknown_ids)}"
+            )
 
+        to_update_rows = []
+        to_add_schemas = []
+        for cargo_schema in new_cargos:
+            if cargo_schema.id is None:
+                to_add_schemas.append(cargo_schema)
+                continue
+            cargo_model = current_cargo_by_id[cargo_schema.id]
+            values = cargo_schema.model_dump(include=set(QUOTE_CARGO_FIELDS))
+            if any(
+                getattr(cargo_model, field) != value for field, value in values.items()
+            ):
+                to_update_rows.append({"id": cargo_schema.id, **values})
+        to_delete_ids = list(current_cargo_by_id.keys() - set(requested_ids))
+
+        await self.uow.quote_cargo.delete_quote_cargo_by_ids(quote_id, to_delete_ids)
+        await self.uow.quote_cargo.update_quote_cargo(to_update_rows)
+        await self.uow.quote_cargo.insert_quote_cargo(quote_id, to_add_schemas)
+
+    def _prepare_bol_payload(self, quote_model: Quote) -> dict:
+        from_loc_bol_schema, to_loc_bol_schema = self._build_location_details(
+            quote_model
+        )
         if not from_loc_bol_schema or not to_loc_bol_schema:
             raise NotFoundException(
                 message=f"견적 {quote_model.id}의 BOL 생성을 위한 위치 정보를 찾을 수 없습니다."
             )
 
-        cargo_bol_schemas = []
-        if hasattr(quote_model, "quote_cargo") and quote_model.quote_cargo:
-            cargo_bol_schemas = await self._get_cargo_detail_schemas(
-                quote_model.quote_cargo
-            )
-
         quote_data_for_bol_dict = {
             "id": quote_model.id,
             "user_id": quote_model.user_id,
@@ -498,13 +510,9 @@ class QuoteService:
             "order_status": quote_model.order_status.value,
             "order_primary": quote_model.order_primary,
             "order_additional_request": quote_model.order_additional_request,
-            "from_location": (
-                from_loc_bol_schema.model_dump() if from_loc_bol_schema else None
-            ),
-            "to_location": (
-                to_loc_bol_schema.model_dump() if to_loc_bol_schema else None
-            ),
-            "cargo": [c.model_dump() for c in cargo_bol_schemas],
+            "from_location": from_loc_bol_schema.model_dump(),
+            "to_location": to_loc_bol_schema.model_dump(),
+            "cargo": [c.model_dump() for c in self._build_cargo_details(quote_model)],
         }
         return quote_data_for_bol_dict
 
@@ -546,26 +554,24 @@ class QuoteService:
 
             order_primary = self._generate_order_primary(user_id, daily_submit_count)
 
+            summary_before = await self.uow.quote.get_quote_summary_row(quote_id)
             await self.uow.quote.submit_quote(quote_id, user_id, order_primary)
+            if summary_before is not None:
+                summary_before = QuoteSummaryRow(*summary_before)
+                await self.quote_summary.record_change(
+                    summary_before,
+                    summary_before._replace(order_status=OrderStatusEnum.SUBMIT),
+                )
             quote_model = await self.uow.quote.get_quote_by_id(quote_id)
             user_model = await self.uow.user.get_user_by_id(quote_model.user_id)
 
-            try:
-
-                email_service = EmailSender(
-                    subject=f"Load {order_primary} Order Received",
-                    receiver_email=user_model.email,
-                    client_name=f"{user_model.first_name} {user_model.last_name}",
-                    quote_id=quote_model.id,
-                    order_primary=order_primary,
-                )
-                await email_service.send_email()
-
-            except Exception as e:
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"견적 제출 DB 업데이트는 성공했으나, 후속 작업(PDF/Email) 실패: {str(e)}",
-                )
+            # 접수 안내 메일은 같은 트랜잭션에 기록만 하고, 발송은 백그라운드 발송기가 맡습니다.
+            await self.email_outbox.enqueue_quote_submitted(
+                quote_id=quote_model.id,
+                receiver_email=user_model.email,
+                client_name=f"{user_model.first_name} {user_model.last_name}",
+                order_primary=order_primary,
+            )
 
             return await self.get_quote_by_id(quote_id, token_data)
 
@@ -588,13 +594,21 @@ class QuoteService:
                     message=f"견적 ID {quote_id}를 찾을 수 없습니다. (BOL/Email 생성용)"
                 )
 
+            summary_before = QuoteSummaryRow.from_model(quote_model)
             await self.uow.quote.confirm_quote(quote_id, request.actual_price)
+            await self.quote_summary.record_change(
+                summary_before,
+                summary_before._replace(
+                    order_status=OrderStatusEnum.ACCEPT,
+                    total_price=Decimal(str(request.actual_price)),
+                ),
+            )
             await self.uow.user.update_user_total_amount(
                 user_id=quote_model.user_id, total_amount=request.actual_price
             )
 
             user_model = await self.uow.user.get_user_by_id(quote_model.user_id)
 
-            quote_data_for_bol_dict = await self._prepare_bol_payload(quote_model)
+            quote_data_for_bol_dict = self._prepare_bol_payload(quote_model)
 
             return await self.get_quote_by_id(quote_id, token_data)
@@ -0,0 +1,90 @@
+import csv
+import io
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import AsyncIterator, Callable, List, Literal
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db.session import async_session
+from ..db.unit_of_work import ReadOnlyUnitOfWork
+from ..core.exceptions import ForbiddenException
+from ..repository.quote import QUOTE_EXPORT_COLUMNS
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+DEFAULT_EXPORT_BATCH_SIZE = 1000
+
+
+def _json_default(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__}는 JSON으로 변환할 수 없습니다.")
+
+
+def _csv_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+class QuoteExportService:
+    """
+    관리자용 견적 내보내기입니다. 서버 측 커서로 batch_size 행씩 읽어 바로 내보내므로 메모리 사용량이 행 수와 무관합니다.
+    StreamingResponse 본문은 요청 의존성(세션)이 정리된 뒤에 전송되므로, 내보내기는 자체 세션을 엽니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = async_session,
+        batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+
+    def export_quotes(
+        self, role_id: int, status: List[str], export_format: ExportFormat
+    ) -> AsyncIterator[str]:
+        # 권한 검사는 응답을 시작하기 전에 끝나야 하므로 제너레이터 밖에서 수행합니다.
+        if role_id != 2:
+            raise ForbiddenException(message="Forbidden:: Admin only")
+        if export_format == "csv":
+            return self._iter_csv(status)
+        return self._iter_ndjson(status)
+
+    async def _iter_rows(self, status: List[str]) -> AsyncIterator[List[tuple]]:
+        async with self.session_factory() as session:
+            uow = ReadOnlyUnitOfWork(session)
+            async with uow:
+                async for rows in uow.quote.stream_export_rows(status, self.batch_size):
+                    yield rows
+
+    async def _iter_ndjson(self, status: List[str]) -> AsyncIterator[str]:
+        async for rows in self._iter_rows(status):
+            yield "".join(
+                json.dumps(
+                    dict(zip(QUOTE_EXPORT_COLUMNS, row)),
+                    default=_json_default,
+                    ensure_ascii=False,
+                )
+                + "\n"
+                for row in rows
+            )
+
+    async def _iter_csv(self, status: List[str]) -> AsyncIterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(QUOTE_EXPORT_COLUMNS)
+        yield buffer.getvalue()
+        async for rows in self._iter_rows(status):
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows([_csv_value(value) for value in row] for row in rows)
+            yield buffer.getvalue()
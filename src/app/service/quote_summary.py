@@ -0,0 +1,389 @@
+"""
+관리자 대시보드 집계(quote_summary)를 관리합니다.
+
+QuoteService의 상태 변경(생성, 수정, 제출, 승인)은 같은 트랜잭션에서 (상태, 구역, 주) 키의 증감분을 quote_summary에 반영하고,
+커밋이 성공하면 프로세스 내 캐시에도 반영합니다. 대시보드는 캐시만 읽으며, 캐시가 비었거나 TTL이 지나면
+quote_summary만 한 번 조회합니다. (견적 수와 무관)
+
+재집계기는 quote_summary를 잠근 뒤 quote 전체를 다시 집계해 현재 행과의 차이만 반영하므로, 다른 경로로 바뀐 견적이나
+요율표 변경으로 생긴 차이(drift)를 바로잡으면서도 재집계 중 들어온 증감분을 잃지 않습니다.
+서버 안의 주기 실행은 QUOTE_SUMMARY_RECONCILER_ENABLED로 켜며, 아래처럼 직접 실행할 수도 있습니다.
+
+    ENV=dev poetry run python -m app.service.quote_summary
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional
+
+from ..core.config import settings
+from ..core.exceptions import ForbiddenException
+from ..db.session import async_session
+from ..db.unit_of_work import UnitOfWork
+from ..model._enum import OrderStatusEnum, ShipmentTypeEnum
+from ..model.quote import Quote
+from ..schema.quote.response import (
+    QuoteAreaSummarySchema,
+    QuoteDashboardResponse,
+    QuoteStatusSummarySchema,
+    QuoteWeekSummarySchema,
+)
+from .rate_snapshot import RateSnapshot, rate_snapshot_store
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN_AREA_ID = 0
+DEFAULT_RECONCILE_BATCH_SIZE = 1000
+
+
+class QuoteSummaryRow(NamedTuple):
+    """한 견적이 집계에 기여하는 값입니다. QuoteRepository.get_quote_summary_row와 컬럼 순서가 같습니다."""
+
+    order_status: OrderStatusEnum
+    created_at: datetime
+    total_price: Decimal
+    from_zip_code: Optional[str]
+    to_zip_code: Optional[str]
+
+    @classmethod
+    def from_model(cls, quote_model: Quote) -> "QuoteSummaryRow":
+        zip_codes = {
+            location.shipment_type: location.zip_code
+            for location in quote_model.quote_location
+        }
+        return cls(
+            order_status=quote_model.order_status,
+            created_at=quote_model.created_at,
+            total_price=quote_model.total_price,
+            from_zip_code=zip_codes.get(ShipmentTypeEnum.PICKUP),
+            to_zip_code=zip_codes.get(ShipmentTypeEnum.DELIVERY),
+        )
+
+
+@dataclass(frozen=True)
+class QuoteSummaryKey:
+    order_status: OrderStatusEnum
+    area_id: int
+    week_start: date
+
+
+@dataclass(frozen=True)
+class QuoteSummaryTotal:
+    quote_count: int = 0
+    total_price: Decimal = Decimal(0)
+
+    def __add__(self, other: "QuoteSummaryTotal") -> "QuoteSummaryTotal":
+        return QuoteSummaryTotal(
+            quote_count=self.quote_count + other.quote_count,
+            total_price=self.total_price + other.total_price,
+        )
+
+    def __sub__(self, other: "QuoteSummaryTotal") -> "QuoteSummaryTotal":
+        return QuoteSummaryTotal(
+            quote_count=self.quote_count - other.quote_count,
+            total_price=self.total_price - other.total_price,
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        return self.quote_count == 0 and self.total_price == 0
+
+
+def get_week_start(created_at: datetime) -> date:
+    # 주는 월요일부터 시작합니다.
+    return created_at.date() - timedelta(days=created_at.weekday())
+
+
+def get_summary_area_id(
+    rate_snapshot: Optional[RateSnapshot],
+    from_zip_code: Optional[str],
+    to_zip_code: Optional[str],
+) -> int:
+    # CostService._get_base_area와 같이 출발지/도착지 구역 중 ID가 큰 구역을 기준으로 합니다.
+    if rate_snapshot is None:
+        return UNKNOWN_AREA_ID
+    from_area_id = rate_snapshot.zip_code_areas.get(from_zip_code)
+    to_area_id = rate_snapshot.zip_code_areas.get(to_zip_code)
+    if from_area_id is None or to_area_id is None:
+        return UNKNOWN_AREA_ID
+    return max(from_area_id, to_area_id)
+
+
+def get_summary_key(
+    row: QuoteSummaryRow, rate_snapshot: Optional[RateSnapshot]
+) -> QuoteSummaryKey:
+    return QuoteSummaryKey(
+        order_status=row.order_status,
+        area_id=get_summary_area_id(rate_snapshot, row.from_zip_code, row.to_zip_code),
+        week_start=get_week_start(row.created_at),
+    )
+
+
+def add_summary_row(
+    totals: Dict[QuoteSummaryKey, QuoteSummaryTotal],
+    row: QuoteSummaryRow,
+    rate_snapshot: Optional[RateSnapshot],
+    sign: int = 1,
+):
+    key = get_summary_key(row, rate_snapshot)
+    total = totals.get(key, QuoteSummaryTotal()) + QuoteSummaryTotal(
+        quote_count=sign, total_price=sign * Decimal(row.total_price)
+    )
+    if total.is_empty:
+        totals.pop(key, None)
+    else:
+        totals[key] = total
+
+
+def build_summary_deltas(
+    before: Optional[QuoteSummaryRow],
+    after: Optional[QuoteSummaryRow],
+    rate_snapshot: Optional[RateSnapshot],
+) -> Dict[QuoteSummaryKey, QuoteSummaryTotal]:
+    """변경 전 행을 빼고 변경 후 행을 더한 증감분입니다. 키와 금액이 그대로면 비어 있습니다."""
+    deltas: Dict[QuoteSummaryKey, QuoteSummaryTotal] = {}
+    if before is not None:
+        add_summary_row(deltas, before, rate_snapshot, sign=-1)
+    if after is not None:
+        add_summary_row(deltas, after, rate_snapshot)
+    return deltas
+
+
+def build_reconcile_deltas(
+    current: Mapping[QuoteSummaryKey, QuoteSummaryTotal],
+    totals: Mapping[QuoteSummaryKey, QuoteSummaryTotal],
+) -> Dict[QuoteSummaryKey, QuoteSummaryTotal]:
+    """현재 집계를 다시 집계한 값으로 맞추는 증감분입니다. 값이 같은 키는 포함하지 않습니다."""
+    deltas: Dict[QuoteSummaryKey, QuoteSummaryTotal] = {}
+    for key in current.keys() | totals.keys():
+        delta = totals.get(key, QuoteSummaryTotal()) - current.get(
+            key, QuoteSummaryTotal()
+        )
+        if not delta.is_empty:
+            deltas[key] = delta
+    return deltas
+
+
+def to_summary_values(
+    totals: Mapping[QuoteSummaryKey, QuoteSummaryTotal],
+) -> List[Dict]:
+    return [
+        {
+            "order_status": key.order_status,
+            "area_id": key.area_id,
+            "week_start": key.week_start,
+            "quote_count": total.quote_count,
+            "total_price": total.total_price,
+        }
+        for key, total in totals.items()
+    ]
+
+
+class QuoteSummaryStore:
+    """
+    프로세스 내 대시보드 집계 캐시입니다. 이 프로세스의 증분은 커밋 직후 반영되고,
+    다른 워커의 증분은 TTL이 지난 뒤 quote_summary를 다시 읽어 반영됩니다.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._totals: Mapping[QuoteSummaryKey, QuoteSummaryTotal] = MappingProxyType({})
+        self._loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_stale(self) -> bool:
+        return (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at >= self.ttl_seconds
+        )
+
+    async def get(self, uow: UnitOfWork) -> Mapping[QuoteSummaryKey, QuoteSummaryTotal]:
+        if self.is_stale:
+            return await self.load(uow)
+        return self._totals
+
+    async def load(self, uow: UnitOfWork) -> Mapping[QuoteSummaryKey, QuoteSummaryTotal]:
+        async with self._lock:
+            # 대기하는 동안 다른 요청이 이미 적재했다면 그 결과를 사용합니다.
+            if not self.is_stale:
+                return self._totals
+            async with uow:
+                rows = await uow.quote_summary.get_all_summaries()
+            self.replace(
+                {
+                    QuoteSummaryKey(order_status, area_id, week_start): QuoteSummaryTotal(
+                        quote_count, total_price
+                    )
+                    for order_status, area_id, week_start, quote_count, total_price in rows
+                }
+            )
+            return self._totals
+
+    def replace(self, totals: Mapping[QuoteSummaryKey, QuoteSummaryTotal]):
+        self._totals = MappingProxyType(dict(totals))
+        self._loaded_at = time.monotonic()
+
+    def apply(self, deltas: Mapping[QuoteSummaryKey, QuoteSummaryTotal]):
+        if self._loaded_at is None:
+            # 아직 적재 전이면 첫 조회에서 DB 값을 읽으므로 반영할 필요가 없습니다.
+            return
+        totals = dict(self._totals)
+        for key, delta in deltas.items():
+            total = totals.get(key, QuoteSummaryTotal()) + delta
+            if total.is_empty:
+                totals.pop(key, None)
+            else:
+                totals[key] = total
+        self._totals = MappingProxyType(totals)
+
+
+quote_summary_store = QuoteSummaryStore(settings.QUOTE_SUMMARY_CACHE_TTL_SECONDS)
+
+
+class QuoteSummaryService:
+    def __init__(self, uow: UnitOfWork, store: QuoteSummaryStore = quote_summary_store):
+        self.uow = uow
+        self.store = store
+
+    async def record_change(
+        self, before: Optional[QuoteSummaryRow], after: Optional[QuoteSummaryRow]
+    ):
+        """견적 변경 전후 행의 증감분을 현재 트랜잭션에 반영하고, 커밋되면 캐시에도 반영합니다."""
+        rate_snapshot = await rate_snapshot_store.get(self.uow)
+        await self._apply_deltas(build_summary_deltas(before, after, rate_snapshot))
+
+    async def record_created(self, rows: List[QuoteSummaryRow]):
+        """새로 만든 견적 여러 건의 집계를 합쳐 한 번에 반영합니다."""
+        rate_snapshot = await rate_snapshot_store.get(self.uow)
+        deltas: Dict[QuoteSummaryKey, QuoteSummaryTotal] = {}
+        for row in rows:
+            add_summary_row(deltas, row, rate_snapshot)
+        await self._apply_deltas(deltas)
+
+    async def _apply_deltas(self, deltas: Dict[QuoteSummaryKey, QuoteSummaryTotal]):
+        if not deltas:
+            return
+        await self.uow.quote_summary.apply_summary_deltas(to_summary_values(deltas))
+        self.uow.after_commit(lambda: self.store.apply(deltas))
+
+    async def get_dashboard(
+        self, role_id: int, status: Optional[List[OrderStatusEnum]] = None
+    ) -> QuoteDashboardResponse:
+        """상태별 집계는 전체 상태를, 구역별/주별 집계는 status에 해당하는 견적만 합산합니다."""
+        if role_id != 2:
+            raise ForbiddenException(message="Forbidden:: Admin only")
+
+        totals = await self.store.get(self.uow)
+        rate_snapshot = rate_snapshot_store.snapshot
+        selected_status = set(status) if status else None
+
+        by_status: Dict[OrderStatusEnum, QuoteSummaryTotal] = {}
+        by_area: Dict[int, QuoteSummaryTotal] = {}
+        by_week: Dict[date, QuoteSummaryTotal] = {}
+        for key, total in totals.items():
+            by_status[key.order_status] = (
+                by_status.get(key.order_status, QuoteSummaryTotal()) + total
+            )
+            if selected_status is not None and key.order_status not in selected_status:
+                continue
+            by_area[key.area_id] = by_area.get(key.area_id, QuoteSummaryTotal()) + total
+            by_week[key.week_start] = (
+                by_week.get(key.week_start, QuoteSummaryTotal()) + total
+            )
+
+        def get_area_name(area_id: int) -> Optional[str]:
+            area = rate_snapshot.areas.get(area_id) if rate_snapshot else None
+            return area.name if area else None
+
+        return QuoteDashboardResponse(
+            by_status=[
+                QuoteStatusSummarySchema(
+                    order_status=order_status,
+                    quote_count=by_status[order_status].quote_count,
+                    total_price=by_status[order_status].total_price,
+                )
+                for order_status in OrderStatusEnum
+                if order_status in by_status
+            ],
+            by_area=[
+                QuoteAreaSummarySchema(
+                    area_id=area_id,
+                    area_name=get_area_name(area_id),
+                    quote_count=total.quote_count,
+                    total_price=total.total_price,
+                )
+                for area_id, total in sorted(by_area.items())
+            ],
+            by_week=[
+                QuoteWeekSummarySchema(
+                    week_start=week_start,
+                    quote_count=total.quote_count,
+                    total_price=total.total_price,
+                )
+                for week_start, total in sorted(by_week.items())
+            ],
+        )
+
+    async def reconcile(
+        self, batch_size: int = DEFAULT_RECONCILE_BATCH_SIZE
+    ) -> Mapping[QuoteSummaryKey, QuoteSummaryTotal]:
+        """
+        quote 전체를 다시 집계해 quote_summary와의 차이만 반영합니다.
+
+        quote를 읽기 전에 quote_summary를 FOR UPDATE로 잠그므로 REPEATABLE READ 스냅샷은 잠금 이후에 만들어집니다.
+        잠금 전에 커밋된 변경은 스냅샷에 포함되고, 잠금 이후의 변경은 증감분 반영에서 기다렸다가 재집계 결과 위에 더해집니다.
+        캐시도 교체하지 않고 같은 차이만 더하므로 그 사이 이 프로세스가 반영한 증감분이 사라지지 않습니다.
+        """
+        async with self.uow:
+            rate_snapshot = await rate_snapshot_store.get(self.uow)
+            current = {
+                QuoteSummaryKey(order_status, area_id, week_start): QuoteSummaryTotal(
+                    quote_count, total_price
+                )
+                for order_status, area_id, week_start, quote_count, total_price in (
+                    await self.uow.quote_summary.get_all_summaries(for_update=True)
+                )
+            }
+            totals: Dict[QuoteSummaryKey, QuoteSummaryTotal] = {}
+            async for rows in self.uow.quote.stream_summary_rows(batch_size):
+                for row in rows:
+                    add_summary_row(totals, QuoteSummaryRow(*row), rate_snapshot)
+            deltas = build_reconcile_deltas(current, totals)
+            await self._apply_deltas(deltas)
+            await self.uow.quote_summary.delete_empty_summaries()
+        return totals
+
+
+async def reconcile_quote_summary(
+    batch_size: int = DEFAULT_RECONCILE_BATCH_SIZE,
+) -> Mapping[QuoteSummaryKey, QuoteSummaryTotal]:
+    async with async_session() as session:
+        return await QuoteSummaryService(UnitOfWork(session)).reconcile(batch_size)
+
+
+async def run_quote_summary_reconciler(interval_seconds: float):
+    """interval_seconds마다 재집계합니다. 서버 시작 시에는 전체 스캔을 하지 않으며, 실패해도 다음 주기에 다시 시도합니다."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            started_at = time.perf_counter()
+            totals = await reconcile_quote_summary()
+            logger.info(
+                "Reconciled %s quote summary rows in %.2fs",
+                len(totals),
+                time.perf_counter() - started_at,
+            )
+        except Exception:
+            logger.exception("Failed to reconcile quote summary")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    totals = asyncio.run(reconcile_quote_summary())
+    print(f"quote_summary_rows: {len(totals)}")
@@ -1,6 +1,15 @@
-from typing import Optional
-from ..schema.rate import RateLocationResponse
+import csv
+import io
+from typing import BinaryIO, Optional
+from ..schema.rate import (
+    RateLocationImportResponse,
+    RateLocationResponse,
+    RateSnapshotResponse,
+)
 from ..db.unit_of_work import UnitOfWork
+from ..core.exceptions import BadRequestException, ForbiddenException
+from .rate_import import import_rate_locations
+from .rate_snapshot import rate_snapshot_store
 from typing import List
 
 
@@ -18,3 +27,57 @@ class RateService:
             if not locations:
                 return []
         return [RateLocationResponse.model_validate(loc) for loc in locations]
+
+    async def search_rate_locations(
+        self, region_id: int, query: str, limit: int
+    ) -> List[RateLocationResponse]:
+        """우편번호/도시명 접두어 자동완성입니다. DB 대신 요율 스냅샷의 위치 인덱스를 사용합니다."""
+        rate_snapshot = await rate_snapshot_store.get(self.uow)
+        locations = rate_snapshot.location_index.search(region_id, query, limit)
+        return [RateLocationResponse.model_validate(loc) for loc in locations]
+
+    async def reload_rate_snapshot(self, role_id: int) -> RateSnapshotResponse:
+        if role_id != 2:
+            raise ForbiddenException(message="Forbidden:: Admin only")
+
+        try:
+            rate_snapshot = await rate_snapshot_store.load(self.uow)
+        except ValueError as e:
+            raise BadRequestException(message=f"요율 정보가 올바르지 않습니다. {e}")
+        return RateSnapshotResponse(
+            version=rate_snapshot.version,
+            loaded_at=rate_snapshot.loaded_at,
+            area_count=len(rate_snapshot.areas),
+            zip_code_count=len(rate_snapshot.zip_code_areas),
+        )
+
+    async def import_rate_locations(
+        self, role_id: int, region_id: int, file: BinaryIO
+    ) -> RateLocationImportResponse:
+        if role_id != 2:
+            raise ForbiddenException(message="Forbidden:: Admin only")
+
+        # 업로드 파일을 한 줄씩 디코딩하며 읽으므로 파일 전체를 메모리에 올리지 않습니다.
+        # 읽기와 CSV 파싱은 import_rate_locations가 배치 단위로 스레드에서 실행합니다.
+        lines = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+        try:
+            result = await import_rate_locations(self.uow, region_id, lines)
+        except (ValueError, UnicodeDecodeError, csv.Error) as e:
+            raise BadRequestException(message=f"우편번호 파일이 올바르지 않습니다. {e}")
+        finally:
+            lines.detach()
+
+        try:
+            rate_snapshot = await rate_snapshot_store.load(self.uow)
+        except ValueError as e:
+            raise BadRequestException(message=f"요율 정보가 올바르지 않습니다. {e}")
+        return RateLocationImportResponse(
+            region_id=result.region_id,
+            rows_read=result.rows_read,
+            rows_upserted=result.rows_upserted,
+            rows_skipped=result.rows_skipped,
+            unknown_areas=result.unknown_areas,
+            elapsed_seconds=result.elapsed_seconds,
+            rows_per_second=result.rows_per_second,
+            rate_snapshot_version=rate_snapshot.version,
+        )
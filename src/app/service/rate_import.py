@@ -0,0 +1,172 @@
+"""
+주(state) 단위 우편번호 CSV를 rate_location에 적재하는 임포터입니다.
+
+CSV를 한 줄씩 읽어 batch_size 행마다 multi-row INSERT ... ON DUPLICATE KEY UPDATE로 upsert하므로
+파일 전체를 메모리에 올리지 않습니다. 배치마다 커밋하며, 같은 파일을 다시 적재해도 결과는 같습니다.
+
+    ENV=dev poetry run python -m app.service.rate_import Texas_location.csv --region-id 1
+
+CSV는 zip_code, city, state, county, area 컬럼을 사용합니다. area는 해당 지역의 구역 이름(대소문자 무시)이며,
+비어 있거나 N/A인 행은 건너뜁니다.
+"""
+
+import argparse
+import asyncio
+import csv
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Dict, Iterable, Iterator, List, Mapping
+
+from ..db.session import async_session
+from ..db.unit_of_work import UnitOfWork
+from ..core.exceptions import NotFoundException
+from .rate_snapshot import rate_snapshot_store
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 2000
+REQUIRED_COLUMNS = ("zip_code", "city", "state", "county", "area")
+EMPTY_AREA_NAMES = ("", "N/A")
+
+
+@dataclass
+class RateLocationImportResult:
+    region_id: int
+    rows_read: int = 0
+    rows_upserted: int = 0
+    rows_skipped: int = 0
+    unknown_areas: List[str] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return float(self.rows_read)
+        return self.rows_read / self.elapsed_seconds
+
+
+def normalize_zip_code(zip_code: str) -> str:
+    # 스프레드시트를 거치며 앞자리 0이 빠진 우편번호(예: 501 -> 00501)를 복원합니다.
+    zip_code = zip_code.strip()
+    if zip_code.isdigit() and len(zip_code) < 5:
+        return zip_code.zfill(5)
+    return zip_code
+
+
+def iter_location_batches(
+    lines: Iterable[str],
+    region_id: int,
+    area_ids: Mapping[str, int],
+    result: RateLocationImportResult,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[List[Dict]]:
+    """CSV 줄을 읽어 rate_location 행 배치를 만듭니다. 읽은 행/건너뛴 행 수는 result에 누적합니다."""
+    reader = csv.DictReader(lines)
+    missing_columns = [
+        column for column in REQUIRED_COLUMNS if column not in (reader.fieldnames or [])
+    ]
+    if missing_columns:
+        raise ValueError(f"CSV에 필요한 컬럼이 없습니다: {', '.join(missing_columns)}")
+
+    unknown_areas = set()
+    batch: List[Dict] = []
+    for row in reader:
+        result.rows_read += 1
+        area_name = (row["area"] or "").strip()
+        area_id = area_ids.get(area_name.upper())
+        zip_code = normalize_zip_code(row["zip_code"] or "")
+        if area_id is None or not zip_code:
+            if area_name.upper() not in EMPTY_AREA_NAMES:
+                unknown_areas.add(area_name)
+            result.rows_skipped += 1
+            continue
+
+        batch.append(
+            {
+                "region_id": region_id,
+                "area_id": area_id,
+                "state": row["state"].strip(),
+                "county": row["county"].strip(),
+                "city": row["city"].strip(),
+                "zip_code": zip_code,
+            }
+        )
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+    result.unknown_areas = sorted(unknown_areas)
+
+
+async def get_region_area_ids(uow: UnitOfWork, region_id: int) -> Dict[str, int]:
+    async with uow:
+        areas = await uow.rate_area.get_areas_by_region(region_id)
+    if not areas:
+        raise NotFoundException(message=f"지역 ID {region_id}의 구역을 찾을 수 없습니다.")
+    return {area.name.strip().upper(): area.id for area in areas}
+
+
+async def import_rate_locations(
+    uow: UnitOfWork,
+    region_id: int,
+    lines: Iterable[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> RateLocationImportResult:
+    """
+    지역의 구역을 (region_id, 구역 이름)으로 찾아 CSV 행을 upsert합니다.
+    요율 스냅샷 재적재는 호출자가 담당합니다.
+    """
+    area_ids = await get_region_area_ids(uow, region_id)
+    result = RateLocationImportResult(region_id=region_id)
+    started_at = time.perf_counter()
+    batches = iter_location_batches(lines, region_id, area_ids, result, batch_size)
+    while True:
+        # 파일 읽기와 CSV 파싱은 블로킹이므로 이벤트 루프를 막지 않도록 배치 단위로 스레드에서 실행합니다.
+        batch = await asyncio.to_thread(next, batches, None)
+        if batch is None:
+            break
+        now = datetime.now(UTC)
+        for row in batch:
+            row["created_at"] = now
+            row["updated_at"] = now
+        async with uow:
+            await uow.rate_location.upsert_rate_locations(batch)
+        result.rows_upserted += len(batch)
+        result.elapsed_seconds = time.perf_counter() - started_at
+        logger.info(
+            "Upserted %s rate locations (%.0f rows/s)",
+            result.rows_upserted,
+            result.rows_per_second,
+        )
+    result.elapsed_seconds = time.perf_counter() - started_at
+    return result
+
+
+async def run(file_path: str, region_id: int, batch_size: int = DEFAULT_BATCH_SIZE):
+    async with async_session() as session:
+        uow = UnitOfWork(session)
+        with open(file_path, mode="r", encoding="utf-8-sig", newline="") as file:
+            result = await import_rate_locations(uow, region_id, file, batch_size)
+        rate_snapshot = await rate_snapshot_store.load(uow)
+
+    print(f"rows_read: {result.rows_read}")
+    print(f"rows_upserted: {result.rows_upserted}")
+    print(f"rows_skipped: {result.rows_skipped}")
+    if result.unknown_areas:
+        print(f"unknown_areas: {', '.join(result.unknown_areas)}")
+    print(f"elapsed_seconds: {result.elapsed_seconds:.2f}")
+    print(f"rows_per_second: {result.rows_per_second:.0f}")
+    print(f"rate_snapshot_version: {rate_snapshot.version}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="우편번호 CSV를 rate_location에 upsert합니다.")
+    parser.add_argument("file", help="zip_code,city,state,county,area CSV")
+    parser.add_argument("--region-id", type=int, required=True, help="지역 ID")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+    asyncio.run(run(args.file, args.region_id, args.batch_size))
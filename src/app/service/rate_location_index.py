@@ -0,0 +1,96 @@
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class RateLocationEntry:
+    id: int
+    area_id: int
+    region_id: int
+    state: str
+    county: str
+    city: str
+    zip_code: str
+
+
+def normalize_city(city: str) -> str:
+    # 대소문자, 구두점, 연속 공백을 무시합니다. (예: "Fort  Worth." -> "fort worth")
+    return " ".join(re.sub(r"[^0-9a-z]+", " ", city.casefold()).split())
+
+
+def _search_prefix(
+    keys: Sequence[str],
+    entries: Sequence[RateLocationEntry],
+    prefix: str,
+    limit: int,
+) -> List[RateLocationEntry]:
+    result = []
+    index = bisect_left(keys, prefix)
+    while index < len(keys) and len(result) < limit and keys[index].startswith(prefix):
+        result.append(entries[index])
+        index += 1
+    return result
+
+
+@dataclass(frozen=True)
+class RegionLocationIndex:
+    """한 지역의 우편번호/도시명 정렬 인덱스입니다. 접두어 검색은 이진 탐색 후 일치하는 구간만 읽습니다."""
+
+    zip_keys: Tuple[str, ...]
+    zip_entries: Tuple[RateLocationEntry, ...]
+    city_keys: Tuple[str, ...]
+    city_entries: Tuple[RateLocationEntry, ...]
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[RateLocationEntry]) -> "RegionLocationIndex":
+        entries = list(entries)
+        by_zip = sorted(entries, key=lambda entry: (entry.zip_code, entry.id))
+        by_city = sorted(
+            ((normalize_city(entry.city), entry) for entry in entries),
+            key=lambda item: (item[0], item[1].zip_code, item[1].id),
+        )
+        return cls(
+            zip_keys=tuple(entry.zip_code for entry in by_zip),
+            zip_entries=tuple(by_zip),
+            city_keys=tuple(key for key, _ in by_city),
+            city_entries=tuple(entry for _, entry in by_city),
+        )
+
+    def search(self, query: str, limit: int) -> List[RateLocationEntry]:
+        query = query.strip()
+        if query.isdigit():
+            return _search_prefix(self.zip_keys, self.zip_entries, query, limit)
+        prefix = normalize_city(query)
+        if not prefix:
+            return []
+        return _search_prefix(self.city_keys, self.city_entries, prefix, limit)
+
+
+@dataclass(frozen=True)
+class RateLocationIndex:
+    """지역별 우편번호/도시명 자동완성 인덱스입니다. 요율 스냅샷과 함께 만들어지고 교체됩니다."""
+
+    regions: Mapping[int, RegionLocationIndex]
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[RateLocationEntry]) -> "RateLocationIndex":
+        entries_by_region: Dict[int, List[RateLocationEntry]] = {}
+        for entry in entries:
+            entries_by_region.setdefault(entry.region_id, []).append(entry)
+        return cls(
+            regions=MappingProxyType(
+                {
+                    region_id: RegionLocationIndex.from_entries(region_entries)
+                    for region_id, region_entries in entries_by_region.items()
+                }
+            )
+        )
+
+    def search(self, region_id: int, query: str, limit: int) -> List[RateLocationEntry]:
+        region_index = self.regions.get(region_id)
+        if region_index is None:
+            return []
+        return region_index.search(query, limit)
@@ -0,0 +1,137 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from ..db.unit_of_work import UnitOfWork
+from .cost_builder import AccessorialRule, RateCost, RateTierTable
+from .rate_location_index import RateLocationEntry, RateLocationIndex
+
+
+@dataclass(frozen=True)
+class RateAreaSnapshot:
+    id: int
+    region_id: int
+    name: str
+    min_load: Decimal
+    max_load: Decimal
+    max_load_weight: Decimal
+    tier_table: RateTierTable
+
+
+@dataclass(frozen=True)
+class RateSnapshot:
+    """운임 계산에 필요한 요율 테이블의 불변 스냅샷입니다."""
+
+    version: int
+    loaded_at: datetime
+    areas: Mapping[int, RateAreaSnapshot]
+    zip_code_areas: Mapping[str, int]
+    accessorial_rules: Mapping[int, AccessorialRule]
+    location_index: RateLocationIndex
+
+    def get_area_by_zip_code(self, zip_code: str) -> Optional[RateAreaSnapshot]:
+        area_id = self.zip_code_areas.get(zip_code)
+        if area_id is None:
+            return None
+        return self.areas.get(area_id)
+
+
+class RateSnapshotStore:
+    """
+    프로세스 내 요율 스냅샷을 보관합니다.
+    reload 시 새 스냅샷을 완성한 뒤 참조만 교체하므로, 계산 중인 요청은 이전 스냅샷을 그대로 사용합니다.
+    무게 구간 검증에 실패하면 ValueError가 발생하고 기존 스냅샷이 유지됩니다.
+    """
+
+    def __init__(self):
+        self._snapshot: Optional[RateSnapshot] = None
+        self._version = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def snapshot(self) -> Optional[RateSnapshot]:
+        return self._snapshot
+
+    async def get(self, uow: UnitOfWork) -> RateSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = await self.load(uow)
+        return snapshot
+
+    async def load(self, uow: UnitOfWork) -> RateSnapshot:
+        async with self._lock:
+            async with uow:
+                area_models = await uow.rate_area.get_all_areas()
+                area_cost_models = await uow.rate_area_cost.get_all_area_costs()
+                location_rows = await uow.rate_location.get_all_rate_locations()
+                accessorial_models = await uow.cargo.get_cargo_accessorial()
+
+                costs_by_area: dict[int, list[RateCost]] = {}
+                for cost in area_cost_models:
+                    costs_by_area.setdefault(cost.area_id, []).append(
+                        RateCost(
+                            min_weight=cost.min_weight,
+                            max_weight=cost.max_weight,
+                            price_per_weight=cost.price_per_weight,
+                        )
+                    )
+
+                areas = {}
+                for area in area_models:
+                    try:
+                        tier_table = RateTierTable.from_rate_costs(
+                            costs_by_area.get(area.id, [])
+                        )
+                    except ValueError as e:
+                        raise ValueError(f"구역 {area.id}({area.name}): {e}") from e
+                    areas[area.id] = RateAreaSnapshot(
+                        id=area.id,
+                        region_id=area.region_id,
+                        name=area.name,
+                        min_load=area.min_load,
+                        max_load=area.max_load,
+                        max_load_weight=area.max_load_weight,
+                        tier_table=tier_table,
+                    )
+                locations = [
+                    RateLocationEntry(
+                        id=row.id,
+                        area_id=row.area_id,
+                        region_id=row.region_id,
+                        state=row.state,
+                        county=row.county,
+                        city=row.city,
+                        zip_code=row.zip_code,
+                    )
+                    for row in location_rows
+                ]
+                zip_code_areas = {}
+                for location in locations:
+                    zip_code_areas.setdefault(location.zip_code, location.area_id)
+                accessorial_rules = {
+                    accessorial.id: AccessorialRule(
+                        pricing_type=accessorial.pricing_type,
+                        price=accessorial.price,
+                        min_price=accessorial.min_price,
+                        max_price=accessorial.max_price,
+                    )
+                    for accessorial in accessorial_models
+                }
+
+            self._version += 1
+            snapshot = RateSnapshot(
+                version=self._version,
+                loaded_at=datetime.now(UTC),
+                areas=MappingProxyType(areas),
+                zip_code_areas=MappingProxyType(zip_code_areas),
+                accessorial_rules=MappingProxyType(accessorial_rules),
+                location_index=RateLocationIndex.from_entries(locations),
+            )
+            self._snapshot = snapshot
+            return snapshot
+
+
+rate_snapshot_store = RateSnapshotStore()
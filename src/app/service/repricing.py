@@ -0,0 +1,613 @@
+"""
+요율표 변경안으로 과거 견적 전체를 재산정하는 오프라인 엔진입니다.
+
+견적/화물/위치 데이터를 컬럼 단위 NumPy 배열로 적재한 뒤 BaseCostBuilder, LocationCostBuilder,
+ExtraCostBuilder, DiscountBuilder와 같은 규칙을 벡터 연산으로 계산합니다.
+무게는 0.001 lbs, 금액은 0.001 달러 단위의 정수(int64)로 다루고 빌더와 같은 ROUND_UP(소수점 3자리)을 적용합니다.
+
+    ENV=dev poetry run python -m app.service.repricing new_rate_card.csv -o repricing.csv
+
+요율표 CSV는 rate_area_cost와 같은 컬럼(area_id, min_weight, max_weight, price_per_weight)을 사용하며,
+CSV에 없는 구역은 현재 요율을 그대로 사용합니다.
+"""
+
+import argparse
+import asyncio
+import csv
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..db.session import async_session
+from ..db.unit_of_work import UnitOfWork
+from ..model._enum import AccessorialPricingTypeEnum, LocationTypeEnum, ShipmentTypeEnum
+from .cost import CostService
+from .cost_builder import LocationCostBuilder, RateCost, RateTierTable
+from .cost_builder.fixed_point import (
+    MONEY_SCALE,
+    PRODUCT_SCALE,
+    RATE_SCALE,
+    SERVICE_EXTRA_COST,
+    VOLUME_WEIGHT_DIVISOR,
+    WEIGHT_SCALE,
+    ceil_div,
+    from_scaled,
+    to_scaled,
+)
+from .rate_snapshot import RateSnapshot, rate_snapshot_store
+
+FTL_TRANSPORTATION_ID = 2
+DEFAULT_FSC = CostService.FSC
+AIRPORT_CONFIG = LocationCostBuilder.AIRPORT_CONFIG
+RESIDENTIAL_COST = LocationCostBuilder.RESIDENTIAL_COST
+
+# CostService.price_quote가 예외를 던지는 순서와 같습니다.
+PRICED = 0
+AREA_NOT_FOUND = 1
+MAX_WEIGHT_EXCEEDED = 2
+RATE_NOT_FOUND = 3
+MAX_LOAD_EXCEEDED = 4
+ACCESSORIAL_NOT_FOUND = 5
+
+STATUS_MESSAGES = {
+    PRICED: "",
+    AREA_NOT_FOUND: "지역 요율 정보를 찾을 수 없습니다.",
+    MAX_WEIGHT_EXCEEDED: "최대 운임 무게를 초과했습니다. 운영사에 직접 문의해주세요.",
+    RATE_NOT_FOUND: "지역 요율 정보를 찾을 수 없습니다.",
+    MAX_LOAD_EXCEEDED: "최대 금액을 초과했습니다. 고객사에 직접 문의해주세요.",
+    ACCESSORIAL_NOT_FOUND: "추가 서비스 정보를 찾을 수 없습니다.",
+}
+
+# 구역 순번별 무게 구간 하한을 하나의 정렬 배열에 담기 위한 간격입니다. (0.001 lbs 단위)
+_AREA_KEY_STRIDE = 1 << 40
+
+
+@dataclass(frozen=True)
+class QuoteFrame:
+    """
+    재산정 대상 견적의 컬럼 배열입니다.
+    견적 단위 배열은 quote_ids의 순번, 위치/추가 서비스 단위 배열은 *_quote_index로 견적을 가리킵니다.
+    """
+
+    quote_ids: np.ndarray
+    is_ftl: np.ndarray
+    is_priority: np.ndarray
+    stored_total_price: np.ndarray
+    discount_rate: np.ndarray  # 1/10000
+    freight_weight: np.ndarray  # 0.001 lbs
+    pickup_zip_code: np.ndarray
+    delivery_zip_code: np.ndarray
+
+    location_quote_index: np.ndarray
+    location_shipment_type: np.ndarray  # 0: PICKUP, 1: DELIVERY
+    location_type: np.ndarray  # 0: COMMERCIAL, 1: RESIDENTIAL, 2: AIRPORT
+    location_weekday: np.ndarray
+    location_hour: np.ndarray
+
+    accessorial_quote_index: np.ndarray
+    accessorial_id: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.quote_ids)
+
+
+_SHIPMENT_TYPE_CODES = {ShipmentTypeEnum.PICKUP: 0, ShipmentTypeEnum.DELIVERY: 1}
+_LOCATION_TYPE_CODES = {
+    LocationTypeEnum.COMMERCIAL: 0,
+    LocationTypeEnum.RESIDENTIAL: 1,
+    LocationTypeEnum.AIRPORT: 2,
+}
+
+
+def build_quote_frame(
+    quote_rows: Sequence[Tuple],
+    cargo_rows: Sequence[Tuple],
+    location_rows: Sequence[Tuple],
+    accessorial_rows: Sequence[Tuple],
+) -> QuoteFrame:
+    """각 repository의 get_repricing_rows 결과로 QuoteFrame을 만듭니다."""
+    quote_count = len(quote_rows)
+    quote_index = {row[0]: index for index, row in enumerate(quote_rows)}
+    quote_ids, transportation_ids, is_priority, stored_total_price, discount_rates = (
+        zip(*quote_rows) if quote_rows else ((),) * 5
+    )
+
+    # 화물별 운임 무게 = max(실제 무게, 부피 무게), 0.001 lbs 단위로 올림
+    cargo_quote_ids, weight, quantity, width, height, length = (
+        zip(*cargo_rows) if cargo_rows else ((),) * 6
+    )
+    cargo_quote_index = np.fromiter(
+        (quote_index[quote_id] for quote_id in cargo_quote_ids),
+        dtype=np.int64,
+        count=len(cargo_rows),
+    )
+    weight, quantity, width, height, length = (
+        np.asarray(column, dtype=np.int64)
+        for column in (weight, quantity, width, height, length)
+    )
+    package_weight = weight * quantity * WEIGHT_SCALE
+    volume_weight = ceil_div(
+        width * height * length * quantity * WEIGHT_SCALE, VOLUME_WEIGHT_DIVISOR
+    )
+    freight_weight = np.zeros(quote_count, dtype=np.int64)
+    np.add.at(freight_weight, cargo_quote_index, np.maximum(package_weight, volume_weight))
+
+    location_ids, location_quote_ids, zip_codes, location_types, shipment_types, request_datetimes = (
+        zip(*location_rows) if location_rows else ((),) * 6
+    )
+    location_count = len(location_rows)
+    location_quote_index = np.fromiter(
+        (quote_index[quote_id] for quote_id in location_quote_ids),
+        dtype=np.int64,
+        count=location_count,
+    )
+    location_shipment_type = np.fromiter(
+        (_SHIPMENT_TYPE_CODES[ShipmentTypeEnum(value)] for value in shipment_types),
+        dtype=np.int8,
+        count=location_count,
+    )
+    location_type = np.fromiter(
+        (_LOCATION_TYPE_CODES[LocationTypeEnum(value)] for value in location_types),
+        dtype=np.int8,
+        count=location_count,
+    )
+    request_minutes = np.array(request_datetimes, dtype="datetime64[m]")
+    request_days = request_minutes.astype("datetime64[D]")
+    # 1970-01-01은 목요일(weekday 3)입니다.
+    location_weekday = (request_days.astype(np.int64) + 3) % 7
+    location_hour = (request_minutes - request_days).astype("timedelta64[h]").astype(
+        np.int64
+    )
+
+    zip_code_array = np.array(zip_codes, dtype=object)
+    pickup_zip_code = np.full(quote_count, None, dtype=object)
+    delivery_zip_code = np.full(quote_count, None, dtype=object)
+    is_pickup = location_shipment_type == 0
+    pickup_zip_code[location_quote_index[is_pickup]] = zip_code_array[is_pickup]
+    delivery_zip_code[location_quote_index[~is_pickup]] = zip_code_array[~is_pickup]
+
+    location_position = {location_id: index for index, location_id in enumerate(location_ids)}
+    accessorial_location_ids, accessorial_ids = (
+        zip(*accessorial_rows) if accessorial_rows else ((), ())
+    )
+    accessorial_quote_index = location_quote_index[
+        np.fromiter(
+            (location_position[location_id] for location_id in accessorial_location_ids),
+            dtype=np.int64,
+            count=len(accessorial_rows),
+        )
+    ]
+
+    return QuoteFrame(
+        quote_ids=np.array(quote_ids, dtype=object),
+        is_ftl=np.array(transportation_ids, dtype=np.int64) == FTL_TRANSPORTATION_ID,
+        is_priority=np.array(is_priority, dtype=bool),
+        stored_total_price=np.array(stored_total_price, dtype=object),
+        discount_rate=np.array(
+            [to_scaled(rate, RATE_SCALE) for rate in discount_rates], dtype=np.int64
+        ),
+        freight_weight=freight_weight,
+        pickup_zip_code=pickup_zip_code,
+        delivery_zip_code=delivery_zip_code,
+        location_quote_index=location_quote_index,
+        location_shipment_type=location_shipment_type,
+        location_type=location_type,
+        location_weekday=location_weekday,
+        location_hour=location_hour,
+        accessorial_quote_index=accessorial_quote_index,
+        accessorial_id=np.array(accessorial_ids, dtype=np.int64),
+    )
+
+
+async def load_quote_frame(uow: UnitOfWork) -> QuoteFrame:
+    async with uow:
+        quote_rows = await uow.quote.get_repricing_rows()
+        cargo_rows = await uow.quote_cargo.get_repricing_rows()
+        location_rows = await uow.quote_location.get_repricing_rows()
+        accessorial_rows = await uow.quote_location_accessorial.get_repricing_rows()
+    return build_quote_frame(quote_rows, cargo_rows, location_rows, accessorial_rows)
+
+
+@dataclass(frozen=True)
+class RateCard:
+    """
+    구역별 요율을 구역 순번(area_ids의 인덱스) 기준 배열로 펼친 요율표입니다.
+    무게 구간 하한은 구역 순번 × _AREA_KEY_STRIDE를 더해 하나의 정렬 배열(tier_keys)에 담습니다.
+    """
+
+    area_ids: np.ndarray
+    min_load: np.ndarray  # 무게 × 단가 단위 (1/PRODUCT_SCALE 달러)
+    max_load: np.ndarray
+    max_load_weight: np.ndarray  # 0.001 lbs
+    tier_start: np.ndarray
+    tier_count: np.ndarray
+    tier_keys: np.ndarray
+    tier_prices: np.ndarray  # 1/10000 달러
+    zip_code_areas: Mapping[str, int]
+
+    # 추가 서비스 가격 규칙 (accessorial_ids 순번 기준)
+    accessorial_ids: np.ndarray
+    accessorial_price_per_weight: np.ndarray  # 1/10000 달러, PER_WEIGHT만
+    accessorial_flat_price: np.ndarray  # 0.001 달러, FLAT만
+    accessorial_min_price: np.ndarray
+    accessorial_max_price: np.ndarray
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        rate_snapshot: RateSnapshot,
+        tier_tables: Optional[Mapping[int, RateTierTable]] = None,
+    ) -> "RateCard":
+        """tier_tables에 포함된 구역은 스냅샷의 무게 구간 대신 해당 구간표를 사용합니다."""
+        tier_tables = tier_tables or {}
+        unknown_area_ids = set(tier_tables) - set(rate_snapshot.areas)
+        if unknown_area_ids:
+            raise ValueError(f"존재하지 않는 구역입니다: {sorted(unknown_area_ids)}")
+
+        areas = sorted(rate_snapshot.areas.values(), key=lambda area: area.id)
+        tier_start, tier_count, tier_keys, tier_prices = [], [], [], []
+        for area_rank, area in enumerate(areas):
+            tier_table = tier_tables.get(area.id, area.tier_table)
+            tier_start.append(len(tier_keys))
+            tier_count.append(len(tier_table.lower_bounds))
+            tier_keys.extend(
+                area_rank * _AREA_KEY_STRIDE + lower_bound * WEIGHT_SCALE
+                for lower_bound in tier_table.lower_bounds
+            )
+            tier_prices.extend(to_scaled(price, RATE_SCALE) for price in tier_table.prices)
+        # 구간이 없는 구역도 안전하게 인덱싱할 수 있도록 마지막에 0 단가를 둡니다.
+        tier_prices.append(0)
+
+        accessorial_rules = sorted(rate_snapshot.accessorial_rules.items())
+        is_per_weight = [
+            rule.pricing_type == AccessorialPricingTypeEnum.PER_WEIGHT
+            for _, rule in accessorial_rules
+        ]
+
+        return cls(
+            area_ids=np.array([area.id for area in areas], dtype=np.int64),
+            min_load=np.array(
+                [to_scaled(area.min_load, PRODUCT_SCALE) for area in areas], dtype=np.int64
+            ),
+            max_load=np.array(
+                [to_scaled(area.max_load, PRODUCT_SCALE) for area in areas], dtype=np.int64
+            ),
+            max_load_weight=np.array(
+                [
+                    _AREA_KEY_STRIDE - 1
+                    if area.max_load_weight is None
+                    else to_scaled(area.max_load_weight, WEIGHT_SCALE)
+                    for area in areas
+                ],
+                dtype=np.int64,
+            ),
+            tier_start=np.array(tier_start, dtype=np.int64),
+            tier_count=np.array(tier_count, dtype=np.int64),
+            tier_keys=np.array(tier_keys, dtype=np.int64),
+            tier_prices=np.array(tier_prices, dtype=np.int64),
+            zip_code_areas=rate_snapshot.zip_code_areas,
+            accessorial_ids=np.array(
+                [accessorial_id for accessorial_id, _ in accessorial_rules], dtype=np.int64
+            ),
+            accessorial_price_per_weight=np.array(
+                [
+                    to_scaled(rule.price, RATE_SCALE) if per_weight else 0
+                    for (_, rule), per_weight in zip(accessorial_rules, is_per_weight)
+                ],
+                dtype=np.int64,
+            ),
+            accessorial_flat_price=np.array(
+                [
+                    0 if per_weight else to_scaled(rule.price, MONEY_SCALE)
+                    for (_, rule), per_weight in zip(accessorial_rules, is_per_weight)
+                ],
+                dtype=np.int64,
+            ),
+            accessorial_min_price=np.array(
+                [
+                    0 if rule.min_price is None else to_scaled(rule.min_price, MONEY_SCALE)
+                    for _, rule in accessorial_rules
+                ],
+                dtype=np.int64,
+            ),
+            accessorial_max_price=np.array(
+                [
+                    np.iinfo(np.int64).max
+                    if rule.max_price is None
+                    else to_scaled(rule.max_price, MONEY_SCALE)
+                    for _, rule in accessorial_rules
+                ],
+                dtype=np.int64,
+            ),
+        )
+
+    def resolve_area_ids(self, zip_codes: np.ndarray) -> np.ndarray:
+        """우편번호별 구역 ID를 반환합니다. 찾을 수 없으면 -1입니다."""
+        unique_zip_codes, inverse = np.unique(
+            np.array([zip_code or "" for zip_code in zip_codes], dtype=str),
+            return_inverse=True,
+        )
+        area_ids = np.fromiter(
+            (self.zip_code_areas.get(zip_code, -1) for zip_code in unique_zip_codes),
+            dtype=np.int64,
+            count=len(unique_zip_codes),
+        )
+        area_ids[~np.isin(area_ids, self.area_ids)] = -1
+        return area_ids[inverse.reshape(-1)]
+
+
+def read_rate_card_csv(path: str) -> Dict[int, RateTierTable]:
+    """rate_area_cost 형식의 CSV를 구역별 무게 구간표로 읽습니다."""
+    costs_by_area: Dict[int, List[RateCost]] = {}
+    with open(path, newline="", encoding="utf-8") as file:
+        for row in csv.DictReader(file):
+            costs_by_area.setdefault(int(row["area_id"]), []).append(
+                RateCost(
+                    min_weight=int(row["min_weight"]),
+                    max_weight=int(row["max_weight"]),
+                    price_per_weight=Decimal(row["price_per_weight"]),
+                )
+            )
+
+    tier_tables = {}
+    for area_id, rate_costs in costs_by_area.items():
+        try:
+            tier_tables[area_id] = RateTierTable.from_rate_costs(rate_costs)
+        except ValueError as e:
+            raise ValueError(f"구역 {area_id}: {e}") from e
+    return tier_tables
+
+
+@dataclass(frozen=True)
+class RepricingResult:
+    """견적 순번별 계산 결과입니다. 금액은 0.001 달러 단위이며 status가 PRICED가 아닌 견적은 0입니다."""
+
+    status: np.ndarray
+    total_weight: np.ndarray
+    base_price: np.ndarray
+    location_type_price: np.ndarray
+    service_price: np.ndarray
+    total_price: np.ndarray
+
+    @property
+    def priced(self) -> np.ndarray:
+        return self.status == PRICED
+
+
+def reprice(
+    frame: QuoteFrame, rate_card: RateCard, fsc: Decimal = DEFAULT_FSC
+) -> RepricingResult:
+    quote_count = len(frame)
+    freight_weight = frame.freight_weight
+    is_ltl = ~frame.is_ftl
+    status = np.full(quote_count, PRICED, dtype=np.int8)
+
+    def mark(mask: np.ndarray, code: int):
+        status[(status == PRICED) & mask] = code
+
+    # 기준 구역: 출발지/도착지 구역 중 ID가 큰 구역
+    if len(rate_card.area_ids) == 0:
+        status[:] = AREA_NOT_FOUND
+        return _empty_result(status, freight_weight)
+
+    pickup_area_id = rate_card.resolve_area_ids(frame.pickup_zip_code)
+    delivery_area_id = rate_card.resolve_area_ids(frame.delivery_zip_code)
+    mark((pickup_area_id < 0) | (delivery_area_id < 0), AREA_NOT_FOUND)
+    area_rank = np.searchsorted(
+        rate_card.area_ids, np.maximum(pickup_area_id, delivery_area_id)
+    )
+    area_rank = np.minimum(area_rank, len(rate_card.area_ids) - 1)
+
+    # 기본 운임 (BaseCostBuilder)
+    mark(is_ltl & (freight_weight > rate_card.max_load_weight[area_rank]), MAX_WEIGHT_EXCEEDED)
+    mark(is_ltl & (rate_card.tier_count[area_rank] == 0), RATE_NOT_FOUND)
+
+    tier_index = (
+        np.searchsorted(
+            rate_card.tier_keys,
+            area_rank * _AREA_KEY_STRIDE + np.minimum(freight_weight, _AREA_KEY_STRIDE - 1),
+            side="right",
+        )
+        - 1
+    )
+    tier_index = np.maximum(tier_index, rate_card.tier_start[area_rank])
+    tier_index = np.where(
+        rate_card.tier_count[area_rank] == 0, len(rate_card.tier_prices) - 1, tier_index
+    )
+    min_load = rate_card.min_load[area_rank]
+    max_load = rate_card.max_load[area_rank]
+    base_freight_cost = freight_weight * rate_card.tier_prices[tier_index]
+    mark(is_ltl & (base_freight_cost > max_load), MAX_LOAD_EXCEEDED)
+    freight_cost = np.where(
+        base_freight_cost > max_load,
+        max_load,
+        np.where(base_freight_cost < min_load, min_load, base_freight_cost),
+    )
+    freight_cost = np.where(frame.is_ftl, max_load, freight_cost)
+    base_price = ceil_div(
+        freight_cost * (RATE_SCALE + to_scaled(fsc, RATE_SCALE)),
+        PRODUCT_SCALE * RATE_SCALE // MONEY_SCALE,
+    )
+
+    # 위치 유형 비용 (LocationCostBuilder)
+    location_quote_index = frame.location_quote_index
+    location_weight = freight_weight[location_quote_index]
+    is_pickup = frame.location_shipment_type == 0
+    airport = {
+        key: np.where(
+            is_pickup,
+            to_scaled(AIRPORT_CONFIG["PICK_UP"][key], scale),
+            to_scaled(AIRPORT_CONFIG["DELIVERY"][key], scale),
+        )
+        for key, scale in (
+            ("min_cost", PRODUCT_SCALE),
+            ("max_cost", PRODUCT_SCALE),
+            ("price_per_weight", RATE_SCALE),
+        )
+    }
+    airport_cost = location_weight * airport["price_per_weight"]
+    airport_cost = np.where(
+        airport_cost > airport["max_cost"],
+        airport["max_cost"],
+        np.where(airport_cost < airport["min_cost"], airport["min_cost"], airport_cost),
+    )
+    location_cost = np.select(
+        [frame.location_type == 1, frame.location_type == 2],
+        [
+            to_scaled(RESIDENTIAL_COST, MONEY_SCALE),
+            ceil_div(airport_cost, PRODUCT_SCALE // MONEY_SCALE),
+        ],
+        default=0,
+    )
+    location_type_price = np.zeros(quote_count, dtype=np.int64)
+    np.add.at(location_type_price, location_quote_index, location_cost)
+
+    # 추가 서비스 / 주말·업무시간 외·우선 처리 비용 (ExtraCostBuilder)
+    accessorial_quote_index = frame.accessorial_quote_index
+    rule_index = np.minimum(
+        np.searchsorted(rate_card.accessorial_ids, frame.accessorial_id),
+        max(len(rate_card.accessorial_ids) - 1, 0),
+    )
+    if len(rate_card.accessorial_ids) == 0:
+        unknown_accessorial = np.ones(len(frame.accessorial_id), dtype=bool)
+        accessorial_cost = np.zeros(len(frame.accessorial_id), dtype=np.int64)
+    else:
+        unknown_accessorial = rate_card.accessorial_ids[rule_index] != frame.accessorial_id
+        accessorial_cost = rate_card.accessorial_flat_price[rule_index] + ceil_div(
+            freight_weight[accessorial_quote_index]
+            * rate_card.accessorial_price_per_weight[rule_index],
+            PRODUCT_SCALE // MONEY_SCALE,
+        )
+        accessorial_cost = np.minimum(
+            np.maximum(accessorial_cost, rate_card.accessorial_min_price[rule_index]),
+            rate_card.accessorial_max_price[rule_index],
+        )
+    has_unknown_accessorial = np.zeros(quote_count, dtype=np.int64)
+    np.add.at(
+        has_unknown_accessorial,
+        accessorial_quote_index,
+        unknown_accessorial.astype(np.int64),
+    )
+    mark(has_unknown_accessorial > 0, ACCESSORIAL_NOT_FOUND)
+    service_price = np.zeros(quote_count, dtype=np.int64)
+    np.add.at(service_price, accessorial_quote_index, accessorial_cost)
+
+    service_extra_cost = SERVICE_EXTRA_COST
+    weekday, hour = frame.location_weekday, frame.location_hour
+    surcharge_count = (weekday >= 5).astype(np.int64) + (hour >= 17).astype(np.int64)
+    np.add.at(service_price, location_quote_index, surcharge_count * service_extra_cost)
+    business_hour_count = np.zeros(quote_count, dtype=np.int64)
+    np.add.at(
+        business_hour_count,
+        location_quote_index,
+        ((weekday < 5) & (hour >= 9) & (hour < 17)).astype(np.int64),
+    )
+    # 우선 처리 비용은 견적당 한 번만 부과됩니다.
+    service_price += np.where(
+        frame.is_priority & (business_hour_count > 0), service_extra_cost, 0
+    )
+
+    # 할인 (DiscountBuilder)
+    total_price = base_price + location_type_price + service_price
+    total_price = np.where(
+        frame.discount_rate > 0,
+        ceil_div(total_price * (RATE_SCALE - frame.discount_rate), RATE_SCALE),
+        total_price,
+    )
+
+    not_priced = status != PRICED
+    for values in (base_price, location_type_price, service_price, total_price):
+        values[not_priced] = 0
+    return RepricingResult(
+        status=status,
+        total_weight=freight_weight,
+        base_price=base_price,
+        location_type_price=location_type_price,
+        service_price=service_price,
+        total_price=total_price,
+    )
+
+
+def _empty_result(status: np.ndarray, freight_weight: np.ndarray) -> RepricingResult:
+    zeros = np.zeros(len(status), dtype=np.int64)
+    return RepricingResult(
+        status=status,
+        total_weight=freight_weight,
+        base_price=zeros,
+        location_type_price=zeros.copy(),
+        service_price=zeros.copy(),
+        total_price=zeros.copy(),
+    )
+
+
+def write_repricing_csv(
+    path: str, frame: QuoteFrame, old: RepricingResult, new: RepricingResult
+):
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(
+            [
+                "quote_id",
+                "stored_total_price",
+                "old_total_price",
+                "new_total_price",
+                "delta",
+                "old_status",
+                "new_status",
+            ]
+        )
+        for index, quote_id in enumerate(frame.quote_ids):
+            old_total = from_scaled(old.total_price[index])
+            new_total = from_scaled(new.total_price[index])
+            both_priced = old.status[index] == PRICED and new.status[index] == PRICED
+            writer.writerow(
+                [
+                    quote_id,
+                    frame.stored_total_price[index],
+                    old_total if old.status[index] == PRICED else "",
+                    new_total if new.status[index] == PRICED else "",
+                    new_total - old_total if both_priced else "",
+                    STATUS_MESSAGES[int(old.status[index])],
+                    STATUS_MESSAGES[int(new.status[index])],
+                ]
+            )
+
+
+def summarize(old: RepricingResult, new: RepricingResult) -> Dict[str, Decimal | int]:
+    both_priced = old.priced & new.priced
+    old_total = from_scaled(old.total_price[both_priced].sum())
+    new_total = from_scaled(new.total_price[both_priced].sum())
+    return {
+        "quotes": len(old.status),
+        "priced": int(both_priced.sum()),
+        "old_total_price": old_total,
+        "new_total_price": new_total,
+        "delta": new_total - old_total,
+    }
+
+
+async def run(rate_card_path: str, output_path: Optional[str] = None, fsc: Decimal = DEFAULT_FSC):
+    tier_tables = read_rate_card_csv(rate_card_path)
+    async with async_session() as session:
+        uow = UnitOfWork(session)
+        rate_snapshot = await rate_snapshot_store.load(uow)
+        frame = await load_quote_frame(uow)
+
+    old = reprice(frame, RateCard.from_snapshot(rate_snapshot), fsc)
+    new = reprice(frame, RateCard.from_snapshot(rate_snapshot, tier_tables), fsc)
+
+    for key, value in summarize(old, new).items():
+        print(f"{key}: {value}")
+    if output_path:
+        write_repricing_csv(output_path, frame, old, new)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="요율표 변경안으로 과거 견적을 재산정합니다.")
+    parser.add_argument("rate_card", help="area_id,min_weight,max_weight,price_per_weight CSV")
+    parser.add_argument("-o", "--output", help="견적별 재산정 결과 CSV 경로")
+    parser.add_argument("--fsc", type=Decimal, default=DEFAULT_FSC)
+    args = parser.parse_args()
+    asyncio.run(run(args.rate_card, args.output, args.fsc))
@@ -0,0 +1,82 @@
+import asyncio
+import hashlib
+from dataclasses import dataclass
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+from ..db.unit_of_work import UnitOfWork
+from ..model.user import UserLevel
+
+
+def get_level_version(level_id: int, discount_rate: Decimal) -> str:
+    # 0.1000과 0.1이 같은 버전이 되도록 정규화한 값으로 계산합니다.
+    source = f"{level_id}:{Decimal(discount_rate).normalize()}"
+    return hashlib.sha256(source.encode()).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class UserLevelSnapshot:
+    """운임 할인에 필요한 사용자 등급 값입니다. 액세스 토큰 클레임에도 같은 값이 실립니다."""
+
+    id: int
+    discount_rate: Decimal
+    version: str
+
+    @classmethod
+    def from_model(cls, user_level: UserLevel) -> "UserLevelSnapshot":
+        return cls(
+            id=user_level.id,
+            discount_rate=user_level.discount_rate,
+            version=get_level_version(user_level.id, user_level.discount_rate),
+        )
+
+    def to_claims(self) -> Dict[str, Any]:
+        return {
+            "user_level_id": self.id,
+            "discount_rate": str(self.discount_rate),
+            "level_version": self.version,
+        }
+
+
+class UserLevelStore:
+    """
+    프로세스 내 사용자 등급 캐시입니다.
+    토큰의 level_version이 캐시와 같으면 DB 조회 없이 할인율을 사용하고, 다르면 None을 돌려 DB 조회로 넘깁니다.
+    """
+
+    def __init__(self):
+        self._levels: Mapping[int, UserLevelSnapshot] = MappingProxyType({})
+        self._lock = asyncio.Lock()
+
+    def get(
+        self, level_id: Optional[int], level_version: Optional[str]
+    ) -> Optional[UserLevelSnapshot]:
+        if level_id is None or level_version is None:
+            return None
+        user_level = self._levels.get(level_id)
+        if user_level is None or user_level.version != level_version:
+            return None
+        return user_level
+
+    def put(self, user_level: UserLevelSnapshot):
+        if self._levels.get(user_level.id) == user_level:
+            return
+        levels = dict(self._levels)
+        levels[user_level.id] = user_level
+        self._levels = MappingProxyType(levels)
+
+    async def load(self, uow: UnitOfWork) -> Mapping[int, UserLevelSnapshot]:
+        async with self._lock:
+            async with uow:
+                user_levels = await uow.user_level.get_all_levels()
+            self._levels = MappingProxyType(
+                {
+                    user_level.id: UserLevelSnapshot.from_model(user_level)
+                    for user_level in user_levels
+                }
+            )
+            return self._levels
+
+
+user_level_store = UserLevelStore()
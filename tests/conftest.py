@@ -0,0 +1,169 @@
+import os
+from datetime import datetime
+from decimal import Decimal
+
+# 앱 설정은 import 시점에 환경 변수로 만들어지므로, 테스트용 값을 먼저 채웁니다.
+for key, value in {
+    "DB_HOST": "localhost",
+    "DB_PORT": "3306",
+    "DB_USER": "test",
+    "DB_PASS": "test",
+    "DB_NAME": "test",
+    "SMTP_HOST": "localhost",
+    "SMTP_PORT": "587",
+    "SMTP_EMAIL_USERNAME": "test",
+    "SMTP_EMAIL_PASSWORD": "test",
+    "SMTP_SENDER_EMAIL": "test@example.com",
+}.items():
+    os.environ.setdefault(key, value)
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.db.base import Base
+from app.model._enum import LocationTypeEnum, OrderStatusEnum, ShipmentTypeEnum
+from app.model.cargo import CargoAccessorial, CargoTransportation
+from app.model.email import EmailOutbox  # noqa: F401 (메타데이터 등록)
+from app.model.quote import Quote, QuoteCargo, QuoteLocation, QuoteLocationAccessorial
+from app.model.rate import RateArea, RateAreaCost, RateLocation, RateRegion  # noqa: F401
+from app.model.user import Role, User, UserLevel
+
+
+@pytest.fixture
+async def engine():
+    """테스트마다 새로 만드는 인메모리 SQLite 엔진입니다. 모델 메타데이터(인덱스 포함)로 스키마를 만듭니다."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+async def reference_data(session_factory):
+    """사용자, 운송 수단, 추가 서비스 기준 정보를 넣습니다."""
+    async with session_factory() as session:
+        session.add_all(
+            [
+                Role(id=1, role="USER"),
+                Role(id=2, role="ADMIN"),
+                UserLevel(
+                    id=1, user_level="DEFAULT", required_amount=0, discount_rate=0
+                ),
+            ]
+        )
+        session.add_all(
+            [
+                User(
+                    id=user_id,
+                    email=f"user{user_id}@example.com",
+                    password="x",
+                    role_id=role_id,
+                    first_name="Test",
+                    last_name="User",
+                    phone="000",
+                    user_level_id=1,
+                    total_payment_amount=0,
+                )
+                for user_id, role_id in ((1, 1), (2, 2))
+            ]
+        )
+        session.add_all(
+            [
+                CargoTransportation(id=1, name="LTL", description="LTL"),
+                CargoTransportation(id=2, name="FTL", description="FTL"),
+            ]
+        )
+        session.add_all(
+            [
+                CargoAccessorial(
+                    id=accessorial_id,
+                    name=name,
+                    description=name,
+                    pricing_type="FLAT",
+                    price=Decimal("25"),
+                )
+                for accessorial_id, name in ((1, "Lift Gate"), (2, "Two Person"))
+            ]
+        )
+        await session.commit()
+
+
+@pytest.fixture
+def sql_statements(engine):
+    """엔진에서 실행된 SQL 문을 순서대로 모읍니다."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+def build_quote(
+    quote_id: str,
+    user_id: int = 1,
+    cargo_count: int = 1,
+    accessorial_ids=(),
+    zip_code: str = "75001",
+    city: str = "Addison",
+    order_status: OrderStatusEnum = OrderStatusEnum.ESTIMATE,
+) -> Quote:
+    """출발지/도착지와 부가 서비스, 화물을 포함한 견적 집합체를 만듭니다."""
+
+    def location(shipment_type: ShipmentTypeEnum) -> QuoteLocation:
+        return QuoteLocation(
+            state="TX",
+            county="Dallas County",
+            city=city,
+            zip_code=zip_code,
+            address="1 Main St",
+            location_type=LocationTypeEnum.COMMERCIAL,
+            shipment_type=shipment_type,
+            request_datetime=datetime(2024, 10, 22, 10, 0),
+            quote_location_accessorial=[
+                QuoteLocationAccessorial(cargo_accessorial_id=accessorial_id)
+                for accessorial_id in accessorial_ids
+            ],
+        )
+
+    return Quote(
+        id=quote_id,
+        user_id=user_id,
+        cargo_transportation_id=1,
+        is_priority=False,
+        total_weight=Decimal("100"),
+        base_price=Decimal("33.75"),
+        extra_price=Decimal("0"),
+        total_price=Decimal("33.75"),
+        order_status=order_status,
+        quote_location=[location(ShipmentTypeEnum.PICKUP), location(ShipmentTypeEnum.DELIVERY)],
+        quote_cargo=[
+            QuoteCargo(
+                width=20,
+                length=20,
+                height=20,
+                weight=100,
+                quantity=1,
+                package_description="box",
+                cargo_stackable=False,
+                cargo_temperature="room",
+                is_hazardous=False,
+                hazardous_detail="",
+            )
+            for _ in range(cargo_count)
+        ],
+    )
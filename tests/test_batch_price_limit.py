@@ -0,0 +1,16 @@
+import pytest
+
+from app.core.auth import TokenData
+from app.core.config import settings
+from app.core.exceptions import BadRequestException
+from app.service.cost import CostService
+
+
+@pytest.mark.parametrize("size", [0, settings.QUOTE_PRICE_BATCH_MAX_ITEMS + 1])
+async def test_calculate_batch_prices_rejects_size(size):
+    # 건수 검사는 DB를 쓰기 전에 끝나므로 작업 단위 없이 확인합니다.
+    service = CostService(None)
+    with pytest.raises(BadRequestException):
+        await service.calculate_batch_prices(
+            TokenData(user_id=1, role_id=1), [object()] * size
+        )
@@ -0,0 +1,56 @@
+import pytest
+
+from app.core.auth import TokenData
+from app.db.unit_of_work import UnitOfWork
+from app.service.quote import QuoteService
+
+from conftest import build_quote
+
+# 견적, 위치, 위치별 부가 서비스(+ 추가 서비스 정보 JOIN), 화물
+QUOTE_DETAIL_SELECT_COUNT = 4
+
+
+def count_selects(statements):
+    return sum(1 for statement in statements if statement.lstrip().upper().startswith("SELECT"))
+
+
+@pytest.fixture
+async def quotes(session_factory, reference_data):
+    async with session_factory() as session:
+        session.add_all(
+            [
+                build_quote("SMALL", cargo_count=1),
+                build_quote("LARGE", cargo_count=5, accessorial_ids=(1, 2)),
+            ]
+        )
+        await session.commit()
+
+
+@pytest.mark.parametrize("quote_id", ["SMALL", "LARGE"])
+async def test_repository_get_quote_by_id_select_count(
+    session_factory, quotes, sql_statements, quote_id
+):
+    async with session_factory() as session:
+        uow = UnitOfWork(session)
+        sql_statements.clear()
+        quote = await uow.quote.get_quote_by_id(quote_id)
+
+    assert quote is not None
+    # 화물과 부가 서비스 수와 무관하게 쿼리 수가 고정되어야 합니다. (N+1 없음)
+    assert count_selects(sql_statements) == QUOTE_DETAIL_SELECT_COUNT
+
+
+@pytest.mark.parametrize("quote_id, cargo_count", [("SMALL", 1), ("LARGE", 5)])
+async def test_service_get_quote_by_id_select_count(
+    session_factory, quotes, sql_statements, quote_id, cargo_count
+):
+    async with session_factory() as session:
+        sql_statements.clear()
+        quote = await QuoteService(UnitOfWork(session)).get_quote_by_id(
+            quote_id, TokenData(user_id=1, role_id=1)
+        )
+
+    assert len(quote.cargo) == cargo_count
+    assert count_selects(sql_statements) == QUOTE_DETAIL_SELECT_COUNT
+    # 응답 조립 중 지연 로딩으로 추가 쿼리가 나가지 않아야 합니다.
+    assert len(sql_statements) == QUOTE_DETAIL_SELECT_COUNT
@@ -0,0 +1,65 @@
+from datetime import datetime
+
+from sqlalchemy import update
+
+from app.core.auth import TokenData
+from app.db.unit_of_work import UnitOfWork
+from app.model.quote import Quote
+from app.service.quote import QuoteService
+
+from conftest import build_quote
+
+OWNER = TokenData(user_id=1, role_id=1)
+SAME_SECOND = datetime(2024, 10, 22, 10, 0, 0)
+
+
+async def run_in_same_second(session_factory, change):
+    """변경을 실행하고 updated_at을 같은 초로 맞춥니다. (MySQL DATETIME은 초 단위로 저장됩니다)"""
+    async with session_factory() as session:
+        uow = UnitOfWork(session)
+        async with uow:
+            await change(uow)
+            await session.execute(
+                update(Quote).where(Quote.id == "Q1").values(updated_at=SAME_SECOND)
+            )
+
+
+async def get_etags(session_factory, quote_id):
+    async with session_factory() as session:
+        service = QuoteService(UnitOfWork(session))
+        return (
+            await service.get_quote_etag(quote_id, OWNER),
+            await service.get_quotes_etag(OWNER.user_id),
+        )
+
+
+async def test_etag_changes_on_each_update_within_same_second(
+    session_factory, reference_data
+):
+    quote = build_quote("Q1")
+    quote.updated_at = SAME_SECOND
+    async with session_factory() as session:
+        session.add(quote)
+        await session.commit()
+
+    etags = [await get_etags(session_factory, "Q1")]
+    # 위치/화물만 바뀐 수정은 견적 컬럼 값이 같고, 같은 초에 일어나면 updated_at도 같습니다.
+    # 버전은 수정마다 올라가므로 ETag가 매번 달라져야 합니다.
+    for _ in range(2):
+        await run_in_same_second(
+            session_factory,
+            lambda uow: uow.quote.update_quote(
+                "Q1", OWNER.user_id, False, 1, 100, 33.75, 0, 33.75
+            ),
+        )
+        etags.append(await get_etags(session_factory, "Q1"))
+    await run_in_same_second(
+        session_factory,
+        lambda uow: uow.quote.submit_quote("Q1", OWNER.user_id, "primary"),
+    )
+    etags.append(await get_etags(session_factory, "Q1"))
+
+    detail_etags, list_etags = zip(*etags)
+    assert len(set(detail_etags)) == 4
+    assert len(set(list_etags)) == 4
+    assert etags[-1] == await get_etags(session_factory, "Q1")
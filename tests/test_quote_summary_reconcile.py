@@ -0,0 +1,47 @@
+from datetime import date
+from decimal import Decimal
+
+from app.model._enum import OrderStatusEnum
+from app.service.quote_summary import (
+    QuoteSummaryKey,
+    QuoteSummaryStore,
+    QuoteSummaryTotal,
+    build_reconcile_deltas,
+)
+
+WEEK = date(2024, 10, 21)
+ESTIMATE = QuoteSummaryKey(OrderStatusEnum.ESTIMATE, 1, WEEK)
+SUBMIT = QuoteSummaryKey(OrderStatusEnum.SUBMIT, 1, WEEK)
+ACCEPT = QuoteSummaryKey(OrderStatusEnum.ACCEPT, 1, WEEK)
+
+
+def test_build_reconcile_deltas_only_contains_differences():
+    current = {
+        ESTIMATE: QuoteSummaryTotal(3, Decimal("300")),
+        SUBMIT: QuoteSummaryTotal(1, Decimal("100")),
+    }
+    totals = {
+        ESTIMATE: QuoteSummaryTotal(3, Decimal("300")),
+        ACCEPT: QuoteSummaryTotal(2, Decimal("250")),
+    }
+
+    assert build_reconcile_deltas(current, totals) == {
+        SUBMIT: QuoteSummaryTotal(-1, Decimal("-100")),
+        ACCEPT: QuoteSummaryTotal(2, Decimal("250")),
+    }
+
+
+def test_reconcile_deltas_keep_concurrent_cache_deltas():
+    current = {ESTIMATE: QuoteSummaryTotal(2, Decimal("200"))}
+    totals = {ESTIMATE: QuoteSummaryTotal(3, Decimal("300"))}
+    store = QuoteSummaryStore(ttl_seconds=60)
+    store.replace(current)
+
+    # 재집계가 커밋되기 전후로 이 프로세스에서 반영된 증감분이 덮어써지지 않아야 합니다.
+    store.apply({SUBMIT: QuoteSummaryTotal(1, Decimal("50"))})
+    store.apply(build_reconcile_deltas(current, totals))
+
+    assert dict(store._totals) == {
+        ESTIMATE: QuoteSummaryTotal(3, Decimal("300")),
+        SUBMIT: QuoteSummaryTotal(1, Decimal("50")),
+    }
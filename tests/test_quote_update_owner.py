@@ -0,0 +1,90 @@
+from decimal import Decimal
+
+import pytest
+
+from app.core.exceptions import NotFoundException
+from app.db.unit_of_work import UnitOfWork
+from app.schema.cost import QuotePriceSchema
+from app.schema.quote.request import UpdateQuoteRequest
+from app.service.quote import QuoteService
+
+from conftest import build_quote
+
+
+async def test_update_quote_ignores_other_users_quote(
+    session_factory, reference_data, sql_statements
+):
+    async with session_factory() as session:
+        session.add(build_quote("Q1", user_id=1, cargo_count=2, accessorial_ids=(1,)))
+        await session.commit()
+
+    async with session_factory() as session:
+        quote = await UnitOfWork(session).quote.get_quote_by_id("Q1")
+        location = {
+            "state": "TX",
+            "county": "Dallas County",
+            "city": "Plano",
+            "zip_code": "75024",
+            "address": "2 Main St",
+            "location_type": "RESIDENTIAL",
+            "request_datetime": "2024-10-23T10:00:00",
+            "accessorials": [],
+        }
+        cargo = quote.quote_cargo[0]
+        request = UpdateQuoteRequest.model_validate(
+            {
+                "cargo_transportation_id": 2,
+                "is_priority": True,
+                "from_location": location,
+                "to_location": location,
+                "cargo": [
+                    {
+                        "id": cargo.id,
+                        "width": 1,
+                        "length": 1,
+                        "height": 1,
+                        "weight": 1,
+                        "quantity": 1,
+                        "package_description": "changed",
+                        "cargo_stackable": True,
+                        "cargo_temperature": "room",
+                        "is_hazardous": False,
+                        "hazardous_detail": "",
+                    }
+                ],
+            }
+        )
+    price = QuotePriceSchema(
+        total_weight=Decimal("1"),
+        base_price=Decimal("1"),
+        location_type_price=Decimal("0"),
+        service_price=Decimal("0"),
+        extra_price=Decimal("0"),
+        total_price=Decimal("1"),
+    )
+
+    # 사용자 2가 사용자 1의 견적 ID로 수정을 요청하면 견적뿐 아니라 위치/부가 서비스/화물도 바뀌지 않아야 합니다.
+    sql_statements.clear()
+    async with session_factory() as session:
+        with pytest.raises(NotFoundException):
+            await QuoteService(UnitOfWork(session)).update_quote(
+                "Q1", 2, request, price
+            )
+
+    assert not [
+        statement
+        for statement in sql_statements
+        if statement.lstrip().upper().startswith(("INSERT", "UPDATE QUOTE_", "DELETE"))
+    ]
+
+    async with session_factory() as session:
+        quote = await UnitOfWork(session).quote.get_quote_by_id("Q1")
+    assert quote.version == 1
+    assert quote.cargo_transportation_id == 1
+    assert {location.city for location in quote.quote_location} == {"Addison"}
+    assert all(
+        len(location.quote_location_accessorial) == 1
+        for location in quote.quote_location
+    )
+    assert len(quote.quote_cargo) == 2
+    assert {cargo.package_description for cargo in quote.quote_cargo} == {"box"}
@@ -0,0 +1,34 @@
+import threading
+from decimal import Decimal
+
+from app.db.unit_of_work import UnitOfWork
+from app.model.rate import RateArea, RateRegion
+from app.service.rate_import import import_rate_locations
+
+
+async def test_import_reads_csv_off_event_loop(session_factory):
+    async with session_factory() as session:
+        session.add(RateRegion(id=1, name="Texas", description="Texas"))
+        session.add(
+            RateArea(
+                id=1, region_id=1, name="A", min_load=Decimal("0"), max_load=Decimal("0")
+            )
+        )
+        await session.commit()
+
+    reader_threads = set()
+
+    def lines():
+        # 구역이 N/A인 행만 두어 upsert 없이 읽기/파싱 경로만 확인합니다.
+        for line in ["zip_code,city,state,county,area\r\n"] + [
+            f"{75000 + index},Addison,TX,Dallas County,N/A\r\n" for index in range(5)
+        ]:
+            reader_threads.add(threading.current_thread())
+            yield line
+
+    async with session_factory() as session:
+        result = await import_rate_locations(UnitOfWork(session), 1, lines())
+
+    assert result.rows_read == 5
+    assert result.rows_skipped == 5
+    assert threading.current_thread() not in reader_threads